@@ -1,13 +1,83 @@
+import os
 from decouple import config
 
 class Settings:
-    DATABASE_URL: str = "sqlite:///./mentor_mentee.db"
+    DATABASE_URL: str = config("DATABASE_URL", default="sqlite:///./mentor_mentee.db")
+    # 요청 처리 DB 경로: true 면 AsyncSession(aiosqlite), false 면 스레드풀의 동기 세션
+    DB_ASYNC: bool = config("DB_ASYNC", default=True, cast=bool)
+    # SQLite 연결 관리 (읽기 전용 연결 풀 + 단일 쓰기 연결)
+    DB_READ_POOL_SIZE: int = config("DB_READ_POOL_SIZE", default=os.cpu_count() or 1, cast=int)
+    DB_WRITE_TIMEOUT: int = config("DB_WRITE_TIMEOUT", default=30, cast=int)  # 쓰기 연결 대기 시간 (초)
+    SQLITE_BUSY_TIMEOUT_MS: int = config("SQLITE_BUSY_TIMEOUT_MS", default=5000, cast=int)  # 다른 프로세스의 잠금 대기
+    SQLITE_SYNCHRONOUS: str = config("SQLITE_SYNCHRONOUS", default="NORMAL")  # WAL 에서는 NORMAL 로도 손상 없음
+    SQLITE_CACHE_SIZE_KB: int = config("SQLITE_CACHE_SIZE_KB", default=20000, cast=int)  # 연결당 페이지 캐시
+    SQLITE_MMAP_SIZE: int = config("SQLITE_MMAP_SIZE", default=256 * 1024 * 1024, cast=int)
     SECRET_KEY: str = "your-secret-key-here-please-change-in-production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
+    IMAGE_DIR: str = config("IMAGE_DIR", default="images")  # 프로필 이미지 저장소 경로
+    # 비밀번호 해싱 (scrypt 비용: N = 2^LOG_N, 메모리 사용량 약 128 * N * R bytes)
+    PASSWORD_SCRYPT_LOG_N: int = config("PASSWORD_SCRYPT_LOG_N", default=14, cast=int)
+    PASSWORD_SCRYPT_R: int = config("PASSWORD_SCRYPT_R", default=8, cast=int)
+    PASSWORD_SCRYPT_P: int = config("PASSWORD_SCRYPT_P", default=1, cast=int)
+    PASSWORD_HASH_WORKERS: int = config("PASSWORD_HASH_WORKERS", default=os.cpu_count() or 1, cast=int)
+    PASSWORD_HASH_MAX_PENDING: int = config("PASSWORD_HASH_MAX_PENDING", default=64, cast=int)  # 대기 작업 수 제한
+    PASSWORD_HASH_RETRY_AFTER: int = config("PASSWORD_HASH_RETRY_AFTER", default=1, cast=int)  # 포화 시 Retry-After (초)
+    # 인증 Principal 캐시 (토큰 jti 기준)
+    PRINCIPAL_CACHE_SIZE: int = config("PRINCIPAL_CACHE_SIZE", default=10000, cast=int)
+    PRINCIPAL_CACHE_TTL: int = config("PRINCIPAL_CACHE_TTL", default=300, cast=int)  # 초
+    # 이미지 처리 프로세스 풀
+    IMAGE_POOL_WORKERS: int = config("IMAGE_POOL_WORKERS", default=2, cast=int)
+    IMAGE_POOL_MAX_PENDING: int = config("IMAGE_POOL_MAX_PENDING", default=8, cast=int)  # 대기 작업 수 제한
+    IMAGE_MAX_UPLOAD_BYTES: int = config("IMAGE_MAX_UPLOAD_BYTES", default=4 * 1024 * 1024, cast=int)  # 업로드 본문 크기 제한
+    IMAGE_POOL_RETRY_AFTER: int = config("IMAGE_POOL_RETRY_AFTER", default=2, cast=int)  # 포화 시 Retry-After (초)
+    # 로깅 (DEBUG 로그는 인증 등 매 요청 경로에서 출력되므로 기본값은 INFO)
+    LOG_LEVEL: str = config("LOG_LEVEL", default="INFO")
+    LOG_FORMAT: str = config("LOG_FORMAT", default="text")  # text | json
+    LOG_SLOW_REQUEST_MS: int = config("LOG_SLOW_REQUEST_MS", default=1000, cast=int)  # 이보다 느린 요청은 WARNING 로그
+    # 매칭 요청 알림 (SSE /api/events)
+    # memory: 프로세스 내 전달 (단일 워커), sqlite: events 테이블을 통해 여러 워커 프로세스가 공유
+    EVENTS_BACKEND: str = config("EVENTS_BACKEND", default="memory")
+    EVENTS_POLL_INTERVAL: float = config("EVENTS_POLL_INTERVAL", default=0.5, cast=float)  # sqlite 백엔드 조회 주기 (초)
+    EVENTS_RETENTION_SECONDS: int = config("EVENTS_RETENTION_SECONDS", default=300, cast=int)  # sqlite 백엔드 보관 기간
+    EVENTS_QUEUE_SIZE: int = config("EVENTS_QUEUE_SIZE", default=100, cast=int)  # 연결당 미전송 이벤트 수 제한
+    EVENTS_HEARTBEAT_SECONDS: int = config("EVENTS_HEARTBEAT_SECONDS", default=15, cast=int)  # 프록시 유휴 종료 방지
+    # 멘토 목록 응답 캐시 (다른 워커의 변경은 이벤트 버스 또는 TTL 로 반영)
+    MENTOR_CACHE_MAX_ENTRIES: int = config("MENTOR_CACHE_MAX_ENTRIES", default=512, cast=int)  # 0 이면 비활성화
+    MENTOR_CACHE_MAX_BYTES: int = config("MENTOR_CACHE_MAX_BYTES", default=64 * 1024 * 1024, cast=int)
+    MENTOR_CACHE_TTL: int = config("MENTOR_CACHE_TTL", default=30, cast=int)  # 초
+    # 요청 허용 제어 (라우트 분류별 동시 실행 제한, 대기 시간 초과 시 503 + Retry-After)
+    ADMISSION_ENABLED: bool = config("ADMISSION_ENABLED", default=True, cast=bool)
+    ADMISSION_AUTH_CONCURRENCY: int = config("ADMISSION_AUTH_CONCURRENCY", default=(os.cpu_count() or 1) * 2, cast=int)  # 로그인/회원가입
+    ADMISSION_DIRECTORY_CONCURRENCY: int = config("ADMISSION_DIRECTORY_CONCURRENCY", default=32, cast=int)  # 멘토 목록/검색/추천
+    ADMISSION_DEFAULT_CONCURRENCY: int = config("ADMISSION_DEFAULT_CONCURRENCY", default=64, cast=int)  # 그 외 API
+    ADMISSION_MAX_QUEUE: int = config("ADMISSION_MAX_QUEUE", default=128, cast=int)  # 분류별 대기 요청 수 제한
+    ADMISSION_MAX_QUEUE_MS: int = config("ADMISSION_MAX_QUEUE_MS", default=500, cast=int)  # 대기 시간 상한
+    ADMISSION_RETRY_AFTER: int = config("ADMISSION_RETRY_AFTER", default=1, cast=int)  # 거부 시 Retry-After (초)
+    # 속도 제한 (토큰 버킷, 초과 시 429 + Retry-After, 초당 요청 수 0 이면 비활성화)
+    RATE_LIMIT_IP_PER_SECOND: float = config("RATE_LIMIT_IP_PER_SECOND", default=50.0, cast=float)
+    RATE_LIMIT_IP_BURST: int = config("RATE_LIMIT_IP_BURST", default=100, cast=int)
+    RATE_LIMIT_USER_PER_SECOND: float = config("RATE_LIMIT_USER_PER_SECOND", default=20.0, cast=float)
+    RATE_LIMIT_USER_BURST: int = config("RATE_LIMIT_USER_BURST", default=40, cast=int)
+    RATE_LIMIT_MAX_KEYS: int = config("RATE_LIMIT_MAX_KEYS", default=100000, cast=int)  # 추적하는 IP/사용자 수 제한
+    # 응답 압축 (Accept-Encoding 협상, brotli 패키지가 설치되어 있으면 br 우선)
+    COMPRESSION_ENABLED: bool = config("COMPRESSION_ENABLED", default=True, cast=bool)
+    COMPRESSION_MIN_SIZE: int = config("COMPRESSION_MIN_SIZE", default=1024, cast=int)  # 이보다 작은 응답은 압축하지 않음
+    COMPRESSION_GZIP_LEVEL: int = config("COMPRESSION_GZIP_LEVEL", default=6, cast=int)
+    COMPRESSION_BROTLI_QUALITY: int = config("COMPRESSION_BROTLI_QUALITY", default=4, cast=int)  # 동적 응답용 (0~11)
+    # 관리자 API (X-Admin-Key 헤더, 비어 있으면 관리자 API 비활성화)
+    ADMIN_API_KEY: str = config("ADMIN_API_KEY", default="")
+    # 사용자 대량 가져오기
+    IMPORT_BATCH_SIZE: int = config("IMPORT_BATCH_SIZE", default=2000, cast=int)  # 트랜잭션당 행 수
+    IMPORT_HASH_WORKERS: int = config("IMPORT_HASH_WORKERS", default=os.cpu_count() or 1, cast=int)
+    IMPORT_MAX_UPLOAD_BYTES: int = config("IMPORT_MAX_UPLOAD_BYTES", default=512 * 1024 * 1024, cast=int)
+    # 운영 서버 (python manage.py serve)
+    SERVER_HOST: str = config("SERVER_HOST", default="0.0.0.0")
+    SERVER_PORT: int = config("SERVER_PORT", default=8080, cast=int)
+    SERVER_WORKERS: int = config("SERVER_WORKERS", default=os.cpu_count() or 1, cast=int)
+    # 종료 시 처리 중인 요청을 기다리는 최대 시간 (초, SSE 연결은 끝나지 않으므로 이후 강제 종료)
+    SERVER_GRACEFUL_TIMEOUT: int = config("SERVER_GRACEFUL_TIMEOUT", default=10, cast=int)
+    # /metrics 엔드포인트 (Prometheus 텍스트 형식)
+    METRICS_ENABLED: bool = config("METRICS_ENABLED", default=True, cast=bool)
 
 settings = Settings()
-
-# 설정값 확인
-print(f"🔧 [SETTINGS] SECRET_KEY: {settings.SECRET_KEY[:20]}...")
-print(f"🔧 [SETTINGS] ALGORITHM: {settings.ALGORITHM}")
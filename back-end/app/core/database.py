@@ -1,23 +1,242 @@
-from sqlalchemy import create_engine
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Union
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from .config import settings
+from .metrics import instrument_engine
 
-# SQLite 엔진 생성
-engine = create_engine(
-    settings.DATABASE_URL, 
-    connect_args={"check_same_thread": False}  # Only for SQLite
-)
+def _is_sqlite_file(url: str) -> bool:
+    """파일 기반 SQLite 인지 확인 (인메모리 DB 는 연결 간에 데이터가 공유되지 않음)"""
+    parsed = make_url(url)
+    database = parsed.database or ""
+    return (
+        parsed.get_backend_name() == "sqlite"
+        and database not in ("", ":memory:")
+        and not database.startswith("file::memory:")
+    )
+
+def _configure_sqlite(engine: Engine, read_only: bool) -> None:
+    """연결마다 WAL/pragma 적용 및 트랜잭션 시작 방식 지정"""
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        # 드라이버의 암묵적 BEGIN 대신 아래 begin 이벤트에서 직접 트랜잭션 시작
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute(f"PRAGMA busy_timeout = {settings.SQLITE_BUSY_TIMEOUT_MS}")
+            if not read_only:
+                cursor.execute("PRAGMA journal_mode = WAL")
+            cursor.execute(f"PRAGMA synchronous = {settings.SQLITE_SYNCHRONOUS}")
+            cursor.execute(f"PRAGMA cache_size = -{settings.SQLITE_CACHE_SIZE_KB}")
+            cursor.execute(f"PRAGMA mmap_size = {settings.SQLITE_MMAP_SIZE}")
+            cursor.execute("PRAGMA foreign_keys = ON")
+            if read_only:
+                cursor.execute("PRAGMA query_only = ON")
+        finally:
+            cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def _on_begin(conn):
+        # 쓰기 연결은 시작 시점에 쓰기 잠금을 잡아 다른 프로세스와의 잠금 승격 충돌(SQLITE_BUSY) 방지
+        conn.exec_driver_sql("BEGIN" if read_only else "BEGIN IMMEDIATE")
+
+def _engine_options(read_only: bool) -> dict:
+    """파일 기반 SQLite 는 쓰기 연결 1개 + 읽기 연결 풀로 구성"""
+    if read_only:
+        return {"pool_size": settings.DB_READ_POOL_SIZE, "max_overflow": 0}
+    # 쓰기는 단일 연결을 순서대로 사용 (연결 풀이 대기열 역할)
+    return {"pool_size": 1, "max_overflow": 0, "pool_timeout": settings.DB_WRITE_TIMEOUT}
+
+def _create_engines(read_only: bool):
+    """동기/비동기 엔진 쌍 생성 (쿼리 지표 수집 포함)"""
+    label = "reader" if read_only else "writer"
+    if not _is_sqlite_file(settings.DATABASE_URL):
+        sync_engine = create_engine(
+            settings.DATABASE_URL,
+            connect_args={"check_same_thread": False}  # Only for SQLite
+        )
+        async_engine = create_async_engine(_async_database_url(settings.DATABASE_URL))
+        instrument_engine(sync_engine, label)
+        instrument_engine(async_engine.sync_engine, label)
+        return sync_engine, async_engine
+
+    options = _engine_options(read_only)
+    sync_engine = create_engine(
+        settings.DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        poolclass=QueuePool,
+        **options
+    )
+    # aiosqlite 의 기본값은 NullPool 이므로 풀 클래스를 명시
+    async_engine = create_async_engine(
+        _async_database_url(settings.DATABASE_URL), poolclass=AsyncAdaptedQueuePool, **options
+    )
+    for target in (sync_engine, async_engine.sync_engine):
+        _configure_sqlite(target, read_only)
+        instrument_engine(target, label)
+    return sync_engine, async_engine
+
+def _async_database_url(url: str) -> str:
+    """동기 드라이버 URL 을 비동기 드라이버 URL 로 변환 (sqlite -> sqlite+aiosqlite)"""
+    if url.startswith("sqlite:"):
+        return "sqlite+aiosqlite:" + url[len("sqlite:"):]
+    return url
+
+# 쓰기 엔진 (마이그레이션 및 데이터 변경 요청에 사용)
+engine, async_engine = _create_engines(read_only=False)
+
+# 읽기 전용 엔진 (WAL 덕분에 쓰기와 동시에 여러 연결에서 조회 가능)
+if _is_sqlite_file(settings.DATABASE_URL):
+    read_engine, async_read_engine = _create_engines(read_only=True)
+else:
+    read_engine, async_read_engine = engine, async_engine
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 # 모든 모델이 상속받을 기본 클래스
 Base = declarative_base()
 
-def get_db():
-    """데이터베이스 세션 의존성"""
-    db = SessionLocal()
-    try:
+# 비동기 세션 (DB_ASYNC=true 일 때 요청 처리에 사용)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+AsyncReadSessionLocal = async_sessionmaker(
+    bind=async_read_engine, autoflush=False, expire_on_commit=False
+)
+
+# 동기 모드 요청 처리용 세션 (커밋 후 속성 접근이 이벤트 루프에서 DB 를 조회하지 않도록 만료하지 않음)
+_RequestSessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
+_ReadSessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=read_engine
+)
+
+class _ThreadpoolResult:
+    """동기 Result 를 스레드풀에서 조금씩 읽어오는 비동기 반복자 (yield_per 와 함께 사용)"""
+
+    def __init__(self, result):
+        self._partitions = result.partitions()
+        self._rows = iter(())
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while True:
+            row = next(self._rows, None)
+            if row is not None:
+                return row
+            partition = await run_in_threadpool(next, self._partitions, None)
+            if partition is None:
+                raise StopAsyncIteration
+            self._rows = iter(partition)
+
+class SyncSessionAdapter:
+    """동기 Session 을 AsyncSession 과 같은 인터페이스로 감싼 어댑터
+
+    DB_ASYNC=false 일 때 사용된다. 라우터는 항상 AsyncSession 스타일(await db.execute(...))
+    로 작성하고, 실제 DB 작업은 스레드풀에서 동기 드라이버로 실행된다.
+    """
+
+    def __init__(self, session: Session):
+        self.sync_session = session
+
+    def add(self, instance: Any) -> None:
+        self.sync_session.add(instance)
+
+    def add_all(self, instances) -> None:
+        self.sync_session.add_all(instances)
+
+    async def execute(self, statement, params=None, **kwargs):
+        return await run_in_threadpool(self.sync_session.execute, statement, params, **kwargs)
+
+    async def scalar(self, statement, params=None, **kwargs):
+        return await run_in_threadpool(self.sync_session.scalar, statement, params, **kwargs)
+
+    async def scalars(self, statement, params=None, **kwargs):
+        return await run_in_threadpool(self.sync_session.scalars, statement, params, **kwargs)
+
+    async def get(self, entity, ident, **kwargs):
+        return await run_in_threadpool(self.sync_session.get, entity, ident, **kwargs)
+
+    async def stream(self, statement, params=None, **kwargs):
+        result = await run_in_threadpool(self.sync_session.execute, statement, params, **kwargs)
+        return _ThreadpoolResult(result)
+
+    async def run_sync(self, fn: Callable, *args, **kwargs):
+        return await run_in_threadpool(fn, self.sync_session, *args, **kwargs)
+
+    async def flush(self) -> None:
+        await run_in_threadpool(self.sync_session.flush)
+
+    async def commit(self) -> None:
+        await run_in_threadpool(self.sync_session.commit)
+
+    async def rollback(self) -> None:
+        await run_in_threadpool(self.sync_session.rollback)
+
+    async def refresh(self, instance: Any) -> None:
+        await run_in_threadpool(self.sync_session.refresh, instance)
+
+    async def close(self) -> None:
+        await run_in_threadpool(self.sync_session.close)
+
+# 라우터에서 사용하는 세션 타입 (설정에 따라 둘 중 하나)
+DbSession = Union[AsyncSession, SyncSessionAdapter]
+
+@asynccontextmanager
+async def open_session(read_only: bool = False) -> AsyncIterator[DbSession]:
+    """설정(DB_ASYNC)에 따라 비동기 세션 또는 동기 세션 어댑터 열기
+
+    read_only=True 면 읽기 전용 연결 풀을, 아니면 단일 쓰기 연결을 사용한다.
+    """
+    if settings.DB_ASYNC:
+        factory = AsyncReadSessionLocal if read_only else AsyncSessionLocal
+        async with factory() as session:
+            yield session
+    else:
+        factory = _ReadSessionLocal if read_only else _RequestSessionLocal
+        session = SyncSessionAdapter(factory())
+        try:
+            yield session
+        finally:
+            await session.close()
+
+def pool_stats():
+    """연결 풀 사용 현황 (/metrics 용)"""
+    engines = {("writer", "sync"): engine, ("writer", "async"): async_engine.sync_engine}
+    if read_engine is not engine:
+        engines[("reader", "sync")] = read_engine
+        engines[("reader", "async")] = async_read_engine.sync_engine
+    return {
+        key: {"checked_out": target.pool.checkedout(), "size": target.pool.size()}
+        for key, target in engines.items()
+        if hasattr(target.pool, "checkedout")
+    }
+
+async def dispose_engines() -> None:
+    """풀에 남은 연결 닫기 (aiosqlite 연결 스레드가 프로세스 종료를 막지 않도록 앱 종료 시 호출)"""
+    await async_engine.dispose()
+    if async_read_engine is not async_engine:
+        await async_read_engine.dispose()
+    engine.dispose()
+    if read_engine is not engine:
+        read_engine.dispose()
+
+async def get_db() -> AsyncIterator[DbSession]:
+    """데이터베이스 세션 의존성 (쓰기용)"""
+    async with open_session() as db:
+        yield db
+
+async def get_read_db() -> AsyncIterator[DbSession]:
+    """읽기 전용 데이터베이스 세션 의존성 (조회 전용 엔드포인트용)"""
+    async with open_session(read_only=True) as db:
         yield db
-    finally:
-        db.close()
@@ -1,66 +1,150 @@
-from fastapi import Depends, HTTPException, status
+import hmac
+import logging
+from typing import Optional
+
+from fastapi import Depends, Header, HTTPException, Query, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
-from app.core.database import get_db
+from sqlalchemy import select
+from app.core.config import settings
+from app.core.database import DbSession, get_db, get_read_db, open_session
 from app.utils.auth import verify_token
-from app.models.user import User
+from app.models.user import User, UserRole
+from app.services.admission import Rejected, admission_controller
+from app.services.principal_cache import Principal, principal_cache
 
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
+logger = logging.getLogger(__name__)
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> User:
-    """현재 인증된 사용자 정보를 반환"""
-    token = credentials.credentials
-    print(f"🔍 [AUTH] 받은 토큰: {token}")
-    
-    payload = verify_token(token)
-    print(f"🔍 [AUTH] 토큰 검증 결과: {payload}")
-    
-    if payload is None:
-        print("❌ [AUTH] 토큰 검증 실패")
+def _credentials_exception(detail: str = "Invalid authentication credentials") -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+def _check_rate_limit(principal: Principal) -> Principal:
+    """사용자별 속도 제한 (초과 시 429 + Retry-After)"""
+    try:
+        admission_controller.check_user(principal.id)
+    except Rejected as e:
         raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authentication credentials",
-            headers={"WWW-Authenticate": "Bearer"},
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests, please retry later",
+            headers={"Retry-After": str(e.retry_after)},
         )
-    
-    user_id: int = int(payload.get("sub"))
-    print(f"🔍 [AUTH] 사용자 ID: {user_id}")
-    
+    return principal
+
+async def _authenticate(token: str, db: DbSession) -> Principal:
+    """토큰 검증 후 Principal 반환 (캐시 적중 시 토큰 검증/DB 조회 생략)"""
+    principal = principal_cache.lookup(token)
+    if principal is not None:
+        return principal
+    return await _verify_and_load(token, db)
+
+async def _verify_and_load(token: str, db: DbSession) -> Principal:
+    """캐시에 없는 토큰 검증 후 사용자 조회, 결과를 캐시에 저장"""
+    payload = verify_token(token)
+    if payload is None:
+        logger.debug("❌ [AUTH] 토큰 검증 실패")
+        raise _credentials_exception()
+
+    try:
+        user_id = int(payload.get("sub"))
+    except (TypeError, ValueError):
+        user_id = None
     if user_id is None:
-        print("❌ [AUTH] 사용자 ID가 없음")
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authentication credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
-    user = db.query(User).filter(User.id == user_id).first()
+        logger.debug("❌ [AUTH] 토큰에 사용자 ID가 없음")
+        raise _credentials_exception()
+
+    # 이미지 등 큰 컬럼 없이 인증에 필요한 컬럼만 조회
+    result = await db.execute(
+        select(User.id, User.email, User.name, User.role).where(User.id == user_id)
+    )
+    user = result.first()
     if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
+        raise _credentials_exception("User not found")
+
+    principal = Principal(id=user.id, email=user.email, name=user.name, role=user.role)
+    principal_cache.store(token, payload, principal)
+    return principal
+
+async def get_current_principal(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: DbSession = Depends(get_read_db)
+) -> Principal:
+    """현재 인증된 사용자의 경량 정보 반환 (사용자별 속도 제한 적용)"""
+    return _check_rate_limit(await _authenticate(credentials.credentials, db))
+
+async def get_stream_principal(
+    token: Optional[str] = Query(None, description="JWT (EventSource 처럼 헤더를 보낼 수 없는 클라이언트용)"),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security)
+) -> Principal:
+    """장시간 연결(SSE)용 인증: Authorization 헤더 또는 ?token= 허용
+
+    응답 스트리밍 동안 읽기 연결을 점유하지 않도록 검증에 필요한 동안만 세션을 연다.
+    """
+    raw_token = credentials.credentials if credentials else token
+    if not raw_token:
+        raise _credentials_exception("Not authenticated")
+    principal = principal_cache.lookup(raw_token)
+    if principal is None:
+        async with open_session(read_only=True) as db:
+            principal = await _verify_and_load(raw_token, db)
+    return _check_rate_limit(principal)
+
+async def _load_user(principal: Principal, db: DbSession) -> User:
+    user = await db.get(User, principal.id)
+    if user is None:
+        principal_cache.invalidate_user(principal.id)
+        raise _credentials_exception("User not found")
+    return user
+
+async def get_current_user(
+    principal: Principal = Depends(get_current_principal),
+    db: DbSession = Depends(get_db)
+) -> User:
+    """현재 인증된 사용자 정보를 반환 (프로필 수정 등 전체 행을 변경하는 경우)"""
+    user = await _load_user(principal, db)
+
+    # 조회용 트랜잭션을 끝내 단일 쓰기 연결을 점유하지 않도록 함 (커밋 후에도 속성은 유지됨)
+    await db.commit()
     return user
 
-def get_current_mentor(current_user: User = Depends(get_current_user)) -> User:
+async def get_current_user_readonly(
+    principal: Principal = Depends(get_current_principal),
+    db: DbSession = Depends(get_read_db)
+) -> User:
+    """현재 인증된 사용자 정보를 읽기 전용 연결로 반환 (프로필 조회 등)"""
+    return await _load_user(principal, db)
+
+async def get_current_mentor(principal: Principal = Depends(get_current_principal)) -> Principal:
     """현재 사용자가 멘토인지 확인"""
-    if current_user.role.value != "mentor":
+    if principal.role != UserRole.MENTOR:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Access forbidden: mentor role required"
         )
-    return current_user
+    return principal
 
-def get_current_mentee(current_user: User = Depends(get_current_user)) -> User:
+async def get_current_mentee(principal: Principal = Depends(get_current_principal)) -> Principal:
     """현재 사용자가 멘티인지 확인"""
-    if current_user.role.value != "mentee":
+    if principal.role != UserRole.MENTEE:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Access forbidden: mentee role required"
         )
-    return current_user
+    return principal
+
+async def require_admin_key(x_admin_key: Optional[str] = Header(None)) -> None:
+    """관리자 API 키 확인 (ADMIN_API_KEY 가 설정되지 않으면 관리자 API 비활성화)"""
+    if not settings.ADMIN_API_KEY:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Not Found"
+        )
+    if not x_admin_key or not hmac.compare_digest(x_admin_key, settings.ADMIN_API_KEY):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Invalid admin key"
+        )
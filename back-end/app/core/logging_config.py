@@ -0,0 +1,52 @@
+import json
+import logging
+import sys
+
+from app.core.config import settings
+
+# 앱 로거 이름 (모듈에서는 logging.getLogger(__name__) 사용)
+APP_LOGGER = "app"
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄 JSON 로그 (로그 수집기에서 필드 단위로 검색 가능)
+
+    logger.info("...", extra={"fields": {...}}) 로 전달한 값은 최상위 키로 기록된다.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        entry.update(getattr(record, "fields", {}))
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """사람이 읽는 형식 (fields 는 key=value 로 뒤에 붙임)"""
+
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)s %(name)s %(message)s")
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = super().format(record)
+        fields = getattr(record, "fields", None)
+        if fields:
+            message += " " + " ".join(f"{key}={value}" for key, value in fields.items())
+        return message
+
+
+def setup_logging() -> None:
+    """app.* 로거 설정 (LOG_LEVEL, LOG_FORMAT)"""
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(JsonFormatter() if settings.LOG_FORMAT == "json" else TextFormatter())
+
+    logger = logging.getLogger(APP_LOGGER)
+    logger.handlers[:] = [handler]
+    logger.setLevel(settings.LOG_LEVEL.upper())
+    logger.propagate = False
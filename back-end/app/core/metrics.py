@@ -0,0 +1,240 @@
+import bisect
+import threading
+import time
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# 응답 시간 히스토그램 구간 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# 요청당 쿼리 수 히스토그램 구간
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}"]
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help_text, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, labels: LabelValues = (), amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return self.header() + [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in items
+        ]
+
+
+class Gauge(Counter):
+    """현재 값 (증가/감소 가능)"""
+    kind = "gauge"
+
+    def dec(self, labels: LabelValues = (), amount: float = 1) -> None:
+        self.inc(labels, -amount)
+
+
+class Histogram(_Metric):
+    """누적 구간 히스토그램 (Prometheus histogram 형식)"""
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(buckets)
+        # 레이블 -> [구간별 개수..., 합계, 개수]
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, labels: LabelValues, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(labels)
+            if state is None:
+                state = self._values[labels] = [0] * (len(self.buckets) + 2)
+            if index < len(self.buckets):
+                state[index] += 1
+            state[-2] += value
+            state[-1] += 1
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = [(labels, list(state)) for labels, state in self._values.items()]
+        lines = self.header()
+        for labels, state in items:
+            cumulative = 0
+            bounds = self.buckets + (float("inf"),)
+            # 마지막 구간(+Inf)은 전체 개수
+            counts = state[:len(self.buckets)] + [state[-1] - sum(state[:len(self.buckets)])]
+            for bound, count in zip(bounds, counts):
+                cumulative += count
+                bucket_labels = _format_labels(
+                    self.labelnames + ("le",), labels + (_format_value(bound),)
+                )
+                lines.append(f"{self.name}_bucket{bucket_labels} {_format_value(cumulative)}")
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(state[-2])}")
+            lines.append(f"{self.name}_count{label_text} {_format_value(state[-1])}")
+        return lines
+
+
+# 수집 시점에 값을 읽어오는 지표: (이름, 설명, 타입, [(레이블 dict, 값)])
+CollectorResult = Iterable[Tuple[str, str, str, List[Tuple[Dict[str, str], float]]]]
+
+
+class MetricsRegistry:
+    """프로세스 내 지표 저장소 (워커 프로세스별로 따로 집계됨)"""
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._collectors: List[Callable[[], CollectorResult]] = []
+
+    def counter(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help_text, labelnames))
+
+    def gauge(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, help_text, labelnames))
+
+    def histogram(self, name: str, help_text: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, help_text, labelnames, buckets))
+
+    def register_collector(self, collector: Callable[[], CollectorResult]) -> None:
+        """풀/캐시 통계처럼 다른 모듈이 가진 값을 수집 시점에 읽어오는 함수 등록"""
+        self._collectors.append(collector)
+
+    def _register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식 (text/plain; version=0.0.4)"""
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for collector in self._collectors:
+            for name, help_text, kind, samples in collector():
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+                for labels, value in samples:
+                    lines.append(
+                        f"{name}{_format_labels(tuple(labels), tuple(labels.values()))} {_format_value(value)}"
+                    )
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+# HTTP 요청 지표 (route 레이블은 경로 템플릿, 예: /api/match-requests/{request_id}/accept)
+http_requests_total = registry.counter(
+    "http_requests_total", "HTTP requests by route and status code", ("method", "route", "status")
+)
+http_request_duration_seconds = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency", ("method", "route")
+)
+http_requests_in_flight = registry.gauge(
+    "http_requests_in_flight", "HTTP requests currently being processed"
+)
+http_compressed_responses_total = registry.counter(
+    "http_compressed_responses_total", "HTTP responses compressed by content encoding", ("encoding",)
+)
+http_compression_bytes_total = registry.counter(
+    "http_compression_bytes_total", "Response body bytes before and after compression", ("encoding", "stage")
+)
+
+# DB 쿼리 지표
+db_queries_total = registry.counter("db_queries_total", "SQL statements executed", ("engine",))
+db_query_duration_seconds = registry.histogram(
+    "db_query_duration_seconds", "SQL statement execution time", ("engine",)
+)
+db_queries_per_request = registry.histogram(
+    "db_queries_per_request", "SQL statements executed per HTTP request", ("method", "route"),
+    buckets=QUERY_COUNT_BUCKETS,
+)
+db_time_per_request_seconds = registry.histogram(
+    "db_time_per_request_seconds", "Total SQL execution time per HTTP request", ("method", "route")
+)
+
+
+class RequestDbStats:
+    """요청 하나에서 실행된 쿼리 수/시간"""
+    __slots__ = ("queries", "seconds")
+
+    def __init__(self):
+        self.queries = 0
+        self.seconds = 0.0
+
+
+# 현재 요청의 쿼리 통계 (미들웨어가 설정, 스레드풀 실행 시에도 컨텍스트가 전달됨)
+current_request_db_stats: ContextVar[Optional[RequestDbStats]] = ContextVar(
+    "current_request_db_stats", default=None
+)
+
+
+def instrument_engine(engine: Engine, label: str) -> None:
+    """엔진에 쿼리 수/시간 측정 이벤트 등록 (비동기 엔진은 sync_engine 전달)"""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_started_at"].pop()
+        db_queries_total.inc((label,))
+        db_query_duration_seconds.observe((label,), elapsed)
+        stats = current_request_db_stats.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.seconds += elapsed
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(exception_context):
+        # 실패한 쿼리는 after_cursor_execute 가 호출되지 않으므로 시작 시각 정리
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("query_started_at"):
+            conn.info["query_started_at"].pop()
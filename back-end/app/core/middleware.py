@@ -0,0 +1,253 @@
+import logging
+import time
+import zlib
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
+
+from app.core.config import settings
+from app.core.metrics import (
+    RequestDbStats, current_request_db_stats, db_queries_per_request, db_time_per_request_seconds,
+    http_compressed_responses_total, http_compression_bytes_total,
+    http_request_duration_seconds, http_requests_in_flight, http_requests_total,
+)
+from app.services.admission import Rejected, admission_controller, classify
+
+try:
+    import brotli  # 선택 의존성: 설치되어 있으면 br 인코딩 지원
+except ImportError:
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# 라우트에 매칭되지 않은 요청 (경로를 그대로 레이블로 쓰면 지표 개수가 무한히 늘어남)
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def _route_template(scope) -> str:
+    """라우팅 후 scope 에 기록된 라우트의 경로 템플릿"""
+    route = scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+_REJECTED_DETAIL = {
+    503: "Server is busy, please retry later",
+    429: "Too many requests, please retry later",
+}
+
+
+class AdmissionMiddleware:
+    """요청 허용 제어 (클라이언트 IP 별 속도 제한 + 라우트 분류별 동시 실행 제한)
+
+    스레드풀/DB 연결 대기열에 요청이 무한정 쌓이지 않도록 라우팅 전에 거부한다.
+    인증된 사용자별 속도 제한은 Principal 을 확인하는 의존성에서 적용한다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        route_class = classify(scope["path"]) if scope["type"] == "http" else None
+        if route_class is None:
+            await self.app(scope, receive, send)
+            return
+
+        limit = admission_controller.limits[route_class]
+        try:
+            client = scope.get("client")
+            if client:
+                admission_controller.ip_limiter.check(client[0])
+            await limit.acquire()
+        except Rejected as e:
+            logger.debug("🚦 [ADMISSION] 요청 거부: %s %s (%s)", route_class, scope["path"], e.reason)
+            response = JSONResponse(
+                status_code=e.status_code,
+                content={"detail": _REJECTED_DETAIL[e.status_code]},
+                headers={"Retry-After": str(e.retry_after)},
+            )
+            await response(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limit.release()
+
+
+class MetricsMiddleware:
+    """라우트별 응답 시간/상태 코드/쿼리 수 측정 (순수 ASGI 미들웨어, 스트리밍 응답도 끝까지 측정)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        event_stream = False
+        db_stats = RequestDbStats()
+        token = current_request_db_stats.set(db_stats)
+
+        async def send_wrapper(message):
+            nonlocal status_code, event_stream
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                event_stream = any(
+                    name == b"content-type" and value.startswith(b"text/event-stream")
+                    for name, value in message.get("headers", ())
+                )
+            await send(message)
+
+        http_requests_in_flight.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            http_requests_in_flight.dec()
+            current_request_db_stats.reset(token)
+
+            method = scope["method"]
+            route = _route_template(scope)
+            http_requests_total.inc((method, route, str(status_code)))
+            db_queries_per_request.observe((method, route), db_stats.queries)
+            db_time_per_request_seconds.observe((method, route), db_stats.seconds)
+            # SSE 는 연결 유지 시간이 곧 응답 시간이므로 지연시간 지표/느린 요청 로그에서 제외
+            if not event_stream:
+                http_request_duration_seconds.observe((method, route), elapsed)
+                if elapsed * 1000 >= settings.LOG_SLOW_REQUEST_MS:
+                    logger.warning("🐢 [HTTP] 느린 요청", extra={"fields": {
+                        "method": method, "route": route, "status": status_code,
+                        "duration_ms": round(elapsed * 1000, 1), "db_queries": db_stats.queries,
+                        "db_ms": round(db_stats.seconds * 1000, 1),
+                    }})
+
+
+# 압축하지 않는 응답 (이미 압축된 이미지, 이벤트가 바로 전달되어야 하는 SSE)
+_UNCOMPRESSED_CONTENT_TYPES = ("text/event-stream", "image/")
+
+
+def _negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """Accept-Encoding 의 q 값에 따라 사용할 인코딩 선택 (같으면 br 우선, 없으면 None)"""
+    qualities = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        qualities[name.strip().lower()] = quality
+
+    wildcard = qualities.get("*", 0.0)
+    best, best_quality = None, 0.0
+    for encoding in (("br", "gzip") if brotli is not None else ("gzip",)):
+        quality = qualities.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+class _Compressor:
+    """gzip/brotli 스트림 압축기"""
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=settings.COMPRESSION_BROTLI_QUALITY)
+            self._compress = self._compressor.process
+        else:
+            # wbits=31: gzip 헤더/트레일러 포함
+            self._compressor = zlib.compressobj(settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 31)
+            self._compress = self._compressor.compress
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compress(data) if data else b""
+
+    def finish(self) -> bytes:
+        return self._compressor.finish() if self.encoding == "br" else self._compressor.flush()
+
+
+class CompressionMiddleware:
+    """Accept-Encoding 협상으로 응답 본문을 br/gzip 압축 (순수 ASGI 미들웨어)
+
+    COMPRESSION_MIN_SIZE 보다 작은 응답, 이미 인코딩된 응답, 이미지/SSE 는 그대로 보낸다.
+    NDJSON 스트리밍처럼 크기를 미리 알 수 없는 응답은 청크 단위로 이어서 압축한다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        encoding = None
+        if scope["type"] == "http":
+            encoding = _negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        compressor: Optional[_Compressor] = None
+        passthrough = False
+        bytes_in = bytes_out = 0
+
+        async def send_wrapper(message):
+            nonlocal start_message, compressor, passthrough, bytes_in, bytes_out
+            message_type = message["type"]
+            if message_type == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                passthrough = (
+                    "content-encoding" in headers
+                    or message["status"] in (204, 304)
+                    or headers.get("content-type", "").startswith(_UNCOMPRESSED_CONTENT_TYPES)
+                )
+                if passthrough:
+                    await send(message)
+                else:
+                    # 본문 크기를 보고 압축 여부를 정할 때까지 헤더 전송을 미룸
+                    MutableHeaders(raw=message["headers"]).add_vary_header("Accept-Encoding")
+                    start_message = message
+                return
+            if message_type != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if start_message is not None:
+                initial, start_message = start_message, None
+                if not more_body and len(body) < settings.COMPRESSION_MIN_SIZE:
+                    passthrough = True
+                    await send(initial)
+                    await send(message)
+                    return
+                compressor = _Compressor(encoding)
+                headers = MutableHeaders(raw=initial["headers"])
+                headers["Content-Encoding"] = encoding
+                http_compressed_responses_total.inc((encoding,))
+                if not more_body:
+                    compressed = compressor.compress(body) + compressor.finish()
+                    headers["Content-Length"] = str(len(compressed))
+                    http_compression_bytes_total.inc((encoding, "in"), len(body))
+                    http_compression_bytes_total.inc((encoding, "out"), len(compressed))
+                    await send(initial)
+                    await send({"type": "http.response.body", "body": compressed})
+                    return
+                del headers["Content-Length"]
+                await send(initial)
+
+            compressed = compressor.compress(body)
+            if not more_body:
+                compressed += compressor.finish()
+            bytes_in += len(body)
+            bytes_out += len(compressed)
+            if not more_body:
+                http_compression_bytes_total.inc((encoding, "in"), bytes_in)
+                http_compression_bytes_total.inc((encoding, "out"), bytes_out)
+            await send({"type": "http.response.body", "body": compressed, "more_body": more_body})
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,177 @@
+import logging
+import os
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.core.database import Base, SessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+def _add_missing_columns(engine: Engine) -> None:
+    """기존 테이블에 모델에 새로 추가된 컬럼 추가 (nullable 컬럼만 지원)"""
+    # 쓰기 연결이 하나뿐이므로 같은 연결로 스키마 조회
+    with engine.begin() as conn:
+        inspector = inspect(conn)
+        existing_tables = set(inspector.get_table_names())
+        for table in Base.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing_columns = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing_columns:
+                    continue
+                column_type = column.type.compile(dialect=engine.dialect)
+                conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN "{column.name}" {column_type}'))
+                logger.info("🔧 [MIGRATE] 컬럼 추가: %s.%s", table.name, column.name)
+
+
+def _rebuild_events_autoincrement(engine: Engine) -> None:
+    """AUTOINCREMENT 없이 만들어진 기존 events 테이블 재생성 (id 재사용 방지, 기존 이벤트 유지)"""
+    from app.models.user import Event
+
+    with engine.begin() as conn:
+        table_sql = conn.execute(text(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'events'"
+        )).scalar()
+        if table_sql is None or "AUTOINCREMENT" in table_sql.upper():
+            return
+        conn.execute(text("ALTER TABLE events RENAME TO events_old"))
+        for index in Event.__table__.indexes:
+            conn.execute(text(f"DROP INDEX IF EXISTS {index.name}"))
+        Event.__table__.create(bind=conn)
+        # id 를 그대로 복사하면 sqlite_sequence 도 기존 최대 id 부터 이어짐
+        conn.execute(text(
+            "INSERT INTO events (id, type, user_ids, payload, created_at) "
+            "SELECT id, type, user_ids, payload, created_at FROM events_old"
+        ))
+        conn.execute(text("DROP TABLE events_old"))
+        logger.info("🔧 [MIGRATE] events 테이블을 AUTOINCREMENT 로 재생성")
+
+
+# 매칭 규칙 유니크 인덱스를 만들기 전에 규칙을 어기는 기존 중복 요청 정리
+# (각 그룹에서 하나만 남기고 나머지는 취소 처리: 수락 > 대기, 같은 상태면 최신 요청 유지)
+_DUPLICATE_MATCH_REQUEST_RULES = (
+    ("멘토의 수락 요청", "mentor_id", "status = 'ACCEPTED'"),
+    ("대기/수락 요청 (멘토-멘티 쌍)", "mentor_id, mentee_id", "status IN ('PENDING', 'ACCEPTED')"),
+    ("멘티의 대기 요청", "mentee_id", "status = 'PENDING'"),
+)
+
+
+def _resolve_duplicate_match_requests(engine: Engine) -> None:
+    """uq_match_requests_* 인덱스 규칙을 어기는 중복 요청을 취소 상태로 변경"""
+    with engine.begin() as conn:
+        for label, partition, condition in _DUPLICATE_MATCH_REQUEST_RULES:
+            cancelled = conn.execute(text(f"""
+                UPDATE match_requests SET status = 'CANCELLED' WHERE id IN (
+                    SELECT id FROM (
+                        SELECT id, ROW_NUMBER() OVER (
+                            PARTITION BY {partition}
+                            ORDER BY status = 'ACCEPTED' DESC, id DESC
+                        ) AS position
+                        FROM match_requests WHERE {condition}
+                    ) WHERE position > 1
+                )
+            """)).rowcount
+            if cancelled:
+                logger.warning("⚠️ [MIGRATE] 중복 %s %d건을 취소 처리", label, cancelled)
+
+
+def _move_image_blobs(engine: Engine) -> None:
+    """users.image_data 에 저장된 기존 이미지를 이미지 저장소로 이전"""
+    from app.services.image_store import save_image
+
+    columns = {column["name"] for column in inspect(engine).get_columns("users")}
+    if "image_data" not in columns:
+        return
+
+    with engine.begin() as conn:
+        user_ids = conn.execute(text(
+            "SELECT id FROM users WHERE image_data IS NOT NULL AND image_hash IS NULL"
+        )).scalars().all()
+        for user_id in user_ids:
+            # 한 번에 한 행씩 읽어 메모리 사용량 제한
+            data = conn.execute(
+                text("SELECT image_data FROM users WHERE id = :id"), {"id": user_id}
+            ).scalar()
+            image_format = "PNG" if data.startswith(b"\x89PNG") else "JPEG"
+            stored = save_image(data, image_format)
+            conn.execute(
+                text(
+                    "UPDATE users SET image_hash = :hash, image_mime = :mime, "
+                    "image_size = :size, image_data = NULL WHERE id = :id"
+                ),
+                {"hash": stored.hash, "mime": stored.mime, "size": stored.size, "id": user_id},
+            )
+        if user_ids:
+            logger.info("🔧 [MIGRATE] 이미지 저장소 이전 완료: %d개", len(user_ids))
+
+
+def _generate_missing_renditions(engine: Engine) -> None:
+    """썸네일이 없는 기존 이미지의 썸네일 생성 (요청 처리 중에는 생성하지 않으므로 미리 생성)"""
+    from app.services.image_store import find_image, generate_renditions, rendition_path, rendition_variants
+
+    with engine.connect() as conn:
+        images = conn.execute(text(
+            "SELECT DISTINCT image_hash, image_mime FROM users WHERE image_hash IS NOT NULL"
+        )).all()
+
+    generated = 0
+    for image_hash, image_mime in images:
+        if all(os.path.isfile(rendition_path(image_hash, variant)) for variant in rendition_variants(image_mime)):
+            continue
+        path = find_image(image_hash, image_mime)
+        if path is None:
+            logger.warning("⚠️ [MIGRATE] 원본 이미지 파일 없음: %s", image_hash)
+            continue
+        try:
+            with open(path, "rb") as f:
+                generate_renditions(f.read(), image_hash)
+        except Exception as e:
+            # 디코딩할 수 없는 이미지 하나 때문에 migrate 가 중단되지 않도록 (원본은 계속 제공됨)
+            logger.warning("⚠️ [MIGRATE] 썸네일 생성 실패: %s (%s)", image_hash, e)
+            continue
+        generated += 1
+    if generated:
+        logger.info("🔧 [MIGRATE] 기존 이미지 썸네일 생성 완료: %d개", generated)
+
+
+def run_migrations(engine: Engine) -> None:
+    """테이블 생성 및 데이터 보정 (python manage.py migrate, 여러 번 실행해도 안전)"""
+    # 모델 등록을 위해 임포트
+    from app import models  # noqa: F401
+    from app.services.mentor_search import create_mentor_search_index
+    from app.services.skills import backfill_mentor_skills
+
+    # 이미지 저장소 디렉토리
+    os.makedirs(settings.IMAGE_DIR, exist_ok=True)
+
+    # 데이터베이스 테이블 생성
+    Base.metadata.create_all(bind=engine)
+    _add_missing_columns(engine)
+    _rebuild_events_autoincrement(engine)
+
+    # 기존 테이블에 새로 추가된 인덱스 생성 (create_all 은 새 테이블에만 인덱스를 만듦)
+    # 매칭 규칙은 유니크 인덱스로만 보장되므로 중복을 먼저 정리하고, 그래도 실패하면 migrate 를 중단
+    _resolve_duplicate_match_requests(engine)
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+    # 멘토 전문 검색 색인 (FTS5 테이블 + 동기화 트리거)
+    create_mentor_search_index(engine)
+
+    # 기존 skills JSON 컬럼을 mentor_skills 테이블로 이전
+    db = SessionLocal()
+    try:
+        backfilled = backfill_mentor_skills(db)
+        if backfilled:
+            logger.info("🔧 [MIGRATE] mentor_skills 백필 완료: 멘토 %d명", backfilled)
+    finally:
+        db.close()
+
+    # 이미지 BLOB 을 users 행에서 파일 저장소로 이전한 뒤 썸네일 생성
+    _move_image_blobs(engine)
+    _generate_missing_renditions(engine)
@@ -1,3 +1,3 @@
-from .user import User, MatchRequest, UserRole, MatchRequestStatus
+from .user import User, MatchRequest, MentorSkill, Event, UserRole, MatchRequestStatus
 
-__all__ = ["User", "MatchRequest", "UserRole", "MatchRequestStatus"]
+__all__ = ["User", "MatchRequest", "MentorSkill", "Event", "UserRole", "MatchRequestStatus"]
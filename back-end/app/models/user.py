@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, LargeBinary, DateTime, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -23,7 +23,9 @@ class User(Base):
     role = Column(SQLEnum(UserRole), nullable=False)
     name = Column(String, nullable=False)
     bio = Column(Text)
-    image_data = Column(LargeBinary)  # 프로필 이미지를 DB에 저장
+    image_hash = Column(String(64))  # 이미지 저장소의 콘텐츠 해시 (SHA-256)
+    image_mime = Column(String)  # 이미지 MIME 타입
+    image_size = Column(Integer)  # 이미지 크기 (bytes)
     image_filename = Column(String)  # 이미지 파일명
     skills = Column(Text)  # JSON 형태로 저장 (멘토만 사용)
     created_at = Column(DateTime, default=func.now())
@@ -33,6 +35,18 @@ class User(Base):
     received_requests = relationship("MatchRequest", foreign_keys="MatchRequest.mentor_id", back_populates="mentor")
     # 멘티로서 보낸 매칭 요청들  
     sent_requests = relationship("MatchRequest", foreign_keys="MatchRequest.mentee_id", back_populates="mentee")
+    # 정규화된 스킬 목록 (멘토만 사용, skills 컬럼과 동기화)
+    skill_entries = relationship(
+        "MentorSkill",
+        back_populates="mentor",
+        cascade="all, delete-orphan",
+        order_by="MentorSkill.position",
+    )
+
+    __table_args__ = (
+        # 멘토 목록 이름순 정렬 및 키셋 페이지네이션
+        Index("ix_users_role_name", "role", "name"),
+    )
 
 class MatchRequest(Base):
     __tablename__ = "match_requests"
@@ -48,3 +62,55 @@ class MatchRequest(Base):
     # 관계 설정
     mentor = relationship("User", foreign_keys=[mentor_id], back_populates="received_requests")
     mentee = relationship("User", foreign_keys=[mentee_id], back_populates="sent_requests")
+
+    __table_args__ = (
+        # 받은/보낸 요청 목록 및 상태별 조회
+        Index("ix_match_requests_mentor_status", "mentor_id", "status"),
+        Index("ix_match_requests_mentee_status", "mentee_id", "status"),
+        # 매칭 규칙을 DB 에서 보장 (동시 요청에서도 중복 불가)
+        # 같은 멘토에게는 대기/수락 상태 요청을 하나만 보낼 수 있음
+        Index(
+            "uq_match_requests_active_pair", "mentor_id", "mentee_id", unique=True,
+            sqlite_where=status.in_([MatchRequestStatus.PENDING, MatchRequestStatus.ACCEPTED]),
+        ),
+        # 멘티는 한 번에 하나의 요청만 대기시킬 수 있음
+        Index(
+            "uq_match_requests_pending_mentee", "mentee_id", unique=True,
+            sqlite_where=status == MatchRequestStatus.PENDING,
+        ),
+        # 멘토는 한 명의 멘티만 수락할 수 있음
+        Index(
+            "uq_match_requests_accepted_mentor", "mentor_id", unique=True,
+            sqlite_where=status == MatchRequestStatus.ACCEPTED,
+        ),
+    )
+
+class MentorSkill(Base):
+    """멘토 스킬 연관 테이블 (검색용으로 소문자 정규화된 스킬명 저장)"""
+    __tablename__ = "mentor_skills"
+
+    mentor_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    skill = Column(String, primary_key=True)  # 정규화된 스킬명 (casefold)
+    position = Column(Integer, nullable=False, default=0)  # 프로필에 입력된 순서 (0 = 대표 스킬)
+
+    mentor = relationship("User", back_populates="skill_entries")
+
+    __table_args__ = (
+        # 스킬 필터: skill -> mentor_id 인덱스 스캔
+        Index("ix_mentor_skills_skill_mentor", "skill", "mentor_id"),
+        # 스킬 정렬: 대표 스킬(position = 0) 조회
+        Index("ix_mentor_skills_position_skill", "position", "skill"),
+    )
+
+class Event(Base):
+    """워커 프로세스 간 알림 전달용 이벤트 (EVENTS_BACKEND=sqlite, 짧은 기간만 보관)"""
+    __tablename__ = "events"
+
+    id = Column(Integer, primary_key=True)
+    type = Column(String, nullable=False)  # 예: match_request.accepted
+    user_ids = Column(String, nullable=False)  # 수신자 사용자 ID (JSON 배열)
+    payload = Column(Text, nullable=False)  # 이벤트 데이터 (JSON)
+    created_at = Column(DateTime, default=func.now(), index=True)
+
+    # 오래된 이벤트를 모두 지운 뒤에도 id 가 재사용되지 않도록 (워커는 마지막으로 본 id 이후만 조회)
+    __table_args__ = {"sqlite_autoincrement": True}
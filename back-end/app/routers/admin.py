@@ -0,0 +1,101 @@
+import io
+import tempfile
+import threading
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.dependencies import require_admin_key
+from app.schemas.user import ErrorResponse, ImportUsersResponse
+from app.services.response_cache import mentor_directory_changed
+from app.services.user_import import IMPORT_FORMATS, import_users
+
+router = APIRouter(dependencies=[Depends(require_admin_key)])
+
+# Content-Type 으로 가져오기 형식 추론
+_FORMAT_BY_CONTENT_TYPE = {
+    "text/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+}
+# 해싱 스레드를 모두 사용하므로 프로세스당 한 번에 하나만 실행
+_import_lock = threading.Lock()
+
+
+def _import_format(request: Request, fmt: Optional[str]) -> str:
+    if fmt:
+        return fmt
+    content_type = (request.headers.get("content-type") or "").split(";")[0].strip().lower()
+    if content_type in _FORMAT_BY_CONTENT_TYPE:
+        return _FORMAT_BY_CONTENT_TYPE[content_type]
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Content-Type must be text/csv or application/x-ndjson (or pass ?format=)"
+    )
+
+
+@router.post("/admin/users/import",
+             response_model=ImportUsersResponse,
+             responses={
+                 200: {"description": "Users imported (see counts and row errors)"},
+                 400: {"model": ErrorResponse, "description": "Bad request - unknown format"},
+                 403: {"model": ErrorResponse, "description": "Invalid admin key"},
+                 409: {"model": ErrorResponse, "description": "Another import is running"},
+                 413: {"model": ErrorResponse, "description": "Import file too large"},
+                 500: {"model": ErrorResponse, "description": "Internal server error"}
+             },
+             openapi_extra={
+                 "requestBody": {
+                     "required": True,
+                     "content": {
+                         "text/csv": {"schema": {"type": "string"}},
+                         "application/x-ndjson": {"schema": {"type": "string"}}
+                     }
+                 }
+             })
+async def import_users_endpoint(
+    request: Request,
+    format: Optional[str] = Query(None, pattern="^(" + "|".join(IMPORT_FORMATS) + ")$"),
+    batchSize: Optional[int] = Query(None, ge=1, le=20000)
+):
+    """사용자 대량 가져오기 (CSV 또는 NDJSON 본문)
+
+    열/필드: email, password, name, role, bio, skills (CSV 는 ";" 구분), image (Base64).
+    이미 가입된 이메일과 파일 안의 중복 이메일은 건너뛰고, 잘못된 행은 오류 목록에 담는다.
+    """
+    fmt = _import_format(request, format)
+
+    # 본문을 스트리밍으로 받아 임시 파일에 저장 (큰 파일도 메모리에 모두 올리지 않음)
+    spool = tempfile.TemporaryFile()
+    try:
+        received = 0
+        async for chunk in request.stream():
+            received += len(chunk)
+            if received > settings.IMPORT_MAX_UPLOAD_BYTES:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail=f"Import file must be at most {settings.IMPORT_MAX_UPLOAD_BYTES} bytes"
+                )
+            spool.write(chunk)
+        spool.seek(0)
+
+        if not _import_lock.acquire(blocking=False):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Another import is already running"
+            )
+        try:
+            text = io.TextIOWrapper(spool, encoding="utf-8-sig", newline="")
+            # 해싱 대기와 DB 삽입이 블로킹이므로 스레드에서 실행
+            result = await run_in_threadpool(import_users, text, fmt, batchSize)
+        finally:
+            _import_lock.release()
+        # 가져온 멘토가 목록에 보이도록 목록 캐시 무효화
+        if result["created"]:
+            await mentor_directory_changed()
+        return result
+    finally:
+        spool.close()
@@ -1,38 +1,57 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from app.core.database import get_db
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+from app.core.database import DbSession, get_db, get_read_db, open_session
 from app.schemas.user import SignupRequest, LoginRequest, LoginResponse, ErrorResponse
 from app.models.user import User, UserRole
-from app.utils.auth import get_password_hash, verify_password, create_access_token
+from app.services.bounded_pool import PoolSaturated
+from app.services.response_cache import mentor_directory_changed
+from app.utils.auth import (
+    DUMMY_PASSWORD_HASH, get_password_hash_async, verify_password_async, password_needs_rehash,
+    create_access_token
+)
 import json
+import logging
 from datetime import timedelta
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 @router.post("/signup", 
              status_code=status.HTTP_201_CREATED,
              responses={
                  201: {"description": "User successfully created"},
                  400: {"model": ErrorResponse, "description": "Bad request - invalid payload format"},
-                 500: {"model": ErrorResponse, "description": "Internal server error"}
+                 500: {"model": ErrorResponse, "description": "Internal server error"},
+                 503: {"model": ErrorResponse, "description": "Password hashing is saturated - retry later"}
              })
-def signup(user_data: SignupRequest, db: Session = Depends(get_db)):
+async def signup(user_data: SignupRequest, db: DbSession = Depends(get_db)):
     """사용자 회원가입"""
-    print(f"DEBUG: Received signup data: {user_data}")
-    print(f"DEBUG: Role type: {type(user_data.role)}, Role value: {user_data.role}")
+    logger.debug("회원가입 요청: role=%s", user_data.role.value)
     
-    # 이메일 중복 확인
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
-    if existing_user:
+    # 이메일 중복 확인 (해싱 비용을 쓰기 전에 먼저 확인)
+    if await _email_exists(db, user_data.email):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
     
-    # 비밀번호 해싱
-    hashed_password = get_password_hash(user_data.password)
+    # 비밀번호 해싱 (전용 해싱 풀에서 실행)
+    hashed_password = await get_password_hash_async(user_data.password)
     
-    # 새 사용자 생성
+    user_id = await _create_user(db, user_data, hashed_password)
+    
+    # 새 멘토는 멘토 목록에 바로 보여야 하므로 목록 캐시 무효화
+    if user_data.role == "mentor":
+        await mentor_directory_changed([user_id])
+    
+    return {"message": "User created successfully"}
+
+async def _email_exists(db: DbSession, email: str) -> bool:
+    return await db.scalar(select(User.id).where(User.email == email)) is not None
+
+async def _create_user(db: DbSession, user_data: SignupRequest, hashed_password: str) -> int:
+    """새 사용자 생성 (생성된 사용자 ID 반환)"""
     new_user = User(
         email=user_data.email,
         password_hash=hashed_password,
@@ -43,10 +62,16 @@ def signup(user_data: SignupRequest, db: Session = Depends(get_db)):
     )
     
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
-    
-    return {"message": "User created successfully"}
+    try:
+        await db.commit()
+    except IntegrityError:
+        # 동시에 같은 이메일로 가입한 경우
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered"
+        )
+    return new_user.id
 
 @router.post("/login",
              response_model=LoginResponse,
@@ -54,19 +79,31 @@ def signup(user_data: SignupRequest, db: Session = Depends(get_db)):
                  200: {"model": LoginResponse, "description": "Login successful"},
                  400: {"model": ErrorResponse, "description": "Bad request - invalid payload format"},
                  401: {"model": ErrorResponse, "description": "Unauthorized - login failed"},
-                 500: {"model": ErrorResponse, "description": "Internal server error"}
+                 500: {"model": ErrorResponse, "description": "Internal server error"},
+                 503: {"model": ErrorResponse, "description": "Password hashing is saturated - retry later"}
              })
-def login(login_data: LoginRequest, db: Session = Depends(get_db)):
+async def login(login_data: LoginRequest, db: DbSession = Depends(get_read_db)):
     """사용자 로그인"""
-    # 사용자 조회
-    user = db.query(User).filter(User.email == login_data.email).first()
+    # 사용자 조회 (인증에 필요한 컬럼만)
+    user = await _find_login_user(db, login_data.email)
     
-    if not user or not verify_password(login_data.password, user.password_hash):
+    # 없는 이메일도 같은 비용으로 검증 (응답 시간으로 가입 여부가 드러나지 않도록)
+    password_hash = user.password_hash if user else DUMMY_PASSWORD_HASH
+    if not await verify_password_async(login_data.password, password_hash) or not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password"
         )
     
+    # 이전 형식(SHA-256) 또는 비용이 다른 해시는 로그인 성공 시 재해싱
+    if password_needs_rehash(user.password_hash):
+        try:
+            new_hash = await get_password_hash_async(login_data.password)
+            await _update_password_hash(user.id, new_hash)
+        except PoolSaturated:
+            # 해싱 풀이 바쁘면 다음 로그인 때 재시도
+            pass
+    
     # JWT 토큰 생성
     access_token_expires = timedelta(minutes=60)  # 1시간
     access_token = create_access_token(
@@ -80,3 +117,15 @@ def login(login_data: LoginRequest, db: Session = Depends(get_db)):
     )
     
     return LoginResponse(token=access_token)
+
+async def _find_login_user(db: DbSession, email: str):
+    result = await db.execute(
+        select(User.id, User.email, User.name, User.role, User.password_hash).where(User.email == email)
+    )
+    return result.first()
+
+async def _update_password_hash(user_id: int, password_hash: str) -> None:
+    # 로그인 조회는 읽기 전용 연결이므로 갱신은 쓰기 세션에서 수행
+    async with open_session() as db:
+        await db.execute(update(User).where(User.id == user_id).values(password_hash=password_hash))
+        await db.commit()
@@ -0,0 +1,58 @@
+import asyncio
+
+import orjson
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+
+from app.core.config import settings
+from app.core.dependencies import get_stream_principal
+from app.schemas.user import ErrorResponse
+from app.services.events import event_bus
+from app.services.principal_cache import Principal
+
+router = APIRouter()
+
+# 연결이 끊겼을 때 브라우저 EventSource 의 재연결 대기 시간 (ms)
+RECONNECT_DELAY_MS = 3000
+
+def _format_event(event: dict) -> str:
+    """SSE 메시지 형식으로 변환"""
+    data = orjson.dumps(event["data"]).decode()
+    return f"id: {event['id']}\nevent: {event['type']}\ndata: {data}\n\n"
+
+async def _event_stream(user_id: int):
+    """사용자 이벤트를 SSE 로 전송 (연결이 끊기면 Starlette 가 작업을 취소해 구독 해제)"""
+    async with event_bus.subscription(user_id) as queue:
+        yield f"retry: {RECONNECT_DELAY_MS}\n\n"
+        while True:
+            try:
+                event = await asyncio.wait_for(queue.get(), timeout=settings.EVENTS_HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                # 프록시가 유휴 연결을 끊지 않도록 주석 줄 전송
+                yield ": ping\n\n"
+                continue
+            yield _format_event(event)
+
+@router.get("/events",
+           response_class=StreamingResponse,
+           responses={
+               200: {
+                   "description": "Server-Sent Events stream of match request changes "
+                                  "(match_request.created/accepted/rejected/cancelled, resync)",
+                   "content": {"text/event-stream": {}},
+               },
+               401: {"model": ErrorResponse, "description": "Unauthorized - authentication failed"},
+               500: {"model": ErrorResponse, "description": "Internal server error"}
+           })
+async def stream_events(current_user: Principal = Depends(get_stream_principal)):
+    """매칭 요청 상태 변경 알림 스트림 (Authorization 헤더 또는 ?token= 으로 인증)
+
+    요청을 받거나 보낸 사용자에게만 전달된다. resync 이벤트를 받으면 이벤트가 누락되었으므로
+    목록을 다시 조회한다.
+    """
+    return StreamingResponse(
+        _event_stream(current_user.id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
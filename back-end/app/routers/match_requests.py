@@ -1,14 +1,24 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Path
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, status, Path, Query
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import insert, literal, select, update
+from sqlalchemy.exc import IntegrityError
+from typing import List, Optional, Union
+import orjson
 
-from app.core.database import get_db
+from app.core.database import DbSession, get_db, get_read_db
 from app.core.dependencies import get_current_user, get_current_mentor, get_current_mentee
 from app.models.user import User, UserRole, MatchRequest, MatchRequestStatus
 from app.schemas.user import (
     MatchRequestCreate, MatchRequest as MatchRequestSchema, 
-    MatchRequestOutgoing, ErrorResponse
+    MatchRequestIncoming, MatchRequestOutgoingDetail, MatchRequestIncomingFields, MatchRequestOutgoingFields,
+    MatchRequestBulkReject, MatchRequestBulkResult,
+    MatchRequestStatus as MatchRequestStatusSchema, ErrorResponse
 )
+from app.services.events import Notification, event_bus
+from app.services.image_store import THUMBNAIL_VARIANT, profile_image_url
+from app.services.principal_cache import Principal
+from app.utils.fields import parse_fields
+from app.utils.pagination import NEXT_CURSOR_HEADER, encode_cursor, keyset_filter
 
 router = APIRouter()
 
@@ -20,24 +30,12 @@ router = APIRouter()
                 401: {"model": ErrorResponse, "description": "Unauthorized - authentication failed"},
                 500: {"model": ErrorResponse, "description": "Internal server error"}
             })
-def create_match_request(
+async def create_match_request(
     request_data: MatchRequestCreate,
-    current_user: User = Depends(get_current_mentee),  # 멘티만 접근 가능
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_mentee),  # 멘티만 접근 가능
+    db: DbSession = Depends(get_db)
 ):
     """매칭 요청 생성 (멘티 전용)"""
-    # 멘토 존재 확인
-    mentor = db.query(User).filter(
-        User.id == request_data.mentorId,
-        User.role == UserRole.MENTOR
-    ).first()
-    
-    if not mentor:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Mentor not found"
-        )
-    
     # 현재 사용자가 요청한 멘티 ID와 일치하는지 확인
     if current_user.id != request_data.menteeId:
         raise HTTPException(
@@ -45,229 +43,415 @@ def create_match_request(
             detail="Cannot create request for other mentee"
         )
     
-    # 이미 해당 멘토에게 요청을 보낸 적이 있는지 확인
-    existing_request = db.query(MatchRequest).filter(
-        MatchRequest.mentor_id == request_data.mentorId,
-        MatchRequest.mentee_id == request_data.menteeId,
-        MatchRequest.status.in_([MatchRequestStatus.PENDING, MatchRequestStatus.ACCEPTED])
-    ).first()
-    
-    if existing_request:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Already have an active request to this mentor"
+    # 멘토 존재 확인과 삽입을 한 문장으로 실행 (중복 규칙은 유니크 인덱스가 보장)
+    statement = insert(MatchRequest).from_select(
+        ["mentor_id", "mentee_id", "message", "status"],
+        select(
+            User.id,
+            literal(request_data.menteeId),
+            literal(request_data.message),
+            literal(MatchRequestStatus.PENDING, MatchRequest.status.type),
+        ).where(
+            User.id == request_data.mentorId,
+            User.role == UserRole.MENTOR
         )
+    ).returning(*_RETURNING_COLUMNS)
     
-    # 현재 다른 요청이 대기중인지 확인 (한 번에 하나의 요청만 가능)
-    pending_request = db.query(MatchRequest).filter(
-        MatchRequest.mentee_id == request_data.menteeId,
-        MatchRequest.status == MatchRequestStatus.PENDING
-    ).first()
+    try:
+        new_request = (await db.execute(statement)).first()
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        # 실패한 경우에만 어떤 규칙을 어겼는지 확인
+        if await _has_active_request(db, request_data.mentorId, request_data.menteeId):
+            detail = "Already have an active request to this mentor"
+        else:
+            detail = "Cannot send multiple requests simultaneously"
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
     
-    if pending_request:
+    if new_request is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Cannot send multiple requests simultaneously"
+            detail="Mentor not found"
         )
     
-    # 새 매칭 요청 생성
-    new_request = MatchRequest(
-        mentor_id=request_data.mentorId,
-        mentee_id=request_data.menteeId,
-        message=request_data.message,
-        status=MatchRequestStatus.PENDING
-    )
-    
-    db.add(new_request)
-    db.commit()
-    db.refresh(new_request)
-    
-    return MatchRequestSchema(
-        id=new_request.id,
-        mentorId=new_request.mentor_id,
-        menteeId=new_request.mentee_id,
-        message=new_request.message,
-        status=new_request.status.value
-    )
+    await event_bus.publish(_notifications("match_request.created", [new_request]))
+    return _to_schema(new_request)
+
+# INSERT/UPDATE ... RETURNING 으로 돌려받는 컬럼
+_RETURNING_COLUMNS = (
+    MatchRequest.id, MatchRequest.mentor_id, MatchRequest.mentee_id,
+    MatchRequest.message, MatchRequest.status,
+)
+
+def _to_dict(row) -> dict:
+    return {
+        "id": row.id,
+        "mentorId": row.mentor_id,
+        "menteeId": row.mentee_id,
+        "message": row.message,
+        "status": row.status.value,
+    }
+
+def _to_schema(row) -> MatchRequestSchema:
+    return MatchRequestSchema(**_to_dict(row))
+
+def _notifications(event_type: str, rows) -> List[Notification]:
+    """변경된 요청 행마다 멘토/멘티 양쪽에 보낼 알림 생성"""
+    return [
+        Notification(event_type, [row.mentor_id, row.mentee_id], _to_dict(row))
+        for row in rows
+    ]
+
+async def _has_active_request(db: DbSession, mentor_id: int, mentee_id: int) -> bool:
+    """같은 멘토에게 대기/수락 상태의 요청이 있는지 확인"""
+    return await db.scalar(select(MatchRequest.id).where(
+        MatchRequest.mentor_id == mentor_id,
+        MatchRequest.mentee_id == mentee_id,
+        MatchRequest.status.in_([MatchRequestStatus.PENDING, MatchRequestStatus.ACCEPTED])
+    ).limit(1)) is not None
+
+# 상태별로 허용되는 이전 상태 (수락은 대기 중인 요청만, 거절/취소는 수락된 매칭도 종료 가능)
+_ALLOWED_TRANSITIONS = {
+    MatchRequestStatus.ACCEPTED: (MatchRequestStatus.PENDING,),
+    MatchRequestStatus.REJECTED: (MatchRequestStatus.PENDING, MatchRequestStatus.ACCEPTED),
+    MatchRequestStatus.CANCELLED: (MatchRequestStatus.PENDING, MatchRequestStatus.ACCEPTED),
+}
+
+async def _update_status(db: DbSession, request_id: int, owner_column, owner_id: int,
+                         new_status: MatchRequestStatus, commit: bool = True):
+    """요청 상태를 한 번의 UPDATE 로 변경하고 변경된 행 반환
+
+    요청이 없으면 404, 현재 상태에서 new_status 로 바꿀 수 없으면 400 으로 응답한다.
+    commit=False 이면 같은 트랜잭션에서 이어서 변경할 수 있도록 커밋하지 않는다.
+    """
+    row = (await db.execute(
+        update(MatchRequest)
+        .where(
+            MatchRequest.id == request_id,
+            owner_column == owner_id,
+            MatchRequest.status.in_(_ALLOWED_TRANSITIONS[new_status])
+        )
+        .values(status=new_status)
+        .returning(*_RETURNING_COLUMNS)
+    )).first()
+    if row is None:
+        await db.rollback()
+        # 변경되지 않은 경우에만 요청이 없는지, 상태가 맞지 않는지 확인
+        current = await db.scalar(select(MatchRequest.status).where(
+            MatchRequest.id == request_id,
+            owner_column == owner_id
+        ))
+        if current is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Match request not found"
+            )
+        if new_status == MatchRequestStatus.ACCEPTED and current == MatchRequestStatus.ACCEPTED:
+            detail = "Already have an accepted mentee"
+        else:
+            detail = f"Match request is already {current.value}"
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+    if commit:
+        await db.commit()
+    return row
+
+async def _reject_other_pending(db: DbSession, mentor_id: int, accepted_id: int):
+    """수락한 요청을 제외한 멘토의 대기 요청을 한 번의 UPDATE 로 거절"""
+    return (await db.execute(
+        update(MatchRequest)
+        .where(
+            MatchRequest.mentor_id == mentor_id,
+            MatchRequest.status == MatchRequestStatus.PENDING,
+            MatchRequest.id != accepted_id
+        )
+        .values(status=MatchRequestStatus.REJECTED)
+        .returning(*_RETURNING_COLUMNS)
+    )).all()
+
+# 목록 페이지 크기 제한
+MAX_PAGE_LIMIT = 100
+
+# 목록 응답 필드 이름 -> 컬럼 (fields= 로 고를 수 있음, id 는 항상 포함)
+_LIST_FIELD_COLUMNS = {
+    "id": MatchRequest.id,
+    "mentorId": MatchRequest.mentor_id,
+    "menteeId": MatchRequest.mentee_id,
+    "message": MatchRequest.message,
+    "status": MatchRequest.status,
+}
+
+# 보낸 요청 목록 컬럼 (MatchRequestOutgoing 에는 message 가 없음)
+_OUTGOING_COLUMNS = (MatchRequest.id, MatchRequest.mentor_id, MatchRequest.mentee_id, MatchRequest.status)
+
+def _field_names(columns) -> List[str]:
+    keys = {column.key for column in columns}
+    return [name for name, column in _LIST_FIELD_COLUMNS.items() if column.key in keys]
+
+def _fields_description(columns) -> str:
+    names = _field_names(columns)
+    return f"Comma-separated fields to return ({', '.join(names)}); id is always included"
+
+def _counterpart_summary(row, role: UserRole) -> dict:
+    """조인으로 함께 조회한 상대방 컬럼으로 요약 생성 (값이 없는 필드는 생략)"""
+    summary = {
+        "id": row.counterpart_id,
+        "name": row.counterpart_name,
+        "imageUrl": profile_image_url(role.value, row.counterpart_id, row.counterpart_image_hash,
+                                      row.counterpart_image_mime),
+    }
+    if row.counterpart_image_hash:
+        summary["thumbnailUrl"] = profile_image_url(
+            role.value, row.counterpart_id, row.counterpart_image_hash,
+            row.counterpart_image_mime, THUMBNAIL_VARIANT
+        )
+    if role == UserRole.MENTOR:
+        summary["skills"] = orjson.loads(row.counterpart_skills) if row.counterpart_skills else []
+    return summary
+
+async def _list_match_requests(db: DbSession, owner_column, owner_id: int,
+                               counterpart_column, counterpart_role: UserRole, columns,
+                               statuses: Optional[List[MatchRequestStatusSchema]],
+                               limit: Optional[int], cursor: Optional[str], embed: bool,
+                               fields: Optional[str] = None) -> ORJSONResponse:
+    """받은/보낸 요청 목록 조회 (상태 필터 + id 키셋 페이지네이션)
+
+    embed=True 이면 상대방 정보를 같은 쿼리에서 조인으로 함께 조회한다 (1 + N 조회 방지).
+    fields 가 주어지면 해당 필드의 컬럼만 조회한다.
+    큰 목록에서 response_model 재검증 비용이 들지 않도록 행에서 만든 dict 를 바로 직렬화하므로
+    필드 구성은 응답 스키마와 같게 유지한다 (None 필드는 생략).
+    """
+    selected = parse_fields(fields, _field_names(columns))
+    if selected is not None:
+        columns = [
+            column for name, column in _LIST_FIELD_COLUMNS.items()
+            if name == "id" or name in selected
+        ]
+    keys = {column.key for column in columns}
+    with_mentor_id = "mentor_id" in keys
+    with_mentee_id = "mentee_id" in keys
+    with_message = "message" in keys
+    with_status = "status" in keys
+
+    query = select(*columns).where(owner_column == owner_id)
+    if statuses:
+        query = query.where(MatchRequest.status.in_(
+            [MatchRequestStatus(value.value) for value in statuses]
+        ))
+
+    condition = keyset_filter([MatchRequest.id], cursor)
+    if condition is not None:
+        query = query.where(condition)
+
+    if embed:
+        query = query.join(User, User.id == counterpart_column).add_columns(
+            User.id.label("counterpart_id"),
+            User.name.label("counterpart_name"),
+            User.image_hash.label("counterpart_image_hash"),
+            User.image_mime.label("counterpart_image_mime"),
+            User.skills.label("counterpart_skills"),
+        )
+    query = query.order_by(MatchRequest.id)
+
+    headers = {}
+    if limit:
+        # 다음 페이지 존재 여부 확인을 위해 한 행 더 조회
+        rows = (await db.execute(query.limit(limit + 1))).all()
+        if len(rows) > limit:
+            rows = rows[:limit]
+            headers[NEXT_CURSOR_HEADER] = encode_cursor([rows[-1].id])
+    else:
+        rows = (await db.execute(query)).all()
+
+    items = []
+    for row in rows:
+        item = {"id": row.id}
+        if with_mentor_id:
+            item["mentorId"] = row.mentor_id
+        if with_mentee_id:
+            item["menteeId"] = row.mentee_id
+        if with_message:
+            item["message"] = row.message
+        if with_status:
+            item["status"] = row.status.value
+        if embed:
+            item[counterpart_role.value] = _counterpart_summary(row, counterpart_role)
+        items.append(item)
+    return ORJSONResponse(items, headers=headers)
 
 @router.get("/match-requests/incoming",
-           response_model=List[MatchRequestSchema],
+           response_model=Union[List[MatchRequestIncoming], List[MatchRequestIncomingFields]],
            responses={
-               200: {"description": "Incoming match requests retrieved successfully"},
+               200: {"description": "Incoming match requests retrieved successfully (with fields=, only id and the requested fields are returned)"},
+               400: {"model": ErrorResponse, "description": "Bad request - invalid cursor"},
                401: {"model": ErrorResponse, "description": "Unauthorized - authentication failed"},
                500: {"model": ErrorResponse, "description": "Internal server error"}
            })
-def get_incoming_match_requests(
-    current_user: User = Depends(get_current_mentor),  # 멘토만 접근 가능
-    db: Session = Depends(get_db)
+async def get_incoming_match_requests(
+    statusFilter: Optional[List[MatchRequestStatusSchema]] = Query(None, alias="status", description="Filter by status (repeat for multiple)"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_LIMIT, description="Maximum number of requests per page"),
+    cursor: Optional[str] = Query(None, description=f"Opaque cursor from the {NEXT_CURSOR_HEADER} header of the previous page"),
+    embed: bool = Query(False, description="Include a summary of each mentee (name, image URLs)"),
+    fields: Optional[str] = Query(None, description=_fields_description(_RETURNING_COLUMNS)),
+    current_user: Principal = Depends(get_current_mentor),  # 멘토만 접근 가능
+    db: DbSession = Depends(get_read_db)
 ):
     """받은 매칭 요청 목록 조회 (멘토 전용)"""
-    requests = db.query(MatchRequest).filter(
-        MatchRequest.mentor_id == current_user.id
-    ).all()
-    
-    return [
-        MatchRequestSchema(
-            id=req.id,
-            mentorId=req.mentor_id,
-            menteeId=req.mentee_id,
-            message=req.message,
-            status=req.status.value
-        )
-        for req in requests
-    ]
+    return await _list_match_requests(
+        db, MatchRequest.mentor_id, current_user.id, MatchRequest.mentee_id, UserRole.MENTEE,
+        _RETURNING_COLUMNS, statusFilter, limit, cursor, embed, fields
+    )
 
 @router.get("/match-requests/outgoing",
-           response_model=List[MatchRequestOutgoing],
+           response_model=Union[List[MatchRequestOutgoingDetail], List[MatchRequestOutgoingFields]],
            responses={
-               200: {"description": "Outgoing match requests retrieved successfully"},
+               200: {"description": "Outgoing match requests retrieved successfully (with fields=, only id and the requested fields are returned)"},
+               400: {"model": ErrorResponse, "description": "Bad request - invalid cursor"},
                401: {"model": ErrorResponse, "description": "Unauthorized - authentication failed"},
                500: {"model": ErrorResponse, "description": "Internal server error"}
            })
-def get_outgoing_match_requests(
-    current_user: User = Depends(get_current_mentee),  # 멘티만 접근 가능
-    db: Session = Depends(get_db)
+async def get_outgoing_match_requests(
+    statusFilter: Optional[List[MatchRequestStatusSchema]] = Query(None, alias="status", description="Filter by status (repeat for multiple)"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_LIMIT, description="Maximum number of requests per page"),
+    cursor: Optional[str] = Query(None, description=f"Opaque cursor from the {NEXT_CURSOR_HEADER} header of the previous page"),
+    embed: bool = Query(False, description="Include a summary of each mentor (name, image URLs, skills)"),
+    fields: Optional[str] = Query(None, description=_fields_description(_OUTGOING_COLUMNS)),
+    current_user: Principal = Depends(get_current_mentee),  # 멘티만 접근 가능
+    db: DbSession = Depends(get_read_db)
 ):
     """보낸 매칭 요청 목록 조회 (멘티 전용)"""
-    requests = db.query(MatchRequest).filter(
-        MatchRequest.mentee_id == current_user.id
-    ).all()
-    
-    return [
-        MatchRequestOutgoing(
-            id=req.id,
-            mentorId=req.mentor_id,
-            menteeId=req.mentee_id,
-            status=req.status.value
-        )
-        for req in requests
-    ]
+    return await _list_match_requests(
+        db, MatchRequest.mentee_id, current_user.id, MatchRequest.mentor_id, UserRole.MENTOR,
+        _OUTGOING_COLUMNS, statusFilter, limit, cursor, embed, fields
+    )
 
 @router.put("/match-requests/{request_id}/accept",
            response_model=MatchRequestSchema,
            responses={
                200: {"description": "Match request accepted successfully"},
+               400: {"model": ErrorResponse, "description": "Bad request - already have an accepted mentee or request is not pending"},
                404: {"model": ErrorResponse, "description": "Match request not found"},
                401: {"model": ErrorResponse, "description": "Unauthorized - authentication failed"},
                500: {"model": ErrorResponse, "description": "Internal server error"}
            })
-def accept_match_request(
+async def accept_match_request(
     request_id: int = Path(...),
-    current_user: User = Depends(get_current_mentor),  # 멘토만 접근 가능
-    db: Session = Depends(get_db)
+    rejectOthers: bool = Query(False, description="수락과 같은 트랜잭션에서 나머지 대기 요청을 모두 거절"),
+    current_user: Principal = Depends(get_current_mentor),  # 멘토만 접근 가능
+    db: DbSession = Depends(get_db)
 ):
     """매칭 요청 수락 (멘토 전용)"""
-    # 요청 조회
-    match_request = db.query(MatchRequest).filter(
-        MatchRequest.id == request_id,
-        MatchRequest.mentor_id == current_user.id
-    ).first()
-    
-    if not match_request:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Match request not found"
-        )
-    
-    # 이미 수락된 요청이 있는지 확인 (한 명의 멘티만 수락 가능)
-    existing_accepted = db.query(MatchRequest).filter(
-        MatchRequest.mentor_id == current_user.id,
-        MatchRequest.status == MatchRequestStatus.ACCEPTED
-    ).first()
-    
-    if existing_accepted:
+    # 한 명의 멘티만 수락 가능 (uq_match_requests_accepted_mentor 인덱스가 보장)
+    rejected = []
+    try:
+        if rejectOthers:
+            match_request = await _update_status(
+                db, request_id, MatchRequest.mentor_id, current_user.id, MatchRequestStatus.ACCEPTED,
+                commit=False
+            )
+            rejected = await _reject_other_pending(db, current_user.id, request_id)
+            await db.commit()
+        else:
+            match_request = await _update_status(
+                db, request_id, MatchRequest.mentor_id, current_user.id, MatchRequestStatus.ACCEPTED
+            )
+    except IntegrityError:
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Already have an accepted mentee"
         )
     
-    # 요청 상태를 수락으로 변경
-    match_request.status = MatchRequestStatus.ACCEPTED
-    db.commit()
-    db.refresh(match_request)
-    
-    return MatchRequestSchema(
-        id=match_request.id,
-        mentorId=match_request.mentor_id,
-        menteeId=match_request.mentee_id,
-        message=match_request.message,
-        status=match_request.status.value
+    await event_bus.publish(
+        _notifications("match_request.accepted", [match_request])
+        + _notifications("match_request.rejected", rejected)
+    )
+    return _to_schema(match_request)
+
+@router.put("/match-requests/reject",
+           response_model=MatchRequestBulkResult,
+           responses={
+               200: {"description": "Pending match requests rejected (requests in other states are listed in notPending, unknown IDs in notFound)"},
+               400: {"model": ErrorResponse, "description": "Bad request - invalid payload format"},
+               401: {"model": ErrorResponse, "description": "Unauthorized - authentication failed"},
+               500: {"model": ErrorResponse, "description": "Internal server error"}
+           })
+async def bulk_reject_match_requests(
+    request_data: MatchRequestBulkReject,
+    current_user: Principal = Depends(get_current_mentor),  # 멘토만 접근 가능
+    db: DbSession = Depends(get_db)
+):
+    """매칭 요청 일괄 거절 (멘토 전용, 한 번의 UPDATE)
+
+    대기 중인 요청만 거절하고, 이미 수락/거절/취소된 요청은 그대로 두고 notPending 으로 돌려준다.
+    """
+    ids = list(dict.fromkeys(request_data.ids))
+    rows = (await db.execute(
+        update(MatchRequest)
+        .where(
+            MatchRequest.id.in_(ids),
+            MatchRequest.mentor_id == current_user.id,
+            MatchRequest.status == MatchRequestStatus.PENDING
+        )
+        .values(status=MatchRequestStatus.REJECTED)
+        .returning(*_RETURNING_COLUMNS)
+    )).all()
+    updated = {row.id for row in rows}
+    remaining = [request_id for request_id in ids if request_id not in updated]
+    existing = set()
+    if remaining:
+        # 변경되지 않은 ID 중 이 멘토의 요청인 것 (대기 상태가 아님)
+        existing = set((await db.scalars(select(MatchRequest.id).where(
+            MatchRequest.id.in_(remaining),
+            MatchRequest.mentor_id == current_user.id
+        ))).all())
+    await db.commit()
+    await event_bus.publish(_notifications("match_request.rejected", rows))
+
+    return MatchRequestBulkResult(
+        updated=[_to_schema(row) for row in sorted(rows, key=lambda row: row.id)],
+        notPending=[request_id for request_id in remaining if request_id in existing],
+        notFound=[request_id for request_id in remaining if request_id not in existing]
     )
 
 @router.put("/match-requests/{request_id}/reject",
            response_model=MatchRequestSchema,
            responses={
                200: {"description": "Match request rejected successfully"},
+               400: {"model": ErrorResponse, "description": "Bad request - request is already rejected or cancelled"},
                404: {"model": ErrorResponse, "description": "Match request not found"},
                401: {"model": ErrorResponse, "description": "Unauthorized - authentication failed"},
                500: {"model": ErrorResponse, "description": "Internal server error"}
            })
-def reject_match_request(
+async def reject_match_request(
     request_id: int = Path(...),
-    current_user: User = Depends(get_current_mentor),  # 멘토만 접근 가능
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_mentor),  # 멘토만 접근 가능
+    db: DbSession = Depends(get_db)
 ):
     """매칭 요청 거절 (멘토 전용)"""
-    # 요청 조회
-    match_request = db.query(MatchRequest).filter(
-        MatchRequest.id == request_id,
-        MatchRequest.mentor_id == current_user.id
-    ).first()
-    
-    if not match_request:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Match request not found"
-        )
-    
-    # 요청 상태를 거절로 변경
-    match_request.status = MatchRequestStatus.REJECTED
-    db.commit()
-    db.refresh(match_request)
-    
-    return MatchRequestSchema(
-        id=match_request.id,
-        mentorId=match_request.mentor_id,
-        menteeId=match_request.mentee_id,
-        message=match_request.message,
-        status=match_request.status.value
+    match_request = await _update_status(
+        db, request_id, MatchRequest.mentor_id, current_user.id, MatchRequestStatus.REJECTED
     )
+    await event_bus.publish(_notifications("match_request.rejected", [match_request]))
+    return _to_schema(match_request)
 
 @router.delete("/match-requests/{request_id}",
               response_model=MatchRequestSchema,
               responses={
                   200: {"description": "Match request cancelled successfully"},
+                  400: {"model": ErrorResponse, "description": "Bad request - request is already rejected or cancelled"},
                   404: {"model": ErrorResponse, "description": "Match request not found"},
                   401: {"model": ErrorResponse, "description": "Unauthorized - authentication failed"},
                   500: {"model": ErrorResponse, "description": "Internal server error"}
               })
-def cancel_match_request(
+async def cancel_match_request(
     request_id: int = Path(...),
-    current_user: User = Depends(get_current_mentee),  # 멘티만 접근 가능
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_mentee),  # 멘티만 접근 가능
+    db: DbSession = Depends(get_db)
 ):
     """매칭 요청 취소 (멘티 전용)"""
-    # 요청 조회
-    match_request = db.query(MatchRequest).filter(
-        MatchRequest.id == request_id,
-        MatchRequest.mentee_id == current_user.id
-    ).first()
-    
-    if not match_request:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Match request not found"
-        )
-    
-    # 요청 상태를 취소로 변경
-    match_request.status = MatchRequestStatus.CANCELLED
-    db.commit()
-    db.refresh(match_request)
-    
-    return MatchRequestSchema(
-        id=match_request.id,
-        mentorId=match_request.mentor_id,
-        menteeId=match_request.mentee_id,
-        message=match_request.message,
-        status=match_request.status.value
+    match_request = await _update_status(
+        db, request_id, MatchRequest.mentee_id, current_user.id, MatchRequestStatus.CANCELLED
     )
+    await event_bus.publish(_notifications("match_request.cancelled", [match_request]))
+    return _to_schema(match_request)
@@ -1,65 +1,258 @@
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
-from typing import List, Optional
-import json
+from fastapi import APIRouter, Depends, Query, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from sqlalchemy import func, select
+from typing import FrozenSet, List, Optional, Union
+import orjson
 
-from app.core.database import get_db
+from app.core.database import DbSession, get_read_db, open_session
 from app.core.dependencies import get_current_mentee
-from app.models.user import User, UserRole
-from app.schemas.user import MentorListItem, MentorProfileDetails, ErrorResponse
+from app.models.user import User, UserRole, MentorSkill
+from app.schemas.user import MentorListItem, MentorListItemFields, RecommendedMentor, ErrorResponse
+from app.services.principal_cache import Principal
+from app.services.image_store import THUMBNAIL_VARIANT, profile_image_url
+from app.services.mentor_search import build_match_expression, search_subquery
+from app.services.response_cache import CachedResponse, mentor_directory_cache
+from app.services.skills import skill_filter, primary_skill_join_condition, parse_skill_params, normalize_skills
+from app.utils.fields import parse_fields
+from app.utils.pagination import NEXT_CURSOR_HEADER, encode_cursor, keyset_filter
 
 router = APIRouter()
 
+# 페이지 크기 제한
+MAX_PAGE_LIMIT = 100
+# 추천 멘토 최대 개수
+MAX_RECOMMENDATIONS = 50
+# 스트리밍 모드에서 한 번에 가져오는 행 수
+STREAM_BATCH_SIZE = 500
+
+# fields= 로 고를 수 있는 필드 (profile 하위 필드는 이름만 적음, id 는 항상 포함)와 필요한 컬럼
+_MENTOR_FIELD_COLUMNS = {
+    "id": (),
+    "email": (User.email,),
+    "role": (),
+    "name": (User.name,),
+    "bio": (User.bio,),
+    "imageUrl": (User.image_hash, User.image_mime),
+    "skills": (User.skills,),
+    "thumbnailUrl": (User.image_hash, User.image_mime),
+}
+_PROFILE_FIELDS = ("name", "bio", "imageUrl", "skills", "thumbnailUrl")
+
+def _mentor_columns(fields: Optional[FrozenSet[str]] = None):
+    """응답 필드에 필요한 컬럼만 (fields 가 None 이면 전체)"""
+    if fields is None:
+        return (User.id, User.email, User.name, User.bio, User.skills, User.image_hash, User.image_mime)
+    columns = {"id": User.id}
+    for field, field_columns in _MENTOR_FIELD_COLUMNS.items():
+        if field in fields:
+            for column in field_columns:
+                columns[column.key] = column
+    return tuple(columns.values())
+
+def _build_mentor_query(skills: List[str], match_all: bool, search: str,
+                        order_by: Optional[str], cursor: Optional[str],
+                        fields: Optional[FrozenSet[str]] = None):
+    """멘토 목록 쿼리와 키셋 정렬 키 생성 (응답에 쓰지 않는 컬럼은 조회하지 않음)"""
+    query = select(*_mentor_columns(fields)).where(
+        User.role == UserRole.MENTOR
+    )
+
+    # 스킬 필터링 (mentor_skills 인덱스 사용, 대소문자 무시)
+    if skills:
+        query = query.where(skill_filter(skills, match_all=match_all))
+
+    # 전문 검색 (FTS5 색인에서 일치하는 멘토만 id 로 조인)
+    matches = None
+    if search:
+        matches = search_subquery(search)
+        query = query.join(matches, matches.c.mentor_id == User.id)
+
+    # 정렬 키 (마지막 키는 항상 id 로 유일성 보장)
+    if order_by == "name":
+        keys = [User.name, User.id]
+    elif order_by == "skill":
+        # 스킬 기준 정렬 (첫 번째 스킬 기준, 스킬이 없는 멘토는 마지막)
+        query = query.outerjoin(MentorSkill, primary_skill_join_condition())
+        keys = [
+            MentorSkill.skill.is_(None),
+            func.coalesce(MentorSkill.skill, ""),
+            User.name,
+            User.id,
+        ]
+    elif matches is not None:
+        # 검색 시 기본 정렬은 관련도(BM25) 순
+        keys = [matches.c.rank, User.id]
+    else:
+        keys = [User.id]
+
+    condition = keyset_filter(keys, cursor)
+    if condition is not None:
+        query = query.where(condition)
+
+    # 커서 생성을 위해 정렬 키 값도 함께 조회
+    query = query.add_columns(*[key.label(f"sort_key_{i}") for i, key in enumerate(keys)])
+    return query.order_by(*keys), len(keys)
+
+def _to_mentor_item(row) -> dict:
+    """조회 결과 행을 MentorListItem 형태의 dict 로 변환
+
+    목록 응답은 이 dict 를 Pydantic 모델로 다시 만들지 않고 orjson 으로 바로 직렬화하므로
+    필드 구성은 MentorListItem 스키마와 같게 유지한다.
+    """
+    return {
+        "id": row.id,
+        "email": row.email,
+        "role": UserRole.MENTOR.value,
+        "profile": {
+            "name": row.name,
+            "bio": row.bio or "",
+            "imageUrl": profile_image_url("mentor", row.id, row.image_hash, row.image_mime),
+            "skills": orjson.loads(row.skills) if row.skills else [],
+            "thumbnailUrl": (
+                profile_image_url("mentor", row.id, row.image_hash, row.image_mime, THUMBNAIL_VARIANT)
+                if row.image_hash else None
+            ),
+        },
+    }
+
+def _to_partial_mentor_item(row, fields: FrozenSet[str]) -> dict:
+    """fields= 로 요청한 필드만 담은 dict (필드 순서는 MentorListItem 과 같음)"""
+    item = {"id": row.id}
+    if "email" in fields:
+        item["email"] = row.email
+    if "role" in fields:
+        item["role"] = UserRole.MENTOR.value
+    if fields.intersection(_PROFILE_FIELDS):
+        profile = {}
+        if "name" in fields:
+            profile["name"] = row.name
+        if "bio" in fields:
+            profile["bio"] = row.bio or ""
+        if "imageUrl" in fields:
+            profile["imageUrl"] = profile_image_url("mentor", row.id, row.image_hash, row.image_mime)
+        if "skills" in fields:
+            profile["skills"] = orjson.loads(row.skills) if row.skills else []
+        if "thumbnailUrl" in fields:
+            profile["thumbnailUrl"] = (
+                profile_image_url("mentor", row.id, row.image_hash, row.image_mime, THUMBNAIL_VARIANT)
+                if row.image_hash else None
+            )
+        item["profile"] = profile
+    return item
+
+def _sort_values(row, key_count: int) -> list:
+    return [row[-key_count + i] for i in range(key_count)]
+
+async def _stream_mentors(query, fields: Optional[FrozenSet[str]]):
+    """멘토 목록을 NDJSON 으로 스트리밍 (yield_per 로 일정한 메모리 사용)"""
+    # 응답 스트리밍 동안 유지되는 별도 세션 사용
+    async with open_session(read_only=True) as db:
+        result = await db.stream(query.execution_options(yield_per=STREAM_BATCH_SIZE))
+        async for row in result:
+            item = _to_mentor_item(row) if fields is None else _to_partial_mentor_item(row, fields)
+            yield orjson.dumps(item) + b"\n"
+
 @router.get("/mentors",
-           response_model=List[MentorListItem],
+           response_model=Union[List[MentorListItem], List[MentorListItemFields]],
            responses={
-               200: {"description": "Mentor list retrieved successfully"},
+               200: {
+                   "description": "Mentor list retrieved successfully (with fields=, only id and the requested fields are returned)",
+                   "content": {"application/x-ndjson": {}},
+               },
+               400: {"model": ErrorResponse, "description": "Bad request - invalid cursor"},
                401: {"model": ErrorResponse, "description": "Unauthorized - authentication failed"},
                500: {"model": ErrorResponse, "description": "Internal server error"}
            })
-def get_mentors(
-    skill: Optional[str] = Query(None, description="Filter mentors by skill set"),
+async def get_mentors(
+    skill: Optional[List[str]] = Query(None, description="Filter mentors by skill set (repeat or comma-separate for multiple skills)"),
+    q: Optional[str] = Query(None, max_length=200, description="Full-text search over name, bio and skills (prefix match, ranked by relevance unless orderBy is given)"),
+    skillMatch: str = Query("any", enum=["any", "all"], description="Match any (OR) or all (AND) of the given skills"),
     orderBy: Optional[str] = Query(None, enum=["skill", "name"], description="Sort mentors by skill or name"),
-    current_user: User = Depends(get_current_mentee),  # 멘티만 접근 가능
-    db: Session = Depends(get_db)
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_LIMIT, description="Maximum number of mentors per page"),
+    cursor: Optional[str] = Query(None, description=f"Opaque cursor from the {NEXT_CURSOR_HEADER} header of the previous page"),
+    stream: bool = Query(False, description="Stream all matching mentors as NDJSON"),
+    fields: Optional[str] = Query(None, description=f"Comma-separated fields to return ({', '.join(_MENTOR_FIELD_COLUMNS)}); id is always included and profile fields are nested under profile"),
+    current_user: Principal = Depends(get_current_mentee),  # 멘티만 접근 가능
+    db: DbSession = Depends(get_read_db)
 ):
     """멘토 목록 조회 (멘티 전용)"""
-    # 기본 쿼리: 모든 멘토 조회
-    query = db.query(User).filter(User.role == UserRole.MENTOR)
-    
-    # 스킬 필터링
-    if skill:
-        # JSON 배열에서 특정 스킬을 포함하는 멘토 찾기
-        query = query.filter(User.skills.contains(f'"{skill}"'))
-    
-    # 정렬
-    if orderBy == "name":
-        query = query.order_by(User.name)
-    elif orderBy == "skill":
-        # 스킬 기준 정렬 (첫 번째 스킬 기준)
-        query = query.order_by(User.skills)
-    
-    mentors = query.all()
-    
-    # 응답 형식으로 변환
-    mentor_list = []
-    for mentor in mentors:
-        skills = json.loads(mentor.skills) if mentor.skills else []
-        image_url = f"/images/mentor/{mentor.id}"
-        
-        profile_details = MentorProfileDetails(
-            name=mentor.name,
-            bio=mentor.bio or "",
-            imageUrl=image_url,
-            skills=skills
-        )
-        
-        mentor_item = MentorListItem(
-            id=mentor.id,
-            email=mentor.email,
-            role=mentor.role.value,
-            profile=profile_details
-        )
-        mentor_list.append(mentor_item)
-    
-    return mentor_list
+    skills = parse_skill_params(skill)
+    match_all = skillMatch == "all"
+    search = build_match_expression(q or "")
+    selected = parse_fields(fields, tuple(_MENTOR_FIELD_COLUMNS))
+
+    # 커서 오류가 응답 시작 전에 400 으로 처리되도록 쿼리를 먼저 생성
+    query, key_count = _build_mentor_query(skills, match_all, search, orderBy, cursor, selected)
+
+    # 스트리밍 모드: 전체 결과를 메모리에 올리지 않고 NDJSON 으로 전송
+    if stream:
+        if limit:
+            query = query.limit(limit)
+        return StreamingResponse(_stream_mentors(query, selected), media_type="application/x-ndjson")
+
+    async def compute() -> CachedResponse:
+        headers = {}
+        if limit:
+            # 다음 페이지 존재 여부 확인을 위해 한 행 더 조회
+            rows = (await db.execute(query.limit(limit + 1))).all()
+            if len(rows) > limit:
+                rows = rows[:limit]
+                headers[NEXT_CURSOR_HEADER] = encode_cursor(_sort_values(rows[-1], key_count))
+        else:
+            rows = (await db.execute(query)).all()
+
+        # 응답 형식으로 변환 후 직렬화 (캐시에는 직렬화된 본문을 저장)
+        if selected is None:
+            items = [_to_mentor_item(row) for row in rows]
+        else:
+            items = [_to_partial_mentor_item(row, selected) for row in rows]
+        return CachedResponse(orjson.dumps(items), headers)
+
+    # 같은 조건의 목록은 멘토 정보가 바뀌기 전까지 직렬화된 응답을 재사용
+    cache_key = (
+        tuple(sorted(normalize_skills(skills))), match_all, search, orderBy, limit, cursor,
+        tuple(sorted(selected)) if selected is not None else None,
+    )
+    cached = await mentor_directory_cache.get_or_compute(cache_key, compute)
+    return Response(cached.body, media_type="application/json", headers=cached.headers)
+
+@router.get("/mentors/recommended",
+           response_model=List[RecommendedMentor],
+           responses={
+               200: {"description": "Recommended mentors retrieved successfully"},
+               401: {"model": ErrorResponse, "description": "Unauthorized - authentication failed"},
+               500: {"model": ErrorResponse, "description": "Internal server error"}
+           })
+async def get_recommended_mentors(
+    limit: int = Query(10, ge=1, le=MAX_RECOMMENDATIONS, description="Maximum number of mentors to recommend"),
+    current_user: Principal = Depends(get_current_mentee),  # 멘티만 접근 가능
+    db: DbSession = Depends(get_read_db)
+):
+    """멘티 소개와 스킬/소개가 비슷한 멘토 추천 (멘티 전용)
+
+    이미 수락된 매칭이 있는 멘토와 관련도가 0 인 멘토는 제외한다.
+    소개가 비어 있으면 빈 목록을 반환한다.
+    """
+    # NumPy 를 쓰는 추천 색인은 워커 시작을 늦추지 않도록 첫 추천 요청 때 로드
+    from app.services.recommender import mentor_recommender
+
+    bio = await db.scalar(select(User.bio).where(User.id == current_user.id))
+    recommendations = await mentor_recommender.recommend(db, bio or "", limit)
+    if not recommendations:
+        return ORJSONResponse([])
+
+    rows = (await db.execute(
+        select(*_mentor_columns()).where(User.id.in_([r.mentor_id for r in recommendations]))
+    )).all()
+    rows_by_id = {row.id: row for row in rows}
+
+    mentors = []
+    for recommendation in recommendations:
+        row = rows_by_id.get(recommendation.mentor_id)
+        if row is None:
+            continue
+        item = _to_mentor_item(row)
+        item["score"] = recommendation.score
+        item["matchedSkills"] = recommendation.matched_skills
+        mentors.append(item)
+    return ORJSONResponse(mentors)
@@ -0,0 +1,126 @@
+import sys
+
+from fastapi import APIRouter, Response
+
+from app.core.database import pool_stats
+from app.core.metrics import registry
+from app.services.admission import admission_controller
+from app.services.events import event_bus
+from app.services.image_pool import image_pool
+from app.services.principal_cache import principal_cache
+from app.services.response_cache import mentor_directory_cache
+from app.utils.auth import password_pool
+
+router = APIRouter()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _worker_pool_metrics():
+    """이미지 처리/비밀번호 해싱 풀 통계"""
+    stats = [(pool.name, pool.stats()) for pool in (image_pool, password_pool)]
+    yield ("worker_pool_pending", "Tasks queued or running in the worker pool", "gauge",
+           [({"pool": name}, s["pending"]) for name, s in stats])
+    yield ("worker_pool_rejected_total", "Tasks rejected because the pool was saturated", "counter",
+           [({"pool": name}, s["rejected"]) for name, s in stats])
+    yield ("worker_pool_failed_total", "Tasks that raised an error", "counter",
+           [({"pool": name}, s["failed"]) for name, s in stats])
+    yield ("worker_pool_queue_wait_seconds_total", "Total time tasks waited for a worker", "counter",
+           [({"pool": name}, s["queue_wait"]["total_seconds"]) for name, s in stats])
+    yield ("worker_pool_processing_seconds_total", "Total time spent running tasks", "counter",
+           [({"pool": name}, s["processing"]["total_seconds"]) for name, s in stats])
+    yield ("worker_pool_completed_total", "Tasks completed by the worker pool", "counter",
+           [({"pool": name}, s["processing"]["count"]) for name, s in stats])
+
+
+def _principal_cache_metrics():
+    stats = principal_cache.stats()
+    yield ("principal_cache_size", "Cached authenticated principals", "gauge", [({}, stats["size"])])
+    yield ("principal_cache_hits_total", "Principal cache hits", "counter", [({}, stats["hits"])])
+    yield ("principal_cache_misses_total", "Principal cache misses", "counter", [({}, stats["misses"])])
+
+
+def _db_pool_metrics():
+    stats = pool_stats()
+    yield ("db_pool_checked_out", "Database connections currently in use", "gauge",
+           [({"engine": role, "driver": driver}, s["checked_out"]) for (role, driver), s in stats.items()])
+    yield ("db_pool_size", "Database connection pool size", "gauge",
+           [({"engine": role, "driver": driver}, s["size"]) for (role, driver), s in stats.items()])
+
+
+def _event_metrics():
+    labels = {"backend": event_bus.backend_name}
+    yield ("events_subscribers", "Open event stream connections", "gauge",
+           [(labels, event_bus.subscriber_count())])
+    yield ("events_published_total", "Events published by this worker", "counter",
+           [(labels, event_bus.published)])
+    yield ("events_delivered_total", "Events queued to connections on this worker", "counter",
+           [(labels, event_bus.delivered)])
+    yield ("events_dropped_total", "Events dropped because a connection fell behind", "counter",
+           [(labels, event_bus.dropped)])
+
+
+def _response_cache_metrics():
+    """직렬화된 응답 캐시 통계"""
+    stats = [(cache.name, cache.stats()) for cache in (mentor_directory_cache,)]
+    yield ("response_cache_entries", "Responses held in the cache", "gauge",
+           [({"cache": name}, s["size"]) for name, s in stats])
+    yield ("response_cache_bytes", "Serialized bytes held in the cache", "gauge",
+           [({"cache": name}, s["bytes"]) for name, s in stats])
+    yield ("response_cache_generation", "Invalidation generation of the cache", "gauge",
+           [({"cache": name}, s["generation"]) for name, s in stats])
+    yield ("response_cache_hits_total", "Requests served from the cache", "counter",
+           [({"cache": name}, s["hits"]) for name, s in stats])
+    yield ("response_cache_misses_total", "Requests that computed the response", "counter",
+           [({"cache": name}, s["misses"]) for name, s in stats])
+    yield ("response_cache_coalesced_total", "Requests that waited for a concurrent computation", "counter",
+           [({"cache": name}, s["coalesced"]) for name, s in stats])
+
+
+def _recommender_metrics():
+    # 추천 모듈은 첫 추천 요청 때 로드되므로 그 전에는 보고하지 않음
+    recommender = sys.modules.get("app.services.recommender")
+    if recommender is None:
+        return
+    stats = recommender.mentor_recommender.stats()
+    yield ("recommender_mentors", "Mentors in the in-process recommendation index", "gauge", [({}, stats["mentors"])])
+    yield ("recommender_skills", "Distinct skills in the recommendation index", "gauge", [({}, stats["skills"])])
+
+
+def _admission_metrics():
+    """요청 허용 제어/속도 제한 통계"""
+    stats = admission_controller.stats()
+    classes = stats["classes"].items()
+    yield ("admission_in_flight", "Requests holding a concurrency slot", "gauge",
+           [({"class": name}, s["active"]) for name, s in classes])
+    yield ("admission_queued", "Requests waiting for a concurrency slot", "gauge",
+           [({"class": name}, s["queued"]) for name, s in classes])
+    yield ("admission_limit", "Concurrency limit of the route class", "gauge",
+           [({"class": name}, s["limit"]) for name, s in classes])
+    yield ("admission_admitted_total", "Requests admitted", "counter",
+           [({"class": name}, s["admitted"]) for name, s in classes])
+    yield ("admission_shed_total", "Requests rejected with 503 by admission control", "counter",
+           [({"class": name, "reason": reason}, s[reason])
+            for name, s in classes for reason in ("queue_full", "queue_timeout")])
+    yield ("admission_queue_wait_seconds_total", "Total time requests waited for a concurrency slot", "counter",
+           [({"class": name}, s["queue_wait_seconds"]) for name, s in classes])
+    rate_limits = stats["rate_limits"].items()
+    yield ("rate_limit_keys", "Tracked token buckets", "gauge",
+           [({"scope": name}, s["keys"]) for name, s in rate_limits])
+    yield ("rate_limited_total", "Requests rejected with 429 by rate limiting", "counter",
+           [({"scope": name}, s["limited"]) for name, s in rate_limits])
+
+
+registry.register_collector(_worker_pool_metrics)
+registry.register_collector(_principal_cache_metrics)
+registry.register_collector(_db_pool_metrics)
+registry.register_collector(_event_metrics)
+registry.register_collector(_response_cache_metrics)
+registry.register_collector(_recommender_metrics)
+registry.register_collector(_admission_metrics)
+
+
+@router.get("/metrics", include_in_schema=False)
+def get_metrics():
+    """Prometheus 형식 지표 (워커 프로세스별 값)"""
+    return Response(registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
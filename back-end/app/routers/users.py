@@ -1,15 +1,26 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Response
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response
+from fastapi.responses import FileResponse
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from typing import Union
+from typing import Optional, Union
 import json
-import base64
-import io
-from PIL import Image
 
-from app.core.database import get_db
-from app.core.dependencies import get_current_user
+from app.core.config import settings
+from app.core.database import DbSession, get_db, get_read_db
+from app.core.dependencies import get_current_user, get_current_user_readonly
 from app.models.user import User, UserRole
+from app.services.bounded_pool import PoolSaturated
+from app.services.image_pool import image_pool
+from app.services.image_processing import (
+    ImageValidationError, ProcessedImage, process_image_bytes, process_profile_image
+)
+from app.services.image_upload import UploadTooLarge, read_image_upload
+from app.services.image_store import (
+    THUMBNAIL_VARIANT, find_image, find_variant, profile_image_url, variant_mime
+)
+from app.services.principal_cache import principal_cache
+from app.services.response_cache import mentor_directory_changed
+from app.services.skills import sync_mentor_skills
 from app.schemas.user import (
     MentorProfile, MenteeProfile, MentorProfileDetails, MenteeProfileDetails,
     UpdateMentorProfileRequest, UpdateMenteeProfileRequest, ErrorResponse
@@ -17,6 +28,24 @@ from app.schemas.user import (
 
 router = APIRouter()
 
+# 버전 URL(콘텐츠 해시 포함) 이미지는 내용이 바뀌지 않으므로 영구 캐시
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# 사용자별 URL 이미지는 바뀔 수 있으므로 매번 재검증
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match 헤더가 주어진 ETag 와 일치하는지 확인"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return etag in candidates or f"W/{etag}" in candidates
+
+def _not_modified(etag: str, cache_control: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": cache_control})
+
 @router.get("/me",
            response_model=Union[MentorProfile, MenteeProfile],
            responses={
@@ -24,9 +53,19 @@ router = APIRouter()
                401: {"model": ErrorResponse, "description": "Unauthorized - authentication failed"},
                500: {"model": ErrorResponse, "description": "Internal server error"}
            })
-def get_current_user_info(current_user: User = Depends(get_current_user)):
+async def get_current_user_info(current_user: User = Depends(get_current_user_readonly)):
     """현재 인증된 사용자 정보 조회"""
-    image_url = f"/images/{current_user.role.value}/{current_user.id}"
+    return _build_profile(current_user)
+
+def _build_profile(current_user: User) -> Union[MentorProfile, MenteeProfile]:
+    """사용자 행으로부터 프로필 응답 생성"""
+    role = current_user.role.value
+    image_url = profile_image_url(role, current_user.id, current_user.image_hash, current_user.image_mime)
+    thumbnail_url = None
+    if current_user.image_hash:
+        thumbnail_url = profile_image_url(
+            role, current_user.id, current_user.image_hash, current_user.image_mime, THUMBNAIL_VARIANT
+        )
     
     if current_user.role == UserRole.MENTOR:
         skills = json.loads(current_user.skills) if current_user.skills else []
@@ -34,7 +73,8 @@ def get_current_user_info(current_user: User = Depends(get_current_user)):
             name=current_user.name,
             bio=current_user.bio or "",
             imageUrl=image_url,
-            skills=skills
+            skills=skills,
+            thumbnailUrl=thumbnail_url
         )
         return MentorProfile(
             id=current_user.id,
@@ -46,7 +86,8 @@ def get_current_user_info(current_user: User = Depends(get_current_user)):
         profile_details = MenteeProfileDetails(
             name=current_user.name,
             bio=current_user.bio or "",
-            imageUrl=image_url
+            imageUrl=image_url,
+            thumbnailUrl=thumbnail_url
         )
         return MenteeProfile(
             id=current_user.id,
@@ -61,12 +102,13 @@ def get_current_user_info(current_user: User = Depends(get_current_user)):
                200: {"description": "Profile updated successfully"},
                400: {"model": ErrorResponse, "description": "Bad request - invalid payload format"},
                401: {"model": ErrorResponse, "description": "Unauthorized - authentication failed"},
-               500: {"model": ErrorResponse, "description": "Internal server error"}
+               500: {"model": ErrorResponse, "description": "Internal server error"},
+               503: {"model": ErrorResponse, "description": "Image processing is saturated - retry later"}
            })
-def update_profile(
+async def update_profile(
     profile_data: Union[UpdateMentorProfileRequest, UpdateMenteeProfileRequest],
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: DbSession = Depends(get_db)
 ):
     """사용자 프로필 업데이트"""
     # 사용자 ID 확인
@@ -76,80 +118,176 @@ def update_profile(
             detail="Cannot update other user's profile"
         )
     
-    # 프로필 정보 업데이트
+    # 이미지 처리 (Base64 디코딩, 검증, 크롭, 저장) - 요청 스레드 대신 프로세스 풀에서 실행
+    processed = None
+    if profile_data.image:
+        processed = await _process_image(process_profile_image, profile_data.image)
+    
+    # 관계(mentor_skills) 갱신이 포함되므로 동기 ORM 컨텍스트에서 실행
+    profile = await db.run_sync(_apply_profile_update, current_user, profile_data, processed)
+    if current_user.role == UserRole.MENTOR:
+        await mentor_directory_changed([current_user.id])
+    return profile
+
+async def _process_image(fn, *args) -> ProcessedImage:
+    """이미지 처리 풀에서 실행하고 오류를 HTTP 응답으로 변환"""
+    try:
+        return await image_pool.run(fn, *args)
+    except PoolSaturated as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Image processing is busy, please retry later",
+            headers={"Retry-After": str(e.retry_after)}
+        )
+    except ImageValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+def _apply_profile_update(
+    db: Session,
+    current_user: User,
+    profile_data: Union[UpdateMentorProfileRequest, UpdateMenteeProfileRequest],
+    processed: Optional[ProcessedImage]
+):
+    """프로필 정보 DB 반영"""
     current_user.name = profile_data.name
     current_user.bio = profile_data.bio
     
-    # 이미지 처리 (Base64 디코딩 및 저장)
-    if profile_data.image:
-        try:
-            # Base64 이미지 디코딩
-            image_data = base64.b64decode(profile_data.image)
-            
-            # 이미지 검증 및 리사이즈
-            image = Image.open(io.BytesIO(image_data))
-            if image.format not in ['JPEG', 'PNG']:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Only JPEG and PNG images are allowed"
-                )
-            
-            # 이미지 크기 제한 확인 (500x500 ~ 1000x1000)
-            width, height = image.size
-            if width < 500 or height < 500 or width > 1000 or height > 1000:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Image size must be between 500x500 and 1000x1000 pixels"
-                )
-            
-            # 정사각형으로 크롭
-            min_dimension = min(width, height)
-            left = (width - min_dimension) / 2
-            top = (height - min_dimension) / 2
-            right = (width + min_dimension) / 2
-            bottom = (height + min_dimension) / 2
-            image = image.crop((left, top, right, bottom))
-            
-            # 이미지를 바이트로 변환
-            img_byte_arr = io.BytesIO()
-            image.save(img_byte_arr, format=image.format)
-            img_byte_arr = img_byte_arr.getvalue()
-            
-            # 파일 크기 확인 (1MB 제한)
-            if len(img_byte_arr) > 1024 * 1024:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Image size must be less than 1MB"
-                )
-            
-            current_user.image_data = img_byte_arr
-            current_user.image_filename = f"profile_{current_user.id}.{image.format.lower()}"
-            
-        except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid image data: {str(e)}"
-            )
+    if processed:
+        _set_profile_image(current_user, processed)
     
-    # 멘토인 경우 스킬 업데이트
+    # 멘토인 경우 스킬 업데이트 (mentor_skills 테이블 동기화)
     if isinstance(profile_data, UpdateMentorProfileRequest):
-        current_user.skills = json.dumps(profile_data.skills)
+        sync_mentor_skills(current_user, profile_data.skills)
     
     db.commit()
     db.refresh(current_user)
     
+    # 이름 등이 바뀌었으므로 캐시된 인증 정보 무효화
+    principal_cache.invalidate_user(current_user.id)
+    
     # 업데이트된 프로필 반환
-    return get_current_user_info(current_user)
+    return _build_profile(current_user)
+
+def _set_profile_image(user: User, processed: ProcessedImage) -> None:
+    """콘텐츠 해시 기반 파일 저장소에 저장된 이미지의 메타데이터만 DB에 기록"""
+    user.image_hash = processed.hash
+    user.image_mime = processed.mime
+    user.image_size = processed.size
+    user.image_filename = f"profile_{user.id}.{processed.format.lower()}"
+
+async def _apply_image_update(db: DbSession, current_user: User, processed: ProcessedImage):
+    """프로필 이미지 DB 반영"""
+    _set_profile_image(current_user, processed)
+    await db.commit()
+    await db.refresh(current_user)
+    # 멘토 목록의 이미지 URL 이 바뀌므로 목록 캐시 무효화
+    if current_user.role == UserRole.MENTOR:
+        await mentor_directory_changed([current_user.id])
+    return _build_profile(current_user)
+
+@router.put("/profile/image",
+           response_model=Union[MentorProfile, MenteeProfile],
+           responses={
+               200: {"description": "Profile image updated successfully"},
+               400: {"model": ErrorResponse, "description": "Bad request - invalid image"},
+               401: {"model": ErrorResponse, "description": "Unauthorized - authentication failed"},
+               413: {"model": ErrorResponse, "description": "Image upload too large"},
+               500: {"model": ErrorResponse, "description": "Internal server error"},
+               503: {"model": ErrorResponse, "description": "Image processing is saturated - retry later"}
+           },
+           openapi_extra={
+               "requestBody": {
+                   "required": True,
+                   "content": {
+                       "multipart/form-data": {
+                           "schema": {
+                               "type": "object",
+                               "properties": {"image": {"type": "string", "format": "binary"}},
+                               "required": ["image"]
+                           }
+                       },
+                       "image/jpeg": {"schema": {"type": "string", "format": "binary"}},
+                       "image/png": {"schema": {"type": "string", "format": "binary"}}
+                   }
+               }
+           })
+async def upload_profile_image(
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: DbSession = Depends(get_db)
+):
+    """프로필 이미지 업로드 (multipart/form-data 또는 image/jpeg, image/png 본문)
+
+    본문을 스트리밍으로 읽으면서 크기 제한과 이미지 헤더(포맷/크기)를 먼저 확인하므로
+    잘못된 업로드는 전체를 받거나 디코딩하기 전에 거부된다.
+    """
+    try:
+        image_data = await read_image_upload(
+            request.headers.get("content-type"),
+            request.headers.get("content-length"),
+            request.stream(),
+            settings.IMAGE_MAX_UPLOAD_BYTES
+        )
+    except UploadTooLarge:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Image upload must be at most {settings.IMAGE_MAX_UPLOAD_BYTES} bytes"
+        )
+    except ImageValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    processed = await _process_image(process_image_bytes, image_data)
+    return await _apply_image_update(db, current_user, processed)
+
+@router.get("/images/v/{image_hash}/{variant}",
+           responses={
+               200: {"description": "Profile image rendition retrieved successfully"},
+               304: {"description": "Not modified"},
+               404: {"model": ErrorResponse, "description": "Image not found"},
+               500: {"model": ErrorResponse, "description": "Internal server error"}
+           })
+def get_image_variant(image_hash: str, variant: str, request: Request):
+    """버전 URL 프로필 이미지 조회 (콘텐츠 해시 기반, DB 조회 없음)
+
+    variant: orig.<ext> 또는 <size>.<ext> (size: 64, 128, 500 / ext: 원본 포맷 또는 webp)
+    """
+    etag = f'"{image_hash}-{variant}"'
+    if _etag_matches(request, etag):
+        return _not_modified(etag, IMMUTABLE_CACHE_CONTROL)
+
+    path = find_variant(image_hash, variant)
+    if path is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Image not found"
+        )
+
+    return FileResponse(
+        path,
+        media_type=variant_mime(variant),
+        headers={"ETag": etag, "Cache-Control": IMMUTABLE_CACHE_CONTROL}
+    )
 
 @router.get("/images/{role}/{user_id}",
            responses={
                200: {"description": "Profile image retrieved successfully"},
+               304: {"description": "Not modified"},
                401: {"model": ErrorResponse, "description": "Unauthorized - authentication failed"},
                500: {"model": ErrorResponse, "description": "Internal server error"}
            })
-def get_profile_image(role: str, user_id: int, db: Session = Depends(get_db)):
+async def get_profile_image(role: str, user_id: int, request: Request, db: DbSession = Depends(get_read_db)):
     """프로필 이미지 조회"""
-    user = db.query(User).filter(User.id == user_id, User.role == UserRole(role)).first()
+    # 이미지 메타데이터만 조회
+    result = await db.execute(
+        select(User.image_hash, User.image_mime).where(User.id == user_id, User.role == UserRole(role))
+    )
+    user = result.first()
     
     if not user:
         raise HTTPException(
@@ -157,9 +295,18 @@ def get_profile_image(role: str, user_id: int, db: Session = Depends(get_db)):
             detail="User not found"
         )
     
-    if user.image_data:
-        # 데이터베이스에서 이미지 반환
-        return Response(content=user.image_data, media_type="image/jpeg")
+    etag = f'"{user.image_hash}"'
+    if user.image_hash and _etag_matches(request, etag):
+        return _not_modified(etag, REVALIDATE_CACHE_CONTROL)
+
+    path = find_image(user.image_hash, user.image_mime)
+    if path:
+        # 파일 저장소에서 이미지 반환 (sendfile 지원 서버에서는 zero-copy 전송)
+        return FileResponse(
+            path,
+            media_type=user.image_mime,
+            headers={"ETag": etag, "Cache-Control": REVALIDATE_CACHE_CONTROL}
+        )
     else:
         # 기본 이미지 URL로 리다이렉트
         placeholder_url = f"https://placehold.co/500x500.jpg?text={role.upper()}"
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
 from typing import Optional, List
 from datetime import datetime
 from enum import Enum
@@ -35,12 +35,14 @@ class MentorProfileDetails(BaseModel):
     bio: str
     imageUrl: str
     skills: List[str]
+    thumbnailUrl: Optional[str] = None  # 목록용 썸네일 (버전 URL, 이미지가 있을 때만)
 
 # 프로필 세부정보 - 멘티
 class MenteeProfileDetails(BaseModel):
     name: str
     bio: str
     imageUrl: str
+    thumbnailUrl: Optional[str] = None  # 목록용 썸네일 (버전 URL, 이미지가 있을 때만)
 
 # 멘토 프로필
 class MentorProfile(BaseModel):
@@ -80,6 +82,26 @@ class MentorListItem(BaseModel):
     role: UserRole
     profile: MentorProfileDetails
 
+# 멘토 프로필 세부정보 - fields= 로 일부만 요청한 경우 (요청한 필드만 포함)
+class MentorProfileDetailsFields(BaseModel):
+    name: Optional[str] = None
+    bio: Optional[str] = None
+    imageUrl: Optional[str] = None
+    skills: Optional[List[str]] = None
+    thumbnailUrl: Optional[str] = None
+
+# 멘토 목록 아이템 - fields= 로 일부만 요청한 경우 (id 는 항상 포함)
+class MentorListItemFields(BaseModel):
+    id: int
+    email: Optional[EmailStr] = None
+    role: Optional[UserRole] = None
+    profile: Optional[MentorProfileDetailsFields] = None
+
+# 추천 멘토 (점수 높은 순)
+class RecommendedMentor(MentorListItem):
+    score: float  # 0~1, 스킬과 소개 유사도
+    matchedSkills: List[str]  # 멘티 소개에 등장한 멘토 스킬 (정규화된 이름)
+
 # 매칭 요청 생성
 class MatchRequestCreate(BaseModel):
     mentorId: int
@@ -101,6 +123,76 @@ class MatchRequestOutgoing(BaseModel):
     menteeId: int
     status: MatchRequestStatus
 
+# 매칭 요청 상대방 요약 (목록에 포함, embed=true)
+class CounterpartSummary(BaseModel):
+    id: int
+    name: str
+    imageUrl: str
+    thumbnailUrl: Optional[str] = None
+    skills: Optional[List[str]] = None  # 상대방이 멘토인 경우만
+
+# 받은 매칭 요청 (멘티 요약 포함 가능)
+class MatchRequestIncoming(MatchRequest):
+    mentee: Optional[CounterpartSummary] = None
+
+# 보낸 매칭 요청 (멘토 요약 포함 가능)
+class MatchRequestOutgoingDetail(MatchRequestOutgoing):
+    mentor: Optional[CounterpartSummary] = None
+
+# 받은 매칭 요청 - fields= 로 일부만 요청한 경우 (id 는 항상 포함)
+class MatchRequestIncomingFields(BaseModel):
+    id: int
+    mentorId: Optional[int] = None
+    menteeId: Optional[int] = None
+    message: Optional[str] = None
+    status: Optional[MatchRequestStatus] = None
+    mentee: Optional[CounterpartSummary] = None
+
+# 보낸 매칭 요청 - fields= 로 일부만 요청한 경우 (id 는 항상 포함)
+class MatchRequestOutgoingFields(BaseModel):
+    id: int
+    mentorId: Optional[int] = None
+    menteeId: Optional[int] = None
+    status: Optional[MatchRequestStatus] = None
+    mentor: Optional[CounterpartSummary] = None
+
+# 매칭 요청 일괄 거절
+class MatchRequestBulkReject(BaseModel):
+    ids: List[int] = Field(min_length=1, max_length=500)
+
+# 매칭 요청 일괄 처리 결과
+class MatchRequestBulkResult(BaseModel):
+    updated: List[MatchRequest]
+    notPending: List[int]  # 이미 수락/거절/취소되어 변경하지 않은 요청 ID
+    notFound: List[int]  # 존재하지 않거나 다른 멘토의 요청 ID
+
+# 사용자 대량 가져오기 행 (CSV/NDJSON 한 줄)
+class ImportUserRow(BaseModel):
+    email: EmailStr
+    password: str
+    name: str
+    role: UserRole
+    bio: str = ""
+    skills: List[str] = []  # 멘토만 사용 (CSV 에서는 ";" 로 구분)
+    image: Optional[str] = None  # Base64 encoded image
+    imagePath: Optional[str] = None  # CLI 전용: 가져오기 파일 기준 상대 경로
+
+# 대량 가져오기 행 오류
+class ImportRowError(BaseModel):
+    line: int
+    email: Optional[str] = None
+    error: str
+
+# 대량 가져오기 결과
+class ImportUsersResponse(BaseModel):
+    total: int
+    created: int
+    skipped: int  # 이미 가입된 이메일
+    duplicates: int  # 파일 안에서 중복된 이메일
+    failed: int
+    errors: List[ImportRowError]  # 최대 100건
+    seconds: float
+
 # 에러 응답
 class ErrorResponse(BaseModel):
     error: str
@@ -0,0 +1,207 @@
+import asyncio
+import math
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, Optional
+
+from app.core.config import settings
+
+# 라우트 분류 (경로 접두사 기준, 먼저 일치하는 항목 사용)
+ROUTE_CLASS_AUTH = "auth"
+ROUTE_CLASS_DIRECTORY = "directory"
+ROUTE_CLASS_DEFAULT = "default"
+
+_ROUTE_PREFIXES = (
+    ("/api/login", ROUTE_CLASS_AUTH),
+    ("/api/signup", ROUTE_CLASS_AUTH),
+    ("/api/mentors", ROUTE_CLASS_DIRECTORY),
+)
+
+# 동시 실행 제한/속도 제한에서 제외하는 경로 (지표 수집, 장시간 연결인 SSE)
+_EXEMPT_PREFIXES = ("/metrics", "/api/events")
+
+
+def classify(path: str) -> Optional[str]:
+    """요청 경로의 라우트 분류 (제외 대상이면 None)"""
+    if path.startswith(_EXEMPT_PREFIXES):
+        return None
+    for prefix, route_class in _ROUTE_PREFIXES:
+        if path.startswith(prefix):
+            return route_class
+    return ROUTE_CLASS_DEFAULT
+
+
+class Rejected(Exception):
+    """요청 거부 (503 또는 429 응답으로 변환됨)"""
+
+    def __init__(self, status_code: int, reason: str, retry_after: int):
+        super().__init__(reason)
+        self.status_code = status_code
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class ConcurrencyLimit:
+    """라우트 분류 하나의 동시 실행 제한 (FIFO 대기열 + 대기 시간 기준 부하 차단)
+
+    실행 중인 요청이 limit 에 도달하면 뒤의 요청은 대기열에서 기다리고, max_queue_seconds
+    안에 차례가 오지 않거나 대기열이 max_queue 만큼 차 있으면 곧바로 503 으로 거부한다.
+    처리되는 요청의 지연시간이 (대기 시간 상한 + 처리 시간) 으로 제한되도록 하기 위함이다.
+    이벤트 루프에서만 호출된다.
+    """
+
+    def __init__(self, name: str, limit: int, max_queue: int, max_queue_seconds: float, retry_after: int):
+        self.name = name
+        self.limit = limit
+        self.max_queue = max_queue
+        self.max_queue_seconds = max_queue_seconds
+        self.retry_after = retry_after
+        self.active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self.admitted = 0
+        self.queue_full = 0
+        self.queue_timeout = 0
+        self.queue_wait_total = 0.0
+
+    async def acquire(self) -> None:
+        """실행 슬롯 획득 (거부 시 Rejected)"""
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            self.admitted += 1
+            return
+        if len(self._waiters) >= self.max_queue:
+            self.queue_full += 1
+            raise Rejected(503, "queue_full", self.retry_after)
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(waiter, self.max_queue_seconds)
+        except asyncio.TimeoutError:
+            # Python 3.12+ 의 wait_for 는 슬롯을 넘겨받은 직후에도 시간 초과를 낼 수 있으므로
+            # 이미 넘겨받았으면 그대로 허용 (거부하면 넘겨받은 슬롯이 반환되지 않음)
+            if not waiter.done() or waiter.cancelled():
+                self.queue_timeout += 1
+                raise Rejected(503, "queue_timeout", self.retry_after) from None
+        except asyncio.CancelledError:
+            # 슬롯을 넘겨받은 직후 취소되었으면 다음 대기자에게 돌려줌
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+        finally:
+            if not waiter.done() or waiter.cancelled():
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+            self.queue_wait_total += time.perf_counter() - started
+        self.admitted += 1
+
+    def release(self) -> None:
+        """슬롯 반환 (대기자가 있으면 카운트를 줄이지 않고 바로 넘겨줌)"""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "active": self.active,
+            "queued": len(self._waiters),
+            "admitted": self.admitted,
+            "queue_full": self.queue_full,
+            "queue_timeout": self.queue_timeout,
+            "queue_wait_seconds": round(self.queue_wait_total, 6),
+        }
+
+
+class TokenBucketLimiter:
+    """키(사용자 ID, 클라이언트 IP)별 토큰 버킷 (초당 rate 개 충전, 최대 burst 개)
+
+    버킷 수는 max_keys 로 제한하며 오래 쓰이지 않은 키부터 제거한다 (제거된 키는 가득 찬 버킷으로 다시 시작).
+    """
+
+    def __init__(self, name: str, rate: float, burst: int, max_keys: int):
+        self.name = name
+        self.rate = rate
+        self.burst = burst
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[Any, list]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.limited = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.rate > 0 and self.burst > 0
+
+    def check(self, key: Any) -> None:
+        """토큰 하나 사용 (부족하면 다음 토큰까지의 시간을 Retry-After 로 담아 Rejected(429))"""
+        if not self.enabled:
+            return
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = [float(self.burst), now]
+                self._buckets[key] = bucket
+                if len(self._buckets) > self.max_keys:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(key)
+                bucket[0] = min(float(self.burst), bucket[0] + (now - bucket[1]) * self.rate)
+                bucket[1] = now
+            if bucket[0] >= 1.0:
+                bucket[0] -= 1.0
+                return
+            self.limited += 1
+            retry_after = max(1, math.ceil((1.0 - bucket[0]) / self.rate))
+        raise Rejected(429, f"{self.name}_rate_limited", retry_after)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"keys": len(self._buckets), "limited": self.limited}
+
+
+class AdmissionController:
+    """프로세스 내 요청 허용 제어 (라우트 분류별 동시 실행 제한 + IP/사용자별 속도 제한)"""
+
+    def __init__(self):
+        max_queue_seconds = settings.ADMISSION_MAX_QUEUE_MS / 1000
+        self.enabled = settings.ADMISSION_ENABLED
+        self.limits: Dict[str, ConcurrencyLimit] = {
+            name: ConcurrencyLimit(
+                name, limit, settings.ADMISSION_MAX_QUEUE, max_queue_seconds, settings.ADMISSION_RETRY_AFTER
+            )
+            for name, limit in (
+                (ROUTE_CLASS_AUTH, settings.ADMISSION_AUTH_CONCURRENCY),
+                (ROUTE_CLASS_DIRECTORY, settings.ADMISSION_DIRECTORY_CONCURRENCY),
+                (ROUTE_CLASS_DEFAULT, settings.ADMISSION_DEFAULT_CONCURRENCY),
+            )
+        }
+        self.ip_limiter = TokenBucketLimiter(
+            "ip", settings.RATE_LIMIT_IP_PER_SECOND, settings.RATE_LIMIT_IP_BURST, settings.RATE_LIMIT_MAX_KEYS
+        )
+        self.user_limiter = TokenBucketLimiter(
+            "user", settings.RATE_LIMIT_USER_PER_SECOND, settings.RATE_LIMIT_USER_BURST, settings.RATE_LIMIT_MAX_KEYS
+        )
+
+    def check_user(self, user_id: int) -> None:
+        """인증된 사용자별 속도 제한 (초과 시 Rejected(429))"""
+        if self.enabled:
+            self.user_limiter.check(user_id)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "classes": {name: limit.stats() for name, limit in self.limits.items()},
+            "rate_limits": {
+                limiter.name: limiter.stats() for limiter in (self.ip_limiter, self.user_limiter)
+            },
+        }
+
+
+admission_controller = AdmissionController()
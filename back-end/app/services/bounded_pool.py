@@ -0,0 +1,137 @@
+import asyncio
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+
+class PoolSaturated(Exception):
+    """작업 대기열이 가득 참 (503 응답으로 변환됨)"""
+
+    def __init__(self, pool_name: str, retry_after: int):
+        super().__init__(f"{pool_name} pool is saturated")
+        self.pool_name = pool_name
+        self.retry_after = retry_after
+
+
+class _Timing:
+    """처리 시간 누적 통계"""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "total_seconds": round(self.total, 6),
+            "avg_seconds": round(self.total / self.count, 6) if self.count else 0.0,
+            "max_seconds": round(self.max, 6),
+        }
+
+
+def _timed_call(fn: Callable, *args: Any):
+    """워커 프로세스에서 실행: 대기 시간 측정을 위해 시작/종료 시각을 함께 반환"""
+    started_at = time.time()
+    result = fn(*args)
+    return result, started_at, time.time()
+
+
+class BoundedPool:
+    """CPU 작업용 전용 실행기 (대기열 길이 제한 + 지표 수집)
+
+    요청 처리 스레드풀을 점유하지 않도록 CPU 작업을 별도 프로세스(kind="process") 또는
+    전용 스레드(kind="thread", GIL 을 해제하는 작업용)에서 실행하고,
+    대기 중인 작업이 max_pending 에 도달하면 즉시 PoolSaturated 를 발생시킨다.
+    """
+
+    def __init__(self, name: str, kind: str, workers: int, max_pending: int, retry_after: int):
+        self.name = name
+        self.kind = kind
+        self.workers = workers
+        self.max_pending = max_pending
+        self.retry_after = retry_after
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self.rejected = 0
+        self.failed = 0
+        self.queue_wait = _Timing()
+        self.processing = _Timing()
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                if self.kind == "process":
+                    # fork 는 요청 처리 스레드가 있는 프로세스에서 안전하지 않으므로 spawn 사용
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+                else:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.workers,
+                        thread_name_prefix=f"{self.name}-pool",
+                    )
+            return self._executor
+
+    def _acquire(self) -> None:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self.rejected += 1
+                raise PoolSaturated(self.name, self.retry_after)
+            self._pending += 1
+
+    def _release(self) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    async def run(self, fn: Callable, *args: Any) -> Any:
+        """풀에서 fn(*args) 실행 (대기열이 가득 차면 PoolSaturated)
+
+        대기 슬롯은 작업이 실제로 끝날 때 반환한다. 요청이 취소되어도 이미 시작된 작업은
+        계속 실행되므로, 코루틴 종료 시점에 반환하면 pending 이 실제 작업 수보다 작아진다.
+        """
+        self._acquire()
+        submitted_at = time.time()
+        try:
+            future = self._get_executor().submit(_timed_call, fn, *args)
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(lambda _: self._release())
+        try:
+            result, started_at, finished_at = await asyncio.wrap_future(future)
+        except Exception:
+            self.failed += 1
+            raise
+        self.queue_wait.observe(max(0.0, started_at - submitted_at))
+        self.processing.observe(max(0.0, finished_at - started_at))
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """풀 상태 및 지표"""
+        return {
+            "kind": self.kind,
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "pending": self._pending,
+            "rejected": self.rejected,
+            "failed": self.failed,
+            "queue_wait": self.queue_wait.as_dict(),
+            "processing": self.processing.as_dict(),
+        }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+
@@ -0,0 +1,218 @@
+import asyncio
+import itertools
+import logging
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Callable, Dict, Iterable, List, NamedTuple, Optional, Set
+
+import orjson
+from sqlalchemy import delete, func, insert, select
+
+from app.core.config import settings
+from app.core.database import open_session
+from app.models.user import Event
+
+logger = logging.getLogger(__name__)
+
+# 연결의 대기열이 넘쳐 이벤트가 버려졌을 때 보내는 이벤트 (클라이언트는 목록을 다시 조회)
+RESYNC_EVENT = "resync"
+# sqlite 백엔드에서 한 번에 읽는 이벤트 수
+_POLL_BATCH_SIZE = 500
+# sqlite 백엔드에서 오래된 이벤트를 지우는 주기 (초)
+_CLEANUP_INTERVAL = 60
+
+
+class Notification(NamedTuple):
+    """수신자에게 전달할 이벤트"""
+    type: str
+    user_ids: List[int]
+    data: Dict
+
+
+class _Subscriber:
+    """SSE 연결 하나의 이벤트 대기열"""
+
+    def __init__(self, max_size: int):
+        self.queue: "asyncio.Queue[Dict]" = asyncio.Queue(maxsize=max_size)
+
+    def put(self, event: Dict) -> bool:
+        """이벤트 추가 (가득 차면 쌓인 이벤트를 버리고 resync 만 남김, 버렸으면 False)"""
+        try:
+            self.queue.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait({"id": event["id"], "type": RESYNC_EVENT, "data": {}})
+            return False
+
+
+class MemoryBackend:
+    """프로세스 내 전달 (단일 워커 또는 개발 환경)"""
+
+    def __init__(self, bus: "EventBus"):
+        self.bus = bus
+        self._ids = itertools.count(1)
+
+    async def publish(self, notifications: List[Notification]) -> None:
+        for notification in notifications:
+            self.bus.deliver(next(self._ids), notification)
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+
+class SqliteBackend:
+    """events 테이블을 공유 버스로 사용 (여러 워커 프로세스가 같은 DB 파일을 쓰는 경우)
+
+    발행은 events 테이블에 삽입하고, 각 워커는 EVENTS_POLL_INTERVAL 마다 읽기 전용 연결로
+    마지막으로 본 id 이후의 이벤트만 조회해 자기 프로세스의 연결에 전달한다.
+    """
+
+    def __init__(self, bus: "EventBus"):
+        self.bus = bus
+        self._last_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._last_cleanup = 0.0
+
+    async def publish(self, notifications: List[Notification]) -> None:
+        async with open_session() as db:
+            await db.execute(insert(Event), [
+                {
+                    "type": n.type,
+                    "user_ids": orjson.dumps(n.user_ids).decode(),
+                    "payload": orjson.dumps(n.data).decode(),
+                }
+                for n in notifications
+            ])
+            await db.commit()
+
+    async def start(self) -> None:
+        # 시작 이전의 이벤트는 전달하지 않음
+        async with open_session(read_only=True) as db:
+            self._last_id = await db.scalar(select(func.coalesce(func.max(Event.id), 0)))
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(settings.EVENTS_POLL_INTERVAL)
+            try:
+                await self._poll()
+                if loop.time() - self._last_cleanup >= _CLEANUP_INTERVAL:
+                    self._last_cleanup = loop.time()
+                    await self._cleanup()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("❌ [EVENTS] 이벤트 조회 실패")
+
+    async def _poll(self) -> None:
+        while True:
+            async with open_session(read_only=True) as db:
+                rows = (await db.execute(
+                    select(Event.id, Event.type, Event.user_ids, Event.payload)
+                    .where(Event.id > self._last_id)
+                    .order_by(Event.id)
+                    .limit(_POLL_BATCH_SIZE)
+                )).all()
+            for row in rows:
+                notification = Notification(row.type, orjson.loads(row.user_ids), orjson.loads(row.payload))
+                self.bus.deliver(row.id, notification)
+                self._last_id = row.id
+            if len(rows) < _POLL_BATCH_SIZE:
+                return
+
+    async def _cleanup(self) -> None:
+        cutoff = datetime.utcnow() - timedelta(seconds=settings.EVENTS_RETENTION_SECONDS)
+        async with open_session() as db:
+            await db.execute(delete(Event).where(Event.created_at < cutoff))
+            await db.commit()
+
+
+_BACKENDS = {"memory": MemoryBackend, "sqlite": SqliteBackend}
+
+
+class EventBus:
+    """사용자별 이벤트 구독/발행 (매칭 요청 상태 변경 알림)
+
+    SSE 연결은 subscription() 으로 사용자 ID 에 대기열을 등록하고, 핸들러는 커밋 후 publish() 로
+    이벤트를 발행한다. 실제 전달 경로는 백엔드(memory/sqlite)가 결정한다.
+    """
+
+    def __init__(self, backend: str, queue_size: int):
+        if backend not in _BACKENDS:
+            raise ValueError(f"Unknown EVENTS_BACKEND: {backend}")
+        self.backend_name = backend
+        self.backend = _BACKENDS[backend](self)
+        self.queue_size = queue_size
+        self._subscribers: Dict[int, Set[_Subscriber]] = {}
+        self._listeners: Dict[str, List[Callable[[Notification], None]]] = {}
+        self.published = 0
+        self.delivered = 0
+        self.dropped = 0
+
+    @asynccontextmanager
+    async def subscription(self, user_id: int) -> AsyncIterator["asyncio.Queue[Dict]"]:
+        """사용자 이벤트 대기열 등록 (블록을 벗어나면 해제)"""
+        subscriber = _Subscriber(self.queue_size)
+        self._subscribers.setdefault(user_id, set()).add(subscriber)
+        try:
+            yield subscriber.queue
+        finally:
+            subscribers = self._subscribers.get(user_id)
+            if subscribers is not None:
+                subscribers.discard(subscriber)
+                if not subscribers:
+                    del self._subscribers[user_id]
+
+    def add_listener(self, event_type: str, callback: Callable[[Notification], None]) -> None:
+        """이 프로세스에서 해당 유형의 이벤트를 받을 때마다 호출할 함수 등록 (캐시 무효화 등)"""
+        self._listeners.setdefault(event_type, []).append(callback)
+
+    def deliver(self, event_id: int, notification: Notification) -> None:
+        """이 프로세스에 연결된 수신자들의 대기열에 이벤트 추가 (이벤트 루프에서 호출)"""
+        for callback in self._listeners.get(notification.type, ()):
+            callback(notification)
+        event = {"id": event_id, "type": notification.type, "data": notification.data}
+        for user_id in set(notification.user_ids):
+            for subscriber in self._subscribers.get(user_id, ()):
+                if subscriber.put(event):
+                    self.delivered += 1
+                else:
+                    self.dropped += 1
+
+    async def publish(self, notifications: Iterable[Notification]) -> None:
+        """이벤트 발행 (요청은 이미 커밋되었으므로 실패해도 예외를 전파하지 않음)"""
+        notifications = list(notifications)
+        if not notifications:
+            return
+        try:
+            await self.backend.publish(notifications)
+            self.published += len(notifications)
+        except Exception:
+            logger.exception("❌ [EVENTS] 이벤트 발행 실패: %s", notifications[0].type)
+
+    def subscriber_count(self) -> int:
+        return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+    async def start(self) -> None:
+        await self.backend.start()
+
+    async def stop(self) -> None:
+        await self.backend.stop()
+
+
+event_bus = EventBus(settings.EVENTS_BACKEND, settings.EVENTS_QUEUE_SIZE)
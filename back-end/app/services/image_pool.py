@@ -0,0 +1,11 @@
+from app.core.config import settings
+from app.services.bounded_pool import BoundedPool
+
+# 이미지 디코딩/크롭/인코딩용 프로세스 풀
+image_pool = BoundedPool(
+    name="image",
+    kind="process",
+    workers=settings.IMAGE_POOL_WORKERS,
+    max_pending=settings.IMAGE_POOL_MAX_PENDING,
+    retry_after=settings.IMAGE_POOL_RETRY_AFTER,
+)
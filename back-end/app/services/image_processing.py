@@ -0,0 +1,170 @@
+import base64
+import binascii
+import io
+import struct
+import warnings
+from typing import NamedTuple, Optional
+
+from app.services.image_store import save_image, generate_renditions
+
+# 프로필 이미지 제한
+MIN_IMAGE_DIMENSION = 500
+MAX_IMAGE_DIMENSION = 1000
+MAX_IMAGE_BYTES = 1024 * 1024  # 1MB
+ALLOWED_FORMATS = ("JPEG", "PNG")
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_JPEG_SOI = b"\xff\xd8"
+# 크기 정보를 담은 JPEG SOF 마커 (DHT/JPG/DAC 제외)
+_JPEG_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+# 길이 필드가 없는 JPEG 마커
+_JPEG_STANDALONE_MARKERS = {0x01, 0xD0, 0xD1, 0xD2, 0xD3, 0xD4, 0xD5, 0xD6, 0xD7, 0xD8}
+
+
+class ImageValidationError(ValueError):
+    """프로필 이미지 검증 실패 (400 응답으로 변환됨)"""
+
+
+class ImageHeader(NamedTuple):
+    """이미지 헤더에서 읽은 포맷과 크기"""
+    format: str
+    width: int
+    height: int
+
+
+class ProcessedImage(NamedTuple):
+    """처리 완료된 프로필 이미지 정보"""
+    hash: str
+    mime: str
+    size: int
+    format: str
+
+
+def _probe_jpeg(data: bytes) -> Optional[ImageHeader]:
+    """JPEG 마커를 따라가며 SOF 세그먼트의 크기 정보 읽기"""
+    offset = 2
+    while True:
+        # 마커 앞의 0xFF 채움 바이트 건너뛰기
+        while offset < len(data) and data[offset] == 0xFF:
+            offset += 1
+        if offset >= len(data):
+            return None
+        marker = data[offset]
+        if data[offset - 1] != 0xFF:
+            raise ImageValidationError("Invalid image data: corrupt JPEG header")
+        offset += 1
+        if marker in _JPEG_STANDALONE_MARKERS:
+            continue
+        if marker in (0xD9, 0xDA):
+            # SOF 이전에 이미지 데이터/끝이 나오면 잘못된 파일
+            raise ImageValidationError("Invalid image data: missing JPEG frame header")
+        if offset + 2 > len(data):
+            return None
+        (length,) = struct.unpack(">H", data[offset:offset + 2])
+        if length < 2:
+            raise ImageValidationError("Invalid image data: corrupt JPEG header")
+        if marker in _JPEG_SOF_MARKERS:
+            if offset + 7 > len(data):
+                return None
+            height, width = struct.unpack(">HH", data[offset + 3:offset + 7])
+            return ImageHeader("JPEG", width, height)
+        offset += length
+
+
+def probe_image_header(data: bytes) -> Optional[ImageHeader]:
+    """이미지 전체를 디코딩하지 않고 헤더에서 포맷과 크기 확인
+
+    판단에 필요한 데이터가 아직 부족하면 None 을 반환하고,
+    JPEG/PNG 가 아니거나 헤더가 손상되었으면 ImageValidationError 를 발생시킨다.
+    """
+    if len(data) < len(_PNG_SIGNATURE):
+        if _PNG_SIGNATURE.startswith(data) or _JPEG_SOI.startswith(data[:2]):
+            return None
+        raise ImageValidationError("Only JPEG and PNG images are allowed")
+
+    if data.startswith(_PNG_SIGNATURE):
+        # 시그니처(8) + 청크 길이(4) + "IHDR"(4) + 너비(4) + 높이(4)
+        if len(data) < 24:
+            return None
+        if data[12:16] != b"IHDR":
+            raise ImageValidationError("Invalid image data: corrupt PNG header")
+        width, height = struct.unpack(">II", data[16:24])
+        return ImageHeader("PNG", width, height)
+
+    if data.startswith(_JPEG_SOI):
+        return _probe_jpeg(data)
+
+    raise ImageValidationError("Only JPEG and PNG images are allowed")
+
+
+def validate_image_header(header: ImageHeader) -> None:
+    """헤더 정보로 포맷 및 크기 제한 확인 (500x500 ~ 1000x1000)"""
+    if header.format not in ALLOWED_FORMATS:
+        raise ImageValidationError("Only JPEG and PNG images are allowed")
+    if (header.width < MIN_IMAGE_DIMENSION or header.height < MIN_IMAGE_DIMENSION
+            or header.width > MAX_IMAGE_DIMENSION or header.height > MAX_IMAGE_DIMENSION):
+        raise ImageValidationError("Image size must be between 500x500 and 1000x1000 pixels")
+
+
+def process_profile_image(encoded: str) -> ProcessedImage:
+    """Base64 프로필 이미지 디코딩 후 처리 (이미지 처리 프로세스 풀에서 실행)"""
+    try:
+        image_data = base64.b64decode(encoded)
+    except (binascii.Error, ValueError) as e:
+        raise ImageValidationError(f"Invalid image data: {e}")
+    return process_image_bytes(image_data)
+
+
+def process_image_bytes(image_data: bytes) -> ProcessedImage:
+    """프로필 이미지 검증, 정사각형 크롭 후 저장
+
+    헤더로 포맷과 크기를 먼저 확인한 뒤에만 디코딩하며, 디코딩 가능한 픽셀 수를
+    최대 허용 크기로 제한해 압축 폭탄을 막는다.
+    CPU 를 많이 사용하므로 이미지 처리 프로세스 풀에서 실행된다.
+    """
+    from PIL import Image
+
+    header = probe_image_header(image_data)
+    if header is None:
+        raise ImageValidationError("Invalid image data: truncated image header")
+    validate_image_header(header)
+
+    # 헤더 검증을 통과한 크기 이상은 디코딩하지 않음
+    Image.MAX_IMAGE_PIXELS = MAX_IMAGE_DIMENSION * MAX_IMAGE_DIMENSION
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", Image.DecompressionBombWarning)
+            image = Image.open(io.BytesIO(image_data))
+            image.load()
+    except Exception as e:
+        raise ImageValidationError(f"Invalid image data: {e}")
+
+    image_format = image.format  # crop 이후에는 format 정보가 사라지므로 보관
+    width, height = image.size
+    if image_format != header.format or (width, height) != (header.width, header.height):
+        raise ImageValidationError("Invalid image data: header does not match image")
+
+    try:
+        # 정사각형으로 크롭
+        min_dimension = min(width, height)
+        left = (width - min_dimension) / 2
+        top = (height - min_dimension) / 2
+        right = (width + min_dimension) / 2
+        bottom = (height + min_dimension) / 2
+        image = image.crop((left, top, right, bottom))
+
+        # 이미지를 바이트로 변환
+        buffer = io.BytesIO()
+        image.save(buffer, format=image_format)
+        data = buffer.getvalue()
+    except Exception as e:
+        raise ImageValidationError(f"Invalid image data: {e}")
+
+    # 파일 크기 확인 (1MB 제한)
+    if len(data) > MAX_IMAGE_BYTES:
+        raise ImageValidationError("Image size must be less than 1MB")
+
+    # 콘텐츠 해시 기반 파일 저장소에 저장하고 크기별 썸네일 생성
+    stored = save_image(data, image_format)
+    generate_renditions(data, stored.hash)
+    return ProcessedImage(hash=stored.hash, mime=stored.mime, size=stored.size, format=image_format)
@@ -0,0 +1,157 @@
+import hashlib
+import io
+import os
+import re
+import tempfile
+from typing import List, NamedTuple, Optional
+
+from app.core.config import settings
+
+# 이미지 포맷별 MIME 타입과 확장자
+IMAGE_TYPES = {
+    "JPEG": ("image/jpeg", "jpg"),
+    "PNG": ("image/png", "png"),
+}
+_EXTENSIONS = {mime: ext for mime, ext in IMAGE_TYPES.values()}
+_MIME_BY_EXTENSION = {ext: mime for mime, ext in IMAGE_TYPES.values()}
+_MIME_BY_EXTENSION["webp"] = "image/webp"
+
+# 미리 생성하는 썸네일 크기 (정사각형 한 변, px)
+RENDITION_SIZES = (64, 128, 500)
+# 목록 화면 등에서 사용하는 기본 썸네일
+THUMBNAIL_VARIANT = "128.webp"
+# 변형 이름 형식: orig.<ext> 또는 <size>.<ext>
+_VARIANT_PATTERN = re.compile(r"^(orig|\d+)\.(jpg|png|webp)$")
+
+
+class StoredImage(NamedTuple):
+    """저장된 이미지 메타데이터 (User 행에는 이 정보만 저장)"""
+    hash: str
+    mime: str
+    size: int
+
+
+def object_path(image_hash: str, mime: str) -> str:
+    """콘텐츠 해시로부터 원본 이미지 파일 경로 계산 (images/objects/ab/<hash>.<ext>)"""
+    ext = _EXTENSIONS.get(mime, "bin")
+    return os.path.join(settings.IMAGE_DIR, "objects", image_hash[:2], f"{image_hash}.{ext}")
+
+
+def rendition_path(image_hash: str, variant: str) -> str:
+    """썸네일 파일 경로 계산 (images/renditions/ab/<hash>/<variant>)"""
+    return os.path.join(settings.IMAGE_DIR, "renditions", image_hash[:2], image_hash, variant)
+
+
+def variant_mime(variant: str) -> Optional[str]:
+    """변형 이름이 유효하면 MIME 타입 반환 (아니면 None)"""
+    match = _VARIANT_PATTERN.match(variant)
+    if not match:
+        return None
+    size, ext = match.groups()
+    if size != "orig" and int(size) not in RENDITION_SIZES:
+        return None
+    if size == "orig" and ext == "webp":
+        return None
+    return _MIME_BY_EXTENSION[ext]
+
+
+def rendition_variants(mime: str) -> List[str]:
+    """원본 포맷과 WebP 로 생성되는 썸네일 변형 이름 목록"""
+    ext = _EXTENSIONS[mime]
+    variants = []
+    for size in RENDITION_SIZES:
+        variants.append(f"{size}.{ext}")
+        variants.append(f"{size}.webp")
+    return variants
+
+
+def profile_image_url(role: str, user_id: int, image_hash: Optional[str],
+                      image_mime: Optional[str], variant: Optional[str] = None) -> str:
+    """프로필 이미지 URL 생성
+
+    이미지가 있으면 콘텐츠 해시가 포함된 버전 URL(영구 캐시 가능)을,
+    없으면 기본 이미지로 리다이렉트하는 URL 을 반환한다.
+    """
+    if not image_hash or not image_mime:
+        return f"/images/{role}/{user_id}"
+    if variant is None:
+        variant = f"orig.{_EXTENSIONS.get(image_mime, 'bin')}"
+    return f"/images/v/{image_hash}/{variant}"
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    """임시 파일에 쓴 뒤 rename 하여 부분적으로 쓰인 파일이 노출되지 않도록 저장"""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def save_image(data: bytes, image_format: str) -> StoredImage:
+    """이미지를 콘텐츠 해시 주소로 저장 (같은 내용은 한 번만 저장됨)"""
+    mime, _ = IMAGE_TYPES[image_format]
+    image_hash = hashlib.sha256(data).hexdigest()
+    path = object_path(image_hash, mime)
+    if not os.path.exists(path):
+        _write_atomic(path, data)
+    return StoredImage(hash=image_hash, mime=mime, size=len(data))
+
+
+def find_image(image_hash: Optional[str], mime: Optional[str]) -> Optional[str]:
+    """저장된 이미지 파일 경로 반환 (없으면 None)"""
+    if not image_hash or not mime:
+        return None
+    path = object_path(image_hash, mime)
+    return path if os.path.isfile(path) else None
+
+
+def generate_renditions(data: bytes, image_hash: str) -> None:
+    """원본 이미지로부터 크기별 썸네일(원본 포맷 + WebP) 생성
+
+    이미 생성된 변형은 건너뛴다 (콘텐츠 해시가 같으면 결과도 같음).
+    """
+    from PIL import Image
+
+    with Image.open(io.BytesIO(data)) as source:
+        image_format = source.format
+        mime, ext = IMAGE_TYPES[image_format]
+        source.load()
+        for size in RENDITION_SIZES:
+            targets = [
+                (f"{size}.{ext}", image_format, {"optimize": True}),
+                (f"{size}.webp", "WEBP", {"quality": 80, "method": 4}),
+            ]
+            pending = [t for t in targets if not os.path.exists(rendition_path(image_hash, t[0]))]
+            if not pending:
+                continue
+            resized = source.copy()
+            resized.thumbnail((size, size), Image.LANCZOS)
+            if image_format == "JPEG" and resized.mode not in ("RGB", "L"):
+                resized = resized.convert("RGB")
+            for variant, fmt, options in pending:
+                buffer = io.BytesIO()
+                resized.save(buffer, format=fmt, **options)
+                _write_atomic(rendition_path(image_hash, variant), buffer.getvalue())
+
+
+def find_variant(image_hash: str, variant: str) -> Optional[str]:
+    """버전 URL 의 변형 파일 경로 반환 (없으면 None)
+
+    썸네일은 업로드 시 이미지 처리 풀에서, 기존 이미지는 migrate 에서 미리 생성하므로
+    요청 처리 중에는 생성하지 않는다.
+    """
+    if not re.fullmatch(r"[0-9a-f]{64}", image_hash) or variant_mime(variant) is None:
+        return None
+
+    if variant.startswith("orig."):
+        return find_image(image_hash, variant_mime(variant))
+
+    path = rendition_path(image_hash, variant)
+    return path if os.path.isfile(path) else None
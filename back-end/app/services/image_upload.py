@@ -0,0 +1,154 @@
+from typing import AsyncIterator, Optional
+
+try:
+    import python_multipart as multipart
+    from python_multipart.exceptions import MultipartParseError
+    from python_multipart.multipart import parse_options_header
+except ImportError:  # python-multipart < 0.0.13
+    import multipart
+    from multipart.exceptions import MultipartParseError
+    from multipart.multipart import parse_options_header
+
+from app.services.image_processing import (
+    ImageHeader, ImageValidationError, probe_image_header, validate_image_header
+)
+
+# 이미지 업로드 Content-Type
+RAW_IMAGE_CONTENT_TYPES = ("image/jpeg", "image/png")
+# 멀티파트 업로드의 이미지 필드 이름
+IMAGE_FIELD_NAME = b"image"
+# 헤더(포맷/크기)를 이 크기 안에서 찾지 못하면 거부
+MAX_HEADER_BYTES = 64 * 1024
+
+
+class UploadTooLarge(Exception):
+    """업로드 본문이 허용 크기를 초과함 (413 응답으로 변환됨)"""
+
+
+class _ImageBuffer:
+    """업로드되는 이미지 바이트를 모으면서 헤더가 도착하는 즉시 검증"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.data = bytearray()
+        self.header: Optional[ImageHeader] = None
+
+    def feed(self, chunk: bytes) -> None:
+        if len(self.data) + len(chunk) > self.max_bytes:
+            raise UploadTooLarge()
+        self.data += chunk
+        if self.header is None:
+            header = probe_image_header(bytes(self.data[:MAX_HEADER_BYTES]))
+            if header is None:
+                if len(self.data) >= MAX_HEADER_BYTES:
+                    raise ImageValidationError("Invalid image data: image header not found")
+                return
+            # 본문 전체를 받기 전에 포맷/크기 제한 확인
+            validate_image_header(header)
+            self.header = header
+
+    def finish(self) -> bytes:
+        if self.header is None:
+            raise ImageValidationError("Invalid image data: truncated image header")
+        return bytes(self.data)
+
+
+class _MultipartImageReader:
+    """멀티파트 본문을 스트리밍 파싱하여 image 필드만 버퍼에 전달"""
+
+    def __init__(self, boundary: bytes, buffer: _ImageBuffer):
+        self.buffer = buffer
+        self.found = False
+        self._in_image = False
+        self._header_field = b""
+        self._header_value = b""
+        self._part_headers = {}
+        self.parser = multipart.MultipartParser(boundary, {
+            "on_part_begin": self._on_part_begin,
+            "on_part_data": self._on_part_data,
+            "on_header_field": self._on_header_field,
+            "on_header_value": self._on_header_value,
+            "on_header_end": self._on_header_end,
+            "on_headers_finished": self._on_headers_finished,
+        })
+
+    def _on_part_begin(self) -> None:
+        self._in_image = False
+        self._part_headers = {}
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_field += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        self._part_headers[self._header_field.lower()] = self._header_value
+        self._header_field = b""
+        self._header_value = b""
+
+    def _on_headers_finished(self) -> None:
+        _, options = parse_options_header(self._part_headers.get(b"content-disposition", b""))
+        if options.get(b"name") == IMAGE_FIELD_NAME and not self.found:
+            self._in_image = True
+            self.found = True
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._in_image:
+            self.buffer.feed(data[start:end])
+
+    def write(self, chunk: bytes) -> None:
+        try:
+            self.parser.write(chunk)
+        except MultipartParseError as e:
+            raise ImageValidationError(f"Invalid multipart body: {e}")
+
+    def finish(self) -> None:
+        try:
+            self.parser.finalize()
+        except MultipartParseError as e:
+            raise ImageValidationError(f"Invalid multipart body: {e}")
+        if not self.found:
+            raise ImageValidationError("Missing 'image' field in multipart body")
+
+
+async def read_image_upload(content_type: str, content_length: Optional[str],
+                            body: AsyncIterator[bytes], max_bytes: int) -> bytes:
+    """요청 본문을 스트리밍으로 읽어 이미지 바이트 반환
+
+    - Content-Length 가 제한을 넘으면 본문을 읽기 전에 거부
+    - 스트리밍 중 누적 크기가 제한을 넘으면 즉시 중단
+    - 이미지 헤더가 도착하는 즉시 포맷/크기를 검증하여 잘못된 업로드는 일찍 거부
+    """
+    mime, options = parse_options_header(content_type or "")
+    mime = mime.decode() if isinstance(mime, bytes) else mime
+    is_multipart = mime == "multipart/form-data"
+
+    # 멀티파트는 파트 헤더/경계 문자열 오버헤드만큼 여유를 둠
+    body_limit = max_bytes + MAX_HEADER_BYTES if is_multipart else max_bytes
+    if content_length and content_length.isdigit() and int(content_length) > body_limit:
+        raise UploadTooLarge()
+
+    buffer = _ImageBuffer(max_bytes)
+    if is_multipart:
+        boundary = options.get(b"boundary")
+        if not boundary:
+            raise ImageValidationError("Missing multipart boundary")
+        reader = _MultipartImageReader(boundary, buffer)
+        received = 0
+        async for chunk in body:
+            # 멀티파트 오버헤드를 포함한 전체 본문 크기도 제한
+            received += len(chunk)
+            if received > body_limit:
+                raise UploadTooLarge()
+            reader.write(chunk)
+        reader.finish()
+    elif mime in RAW_IMAGE_CONTENT_TYPES:
+        async for chunk in body:
+            buffer.feed(chunk)
+    else:
+        raise ImageValidationError(
+            "Content-Type must be multipart/form-data, image/jpeg or image/png"
+        )
+
+    return buffer.finish()
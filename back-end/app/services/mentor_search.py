@@ -0,0 +1,95 @@
+import logging
+import re
+from typing import List
+
+from sqlalchemy import column, select, table, text
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# 검색어에서 사용하는 최대 단어 수 (긴 입력으로 MATCH 비용이 커지지 않도록 제한)
+MAX_QUERY_TERMS = 8
+
+# 멘토 검색용 FTS5 테이블 (rowid = users.id, 멘토만 색인)
+mentor_search = table(
+    "mentor_search",
+    column("rowid"),
+    column("rank"),
+    column("mentor_search"),
+)
+
+_TABLE_SQL = """
+CREATE VIRTUAL TABLE mentor_search USING fts5(
+    name, bio, skills,
+    tokenize = 'unicode61 remove_diacritics 2',
+    prefix = '2 3'
+)
+"""
+
+# BM25 가중치: 이름 > 스킬 > 소개
+_RANK_SQL = "INSERT INTO mentor_search(mentor_search, rank) VALUES ('rank', 'bm25(10.0, 1.0, 5.0)')"
+
+_BACKFILL_SQL = """
+INSERT INTO mentor_search(rowid, name, bio, skills)
+SELECT id, name, coalesce(bio, ''), coalesce(skills, '') FROM users WHERE role = 'MENTOR'
+"""
+
+# users 테이블을 바꾸는 모든 경로(회원가입, 프로필 수정, 대량 가져오기)에서 색인이 함께 갱신되도록 트리거로 유지
+_TRIGGERS_SQL = [
+    """
+    CREATE TRIGGER IF NOT EXISTS mentor_search_ai AFTER INSERT ON users
+    WHEN new.role = 'MENTOR' BEGIN
+        INSERT INTO mentor_search(rowid, name, bio, skills)
+        VALUES (new.id, new.name, coalesce(new.bio, ''), coalesce(new.skills, ''));
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS mentor_search_au AFTER UPDATE OF name, bio, skills, role ON users BEGIN
+        DELETE FROM mentor_search WHERE rowid = old.id;
+        INSERT INTO mentor_search(rowid, name, bio, skills)
+        SELECT new.id, new.name, coalesce(new.bio, ''), coalesce(new.skills, '') WHERE new.role = 'MENTOR';
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS mentor_search_ad AFTER DELETE ON users BEGIN
+        DELETE FROM mentor_search WHERE rowid = old.id;
+    END
+    """,
+]
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+def create_mentor_search_index(engine: Engine) -> None:
+    """FTS5 테이블과 동기화 트리거 생성 (테이블을 새로 만든 경우 기존 멘토 색인)"""
+    with engine.begin() as conn:
+        exists = conn.execute(text(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'mentor_search'"
+        )).first() is not None
+        if not exists:
+            conn.execute(text(_TABLE_SQL))
+            conn.execute(text(_RANK_SQL))
+            count = conn.execute(text(_BACKFILL_SQL)).rowcount
+            logger.info("🔧 [MIGRATE] mentor_search 색인 생성: 멘토 %d명", count)
+        for trigger_sql in _TRIGGERS_SQL:
+            conn.execute(text(trigger_sql))
+
+
+def build_match_expression(query: str) -> str:
+    """사용자 입력을 FTS5 MATCH 식으로 변환 (모든 단어 접두사 일치, AND)
+
+    입력의 FTS5 연산자는 해석하지 않도록 단어만 추출해 따옴표로 감싼다.
+    단어가 없으면 빈 문자열을 반환한다.
+    """
+    terms: List[str] = _WORD_PATTERN.findall(query.lower())[:MAX_QUERY_TERMS]
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def search_subquery(match_expression: str):
+    """검색어와 일치하는 멘토 id 와 BM25 점수(작을수록 관련도 높음) 서브쿼리"""
+    return select(
+        mentor_search.c.rowid.label("mentor_id"),
+        mentor_search.c.rank.label("rank"),
+    ).where(
+        mentor_search.c.mentor_search.match(match_expression)
+    ).subquery("search")
@@ -0,0 +1,119 @@
+import hmac
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Set
+
+from jose import JWTError, jwt
+
+from app.core.config import settings
+from app.models.user import UserRole
+
+
+@dataclass(frozen=True)
+class Principal:
+    """인증된 사용자의 경량 정보 (역할 확인 등에 DB 조회 없이 사용)"""
+    id: int
+    email: str
+    name: str
+    role: UserRole
+
+
+class _Entry:
+    __slots__ = ("token", "principal", "expires_at")
+
+    def __init__(self, token: str, principal: Principal, expires_at: float):
+        self.token = token
+        self.principal = principal
+        self.expires_at = expires_at
+
+
+class PrincipalCache:
+    """검증된 토큰(jti 키) -> Principal LRU/TTL 캐시
+
+    캐시 적중 시에는 서명 검증과 사용자 조회를 모두 건너뛴다. 같은 jti 라도 토큰 문자열이
+    완전히 일치해야만 적중으로 처리하므로 검증되지 않은 토큰이 통과할 수 없다.
+    프로필 변경 시 invalidate_user 로 해당 사용자의 항목을 제거하며, 다른 워커 프로세스의
+    캐시는 TTL 이 지나면 갱신된다.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: int):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._by_user: Dict[int, Set[str]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _jti(token: str) -> Optional[str]:
+        try:
+            return jwt.get_unverified_claims(token).get("jti")
+        except JWTError:
+            return None
+
+    def lookup(self, token: str) -> Optional[Principal]:
+        """토큰에 해당하는 캐시된 Principal 반환 (없거나 만료되었으면 None)"""
+        jti = self._jti(token)
+        if jti is None:
+            return None
+        with self._lock:
+            entry = self._entries.get(jti)
+            if entry is None or not hmac.compare_digest(entry.token, token):
+                self.misses += 1
+                return None
+            if entry.expires_at <= time.time():
+                self._remove(jti)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(jti)
+            self.hits += 1
+            return entry.principal
+
+    def store(self, token: str, payload: Dict[str, Any], principal: Principal) -> None:
+        """검증된 토큰의 Principal 저장 (토큰 만료 시각과 TTL 중 이른 시각까지 유효)"""
+        jti = payload.get("jti")
+        if not jti or self.max_size <= 0:
+            return
+        expires_at = time.time() + self.ttl_seconds
+        if payload.get("exp"):
+            expires_at = min(expires_at, float(payload["exp"]))
+        with self._lock:
+            self._remove(jti)
+            self._entries[jti] = _Entry(token, principal, expires_at)
+            self._by_user.setdefault(principal.id, set()).add(jti)
+            while len(self._entries) > self.max_size:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+
+    def invalidate_user(self, user_id: int) -> None:
+        """사용자의 모든 캐시 항목 제거 (프로필 변경 시 호출)"""
+        with self._lock:
+            for jti in list(self._by_user.get(user_id, ())):
+                self._remove(jti)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_user.clear()
+
+    def _remove(self, jti: str) -> None:
+        entry = self._entries.pop(jti, None)
+        if entry is None:
+            return
+        jtis = self._by_user.get(entry.principal.id)
+        if jtis is not None:
+            jtis.discard(jti)
+            if not jtis:
+                del self._by_user[entry.principal.id]
+
+    def stats(self) -> Dict[str, int]:
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+principal_cache = PrincipalCache(
+    max_size=settings.PRINCIPAL_CACHE_SIZE,
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL,
+)
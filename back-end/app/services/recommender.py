@@ -0,0 +1,314 @@
+import asyncio
+import json
+import logging
+import re
+import zlib
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set
+
+import numpy as np
+from sqlalchemy import select
+
+from app.core.database import DbSession
+from app.models.user import MatchRequest, MatchRequestStatus, User, UserRole
+from app.services.events import Notification, event_bus
+from app.services.response_cache import MENTOR_DIRECTORY_CHANGED
+from app.services.skills import normalize_skill, normalize_skills
+
+logger = logging.getLogger(__name__)
+
+# 소개/스킬 텍스트를 해싱할 TF-IDF 차원 수 (멘토 5만 명 기준 약 50MB)
+TEXT_DIMENSIONS = 256
+# 최종 점수 = 스킬 코사인 유사도 * SKILL_WEIGHT + 텍스트 코사인 유사도 * (1 - SKILL_WEIGHT)
+SKILL_WEIGHT = 0.6
+# 멘토 문서에서 스킬 토큰의 가중치 (소개 문장보다 스킬을 더 중요하게 반영)
+SKILL_TOKEN_REPEAT = 3
+# 한 번에 DB 에서 읽는 멘토 수
+_LOAD_BATCH_SIZE = 1000
+# 행렬 용량 최소값 (부족하면 두 배씩 늘림)
+_MIN_CAPACITY = 1024
+# 마지막 IDF 계산 이후 바뀐 멘토가 이 비율을 넘으면 IDF 를 다시 계산 (그 전에는 바뀐 행만 갱신)
+_IDF_REFRESH_RATIO = 0.05
+
+# 단어 + "c++", "node.js", "c#" 같은 스킬 표기
+_TOKEN_PATTERN = re.compile(r"\w[\w+#.\-]*")
+
+
+class Recommendation(NamedTuple):
+    """추천 결과 (점수 순)"""
+    mentor_id: int
+    score: float
+    matched_skills: List[str]
+
+
+def tokenize(value: str) -> List[str]:
+    """텍스트를 소문자 토큰 목록으로 분리"""
+    return [token.rstrip(".-") for token in _TOKEN_PATTERN.findall(value.casefold())]
+
+
+def _bucket(token: str) -> int:
+    # 파이썬 hash() 는 프로세스마다 달라지므로 워커 간에 같은 값을 내는 crc32 사용
+    return zlib.crc32(token.encode("utf-8")) % TEXT_DIMENSIONS
+
+
+def _term_frequencies(tokens: Iterable[str]) -> np.ndarray:
+    """해싱된 로그 TF 벡터"""
+    buckets = [_bucket(token) for token in tokens]
+    counts = np.bincount(np.asarray(buckets, dtype=np.intp), minlength=TEXT_DIMENSIONS)
+    return np.log1p(counts).astype(np.float32)
+
+
+class MentorRecommender:
+    """멘티 소개와 멘토 스킬/소개의 유사도로 멘토 추천 (프로세스 내 NumPy 색인)
+
+    멘토마다 해싱된 TF 행과 스킬 비트셋(스킬별 멘토 bool 배열)을 유지하고,
+    추천 시 IDF 가중 코사인 유사도를 행렬-벡터 곱 한 번으로 계산한다.
+    멘토 정보가 바뀌면 이벤트 버스 알림(MENTOR_DIRECTORY_CHANGED)으로 해당 멘토만 다시 읽는다.
+    """
+
+    def __init__(self):
+        self._lock: Optional[asyncio.Lock] = None
+        self._loaded = False
+        self._reload = False
+        self._dirty: Set[int] = set()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._rows: Dict[int, int] = {}
+        self._capacity = 0
+        self._size = 0
+        self._ids = np.zeros(0, dtype=np.int64)
+        self._tf = np.zeros((0, TEXT_DIMENSIONS), dtype=np.float32)
+        self._df = np.zeros(TEXT_DIMENSIONS, dtype=np.int64)
+        self._skill_counts = np.zeros(0, dtype=np.float32)
+        self._skill_bits: Dict[str, np.ndarray] = {}
+        self._mentor_skills: Dict[int, List[str]] = {}
+        # IDF 가 적용된 정규화 행렬과 그 IDF (바뀐 행은 다음 추천 때 갱신)
+        self._weighted: Optional[np.ndarray] = None
+        self._idf: Optional[np.ndarray] = None
+        self._stale_rows: Set[int] = set()
+
+    def mark_changed(self, notification: Notification) -> None:
+        """멘토 변경 알림 처리 (mentorIds 가 없으면 다음 추천 때 전체를 다시 읽음)"""
+        mentor_ids = notification.data.get("mentorIds")
+        if mentor_ids is None:
+            self._reload = True
+        else:
+            self._dirty.update(mentor_ids)
+
+    def _grow(self, needed: int) -> None:
+        if needed <= self._capacity:
+            return
+        capacity = max(_MIN_CAPACITY, self._capacity * 2, needed)
+        extra = capacity - self._capacity
+        self._ids = np.concatenate([self._ids, np.zeros(extra, dtype=np.int64)])
+        self._tf = np.concatenate([self._tf, np.zeros((extra, TEXT_DIMENSIONS), dtype=np.float32)])
+        self._skill_counts = np.concatenate([self._skill_counts, np.zeros(extra, dtype=np.float32)])
+        for skill, bits in self._skill_bits.items():
+            self._skill_bits[skill] = np.concatenate([bits, np.zeros(extra, dtype=bool)])
+        self._capacity = capacity
+        self._weighted = None
+
+    def _set_mentor(self, mentor_id: int, bio: Optional[str], skills_json: Optional[str]) -> None:
+        """멘토 한 명의 행 갱신 (TF 행, 문서 빈도, 스킬 비트셋)"""
+        try:
+            skills = normalize_skills(json.loads(skills_json) if skills_json else [])
+        except ValueError:
+            skills = []
+        tokens = tokenize(bio or "")
+        for skill in skills:
+            tokens.extend(tokenize(skill) * SKILL_TOKEN_REPEAT)
+        tf = _term_frequencies(tokens)
+
+        row = self._rows.get(mentor_id)
+        if row is None:
+            self._grow(self._size + 1)
+            row = self._size
+            self._size += 1
+            self._rows[mentor_id] = row
+            self._ids[row] = mentor_id
+        else:
+            self._df -= self._tf[row] > 0
+            for skill in self._mentor_skills.get(mentor_id, ()):
+                self._skill_bits[skill][row] = False
+
+        self._tf[row] = tf
+        self._df += tf > 0
+        for skill in skills:
+            bits = self._skill_bits.get(skill)
+            if bits is None:
+                bits = self._skill_bits[skill] = np.zeros(self._capacity, dtype=bool)
+            bits[row] = True
+        self._skill_counts[row] = len(skills)
+        self._mentor_skills[mentor_id] = skills
+        self._stale_rows.add(row)
+
+    def _remove_mentor(self, mentor_id: int) -> None:
+        """더 이상 멘토가 아닌 사용자 제외 (행은 비워 두고 점수 0 으로 유지)"""
+        row = self._rows.get(mentor_id)
+        if row is None:
+            return
+        self._df -= self._tf[row] > 0
+        self._tf[row] = 0
+        for skill in self._mentor_skills.pop(mentor_id, ()):
+            self._skill_bits[skill][row] = False
+        self._skill_counts[row] = 0
+        self._stale_rows.add(row)
+
+    async def _load(self, db: DbSession, mentor_ids: Optional[List[int]]) -> None:
+        """DB 에서 멘토 정보 읽기 (mentor_ids 가 None 이면 전체)"""
+        if mentor_ids is None:
+            self._reset()
+            self._loaded = True
+        query = select(User.id, User.bio, User.skills).where(User.role == UserRole.MENTOR)
+        if mentor_ids is None:
+            last_id = 0
+            while True:
+                rows = (await db.execute(
+                    query.where(User.id > last_id).order_by(User.id).limit(_LOAD_BATCH_SIZE)
+                )).all()
+                for row in rows:
+                    self._set_mentor(row.id, row.bio, row.skills)
+                if len(rows) < _LOAD_BATCH_SIZE:
+                    break
+                last_id = rows[-1].id
+            logger.info("🧭 [RECOMMEND] 멘토 색인 생성: %d명", self._size)
+            return
+
+        found: Set[int] = set()
+        for start in range(0, len(mentor_ids), _LOAD_BATCH_SIZE):
+            chunk = mentor_ids[start:start + _LOAD_BATCH_SIZE]
+            for row in (await db.execute(query.where(User.id.in_(chunk)))).all():
+                self._set_mentor(row.id, row.bio, row.skills)
+                found.add(row.id)
+        for mentor_id in set(mentor_ids) - found:
+            self._remove_mentor(mentor_id)
+
+    async def refresh(self, db: DbSession) -> None:
+        """처음 사용할 때 전체를 읽고, 이후에는 변경된 멘토만 다시 읽음"""
+        if self._lock is None:
+            # 이벤트 루프 안에서 생성 (임포트 시점에 만들면 다른 루프에 묶일 수 있음)
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if not self._loaded or self._reload:
+                self._reload = False
+                self._dirty.clear()
+                await self._load(db, None)
+            elif self._dirty:
+                mentor_ids = sorted(self._dirty)
+                self._dirty.clear()
+                await self._load(db, mentor_ids)
+
+    def _normalized(self, tf: np.ndarray) -> np.ndarray:
+        weighted = tf * self._idf
+        norms = np.linalg.norm(weighted, axis=1, keepdims=True)
+        np.divide(weighted, norms, out=weighted, where=norms > 0)
+        return weighted
+
+    def _weighted_matrix(self) -> np.ndarray:
+        """IDF 가 적용되고 행마다 L2 정규화된 TF-IDF 행렬
+
+        바뀐 멘토가 적으면 기존 IDF 로 해당 행만 다시 계산하고, 많이 바뀌었거나
+        행렬이 커진 경우에만 IDF 와 전체 행렬을 다시 계산한다.
+        """
+        refresh_limit = max(64, int(self._size * _IDF_REFRESH_RATIO))
+        if self._weighted is None or len(self._stale_rows) > refresh_limit:
+            self._idf = (np.log((1 + self._size) / (1 + self._df)) + 1).astype(np.float32)
+            self._weighted = np.zeros_like(self._tf)
+            self._weighted[:self._size] = self._normalized(self._tf[:self._size])
+        elif self._stale_rows:
+            rows = np.fromiter(self._stale_rows, dtype=np.intp, count=len(self._stale_rows))
+            self._weighted[rows] = self._normalized(self._tf[rows])
+        self._stale_rows.clear()
+        return self._weighted[:self._size]
+
+    def _query_skills(self, tokens: List[str]) -> List[str]:
+        """멘티 소개에 등장하는 스킬 (한 단어 또는 두 단어 스킬)"""
+        candidates = set(tokens)
+        candidates.update(f"{a} {b}" for a, b in zip(tokens, tokens[1:]))
+        return sorted(
+            skill for skill in map(normalize_skill, candidates)
+            if skill in self._skill_bits
+        )
+
+    def score(self, text: str) -> np.ndarray:
+        """모든 멘토 행의 추천 점수 (0~1, 색인 순서)"""
+        tokens = tokenize(text)
+        scores = np.zeros(self._size, dtype=np.float32)
+        if not tokens or not self._size:
+            return scores
+
+        # 텍스트 유사도: 질의 TF-IDF 벡터와 정규화된 멘토 행렬의 곱
+        matrix = self._weighted_matrix()
+        query = _term_frequencies(tokens) * self._idf
+        norm = float(np.linalg.norm(query))
+        if norm > 0:
+            scores += (matrix @ (query / norm)) * (1 - SKILL_WEIGHT)
+
+        # 스킬 유사도: 일치하는 스킬 비트셋 합 / sqrt(멘토 스킬 수 * 질의 스킬 수)
+        skills = self._query_skills(tokens)
+        if skills:
+            overlap = np.zeros(self._size, dtype=np.float32)
+            for skill in skills:
+                overlap += self._skill_bits[skill][:self._size]
+            denominator = np.sqrt(self._skill_counts[:self._size] * len(skills))
+            np.divide(overlap, denominator, out=overlap, where=denominator > 0)
+            scores += overlap * SKILL_WEIGHT
+        return scores
+
+    @staticmethod
+    def _ranked_rows(scores: np.ndarray, ids: np.ndarray, count: int) -> np.ndarray:
+        """점수 상위 count 개 행 번호 (점수 내림차순, 같은 점수는 id 순, 점수 0 제외)"""
+        count = min(count, len(scores))
+        if count <= 0:
+            return np.zeros(0, dtype=np.intp)
+        # 전체 정렬 대신 상위 count 개만 골라 정렬
+        if count < len(scores):
+            candidates = np.argpartition(-scores, count - 1)[:count]
+        else:
+            candidates = np.arange(len(scores))
+        ordered = candidates[np.lexsort((ids[candidates], -scores[candidates]))]
+        return ordered[scores[ordered] > 0]
+
+    async def recommend(self, db: DbSession, text: str, limit: int) -> List[Recommendation]:
+        """텍스트(멘티 소개)와 가장 비슷한 멘토 (이미 수락된 매칭이 있는 멘토 제외)"""
+        await self.refresh(db)
+        scores = self.score(text)
+        # DB 조회를 기다리는 동안 다른 요청이 색인을 갱신해도 행 번호가 어긋나지 않도록 복사
+        ids = self._ids[:len(scores)].copy()
+        query_skills = set(self._query_skills(tokenize(text)))
+
+        results: List[Recommendation] = []
+        seen = 0
+        count = limit * 2
+        while len(results) < limit:
+            rows = self._ranked_rows(scores, ids, count)[seen:]
+            if not len(rows):
+                break
+            mentor_ids = [int(mentor_id) for mentor_id in ids[rows]]
+            # 후보에 대해서만 수락된 매칭 여부 확인 (mentor_id, status 인덱스 사용)
+            matched = set((await db.execute(
+                select(MatchRequest.mentor_id).where(
+                    MatchRequest.mentor_id.in_(mentor_ids),
+                    MatchRequest.status == MatchRequestStatus.ACCEPTED,
+                ).distinct()
+            )).scalars().all())
+            for row, mentor_id in zip(rows, mentor_ids):
+                if mentor_id in matched:
+                    continue
+                results.append(Recommendation(
+                    mentor_id,
+                    round(float(scores[row]), 4),
+                    [skill for skill in self._mentor_skills.get(mentor_id, ()) if skill in query_skills],
+                ))
+                if len(results) == limit:
+                    break
+            seen += len(rows)
+            count *= 2
+        return results
+
+    def stats(self) -> Dict[str, int]:
+        return {"mentors": len(self._mentor_skills), "skills": len(self._skill_bits), "capacity": self._capacity}
+
+
+mentor_recommender = MentorRecommender()
+event_bus.add_listener(MENTOR_DIRECTORY_CHANGED, mentor_recommender.mark_changed)
@@ -0,0 +1,151 @@
+import asyncio
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Hashable, List, NamedTuple, Optional, Tuple
+
+from app.core.config import settings
+from app.services.events import Notification, event_bus
+
+# 멘토 목록이 바뀌었음을 다른 워커 프로세스에 알리는 이벤트 (수신자 없음, 리스너만 처리)
+MENTOR_DIRECTORY_CHANGED = "mentor_directory.changed"
+
+
+class CachedResponse(NamedTuple):
+    """직렬화된 응답 본문과 함께 보낼 헤더"""
+    body: bytes
+    headers: Dict[str, str]
+
+
+class _Entry:
+    __slots__ = ("response", "expires_at")
+
+    def __init__(self, response: CachedResponse, expires_at: float):
+        self.response = response
+        self.expires_at = expires_at
+
+
+class ResponseCache:
+    """직렬화된 응답 LRU 캐시 (세대 카운터로 무효화 + single-flight)
+
+    키에는 항상 현재 세대가 포함되므로 invalidate() 로 세대를 올리면 이전 항목은 더 이상
+    조회되지 않고 LRU 로 밀려난다. 계산 도중 세대가 바뀌면 결과는 이전 세대 키로 저장되어
+    새 조회에 쓰이지 않는다. 같은 키의 동시 미스는 한 번만 계산하고 나머지는 결과를 기다린다.
+    다른 워커 프로세스의 변경은 이벤트 버스 알림 또는 TTL 로 반영된다.
+    """
+
+    def __init__(self, name: str, max_entries: int, max_bytes: int, ttl_seconds: int):
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Tuple, _Entry]" = OrderedDict()
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
+        self._generations = itertools.count(1)
+        self.generation = next(self._generations)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def invalidate(self) -> None:
+        """세대를 올려 모든 항목 무효화 (스레드에서 호출해도 안전)"""
+        with self._lock:
+            self.generation = next(self._generations)
+
+    def _lookup(self, key: Tuple) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry.response
+
+    def _store(self, key: Tuple, response: CachedResponse) -> None:
+        size = len(response.body)
+        if self.max_entries <= 0 or size > self.max_bytes:
+            return
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = _Entry(response, time.monotonic() + self.ttl_seconds)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: Tuple) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry.response.body)
+
+    async def get_or_compute(self, key: Hashable,
+                             compute: Callable[[], Awaitable[CachedResponse]]) -> CachedResponse:
+        """캐시된 응답 반환, 없으면 compute() 결과를 저장 후 반환 (동시 미스는 한 번만 계산)"""
+        while True:
+            full_key = (self.generation, key)
+            response = self._lookup(full_key)
+            if response is not None:
+                self.hits += 1
+                return response
+
+            future = self._inflight.get(full_key)
+            if future is not None:
+                self.coalesced += 1
+                try:
+                    return await asyncio.shield(future)
+                except asyncio.CancelledError:
+                    # 계산하던 요청이 취소된 경우 직접 다시 계산
+                    if future.cancelled():
+                        continue
+                    raise
+
+            self.misses += 1
+            future = asyncio.get_running_loop().create_future()
+            self._inflight[full_key] = future
+            try:
+                response = await compute()
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except BaseException as e:
+                future.set_exception(e)
+                future.exception()  # 기다리는 요청이 없어도 경고가 남지 않도록 확인 처리
+                raise
+            else:
+                self._store(full_key, response)
+                future.set_result(response)
+                return response
+            finally:
+                del self._inflight[full_key]
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._entries), "bytes": self._bytes, "generation": self.generation,
+            "hits": self.hits, "misses": self.misses, "coalesced": self.coalesced,
+        }
+
+
+# 멘토 목록(/api/mentors) 응답 캐시
+mentor_directory_cache = ResponseCache(
+    name="mentor_directory",
+    max_entries=settings.MENTOR_CACHE_MAX_ENTRIES,
+    max_bytes=settings.MENTOR_CACHE_MAX_BYTES,
+    ttl_seconds=settings.MENTOR_CACHE_TTL,
+)
+
+
+async def mentor_directory_changed(mentor_ids: Optional[List[int]] = None) -> None:
+    """멘토 목록에 보이는 정보가 바뀐 뒤 호출 (이 워커는 즉시, 다른 워커는 이벤트 버스로 무효화)
+
+    바뀐 멘토를 알면 mentor_ids 로 전달한다 (추천 색인 등이 해당 멘토만 다시 읽도록).
+    """
+    mentor_directory_cache.invalidate()
+    data = {"mentorIds": mentor_ids} if mentor_ids is not None else {}
+    await event_bus.publish([Notification(MENTOR_DIRECTORY_CHANGED, [], data)])
+
+
+event_bus.add_listener(MENTOR_DIRECTORY_CHANGED, lambda notification: mentor_directory_cache.invalidate())
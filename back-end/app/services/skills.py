@@ -0,0 +1,91 @@
+import json
+from typing import Iterable, List, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.models.user import User, UserRole, MentorSkill
+
+
+def normalize_skill(skill: str) -> str:
+    """스킬명 정규화 (공백 정리 + casefold)"""
+    return " ".join(skill.split()).casefold()
+
+
+def normalize_skills(skills: Iterable[str]) -> List[str]:
+    """스킬 목록 정규화 (빈 값 제거, 순서를 유지한 채 중복 제거)"""
+    normalized = []
+    seen = set()
+    for skill in skills:
+        key = normalize_skill(skill or "")
+        if key and key not in seen:
+            seen.add(key)
+            normalized.append(key)
+    return normalized
+
+
+def sync_mentor_skills(user: User, skills: List[str]) -> None:
+    """멘토의 skills JSON 컬럼과 mentor_skills 테이블을 함께 갱신"""
+    user.skills = json.dumps(skills)
+    user.skill_entries = [
+        MentorSkill(skill=skill, position=position)
+        for position, skill in enumerate(normalize_skills(skills))
+    ]
+
+
+def skill_filter(skills: List[str], match_all: bool = False):
+    """스킬 필터 조건 생성 (mentor_skills 인덱스 사용)
+
+    match_all=False 이면 하나라도 일치하는 멘토(OR),
+    match_all=True 이면 모든 스킬을 가진 멘토(AND)를 찾는다.
+    """
+    keys = normalize_skills(skills)
+    subquery = select(MentorSkill.mentor_id).where(MentorSkill.skill.in_(keys))
+    if match_all and len(keys) > 1:
+        subquery = subquery.group_by(MentorSkill.mentor_id).having(
+            func.count(MentorSkill.skill) == len(keys)
+        )
+    return User.id.in_(subquery)
+
+
+def primary_skill_join_condition():
+    """대표 스킬(첫 번째 스킬) 조인 조건 - 스킬 정렬에 사용"""
+    return (MentorSkill.mentor_id == User.id) & (MentorSkill.position == 0)
+
+
+def backfill_mentor_skills(db: Session) -> int:
+    """기존 skills JSON 컬럼으로부터 mentor_skills 테이블 채우기
+
+    mentor_skills 가 비어 있을 때만 수행하며, 채운 멘토 수를 반환한다.
+    """
+    if db.query(MentorSkill.mentor_id).first() is not None:
+        return 0
+
+    rows = db.query(User.id, User.skills).filter(
+        User.role == UserRole.MENTOR,
+        User.skills.isnot(None),
+    ).all()
+
+    count = 0
+    for user_id, skills_json in rows:
+        try:
+            skills = json.loads(skills_json) or []
+        except ValueError:
+            continue
+        entries = [
+            {"mentor_id": user_id, "skill": skill, "position": position}
+            for position, skill in enumerate(normalize_skills(skills))
+        ]
+        if entries:
+            db.execute(MentorSkill.__table__.insert(), entries)
+            count += 1
+    db.commit()
+    return count
+
+
+def parse_skill_params(values: Optional[List[str]]) -> List[str]:
+    """쿼리 파라미터의 스킬 목록 파싱 (반복 파라미터와 콤마 구분 모두 허용)"""
+    skills = []
+    for value in values or []:
+        skills.extend(part for part in value.split(",") if part.strip())
+    return skills
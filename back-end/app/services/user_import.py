@@ -0,0 +1,277 @@
+import csv
+import json
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+
+from app.core.config import settings
+from app.core.database import engine, read_engine
+from app.models.user import MentorSkill, User, UserRole
+from app.schemas.user import ImportUserRow
+from app.services.image_processing import process_image_bytes, process_profile_image
+from app.services.skills import normalize_skills
+from app.utils.auth import get_password_hash
+
+logger = logging.getLogger(__name__)
+
+IMPORT_FORMATS = ("csv", "ndjson")
+# CSV 의 skills 열 구분자 (예: "React;Vue")
+CSV_SKILL_SEPARATOR = ";"
+# 결과에 포함하는 행 오류 최대 개수 (나머지는 개수만 집계)
+MAX_REPORTED_ERRORS = 100
+# CSV 셀 최대 크기 (Base64 이미지 열 허용, 기본 제한은 128KB)
+_CSV_FIELD_SIZE_LIMIT = 16 * 1024 * 1024
+# 이메일 중복 확인 IN 절의 파라미터 수 (SQLite 변수 개수 제한 이내)
+_EMAIL_LOOKUP_CHUNK = 500
+
+
+def read_rows(stream: TextIO, fmt: str) -> Iterator[Tuple[int, Dict]]:
+    """CSV/NDJSON 스트림에서 (줄 번호, 행) 을 하나씩 읽기
+
+    파일 전체를 메모리에 올리지 않으며, 파싱할 수 없는 행은 ValueError 를 행 자리에 넘긴다.
+    """
+    if fmt == "csv":
+        csv.field_size_limit(max(csv.field_size_limit(), _CSV_FIELD_SIZE_LIMIT))
+        reader = csv.DictReader(stream)
+        for row in reader:
+            # 빈 셀은 값이 없는 것으로 처리
+            yield reader.line_num, {key: value for key, value in row.items() if key and value != ""}
+    elif fmt == "ndjson":
+        for line_no, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as e:
+                yield line_no, ValueError(f"Invalid JSON: {e}")
+                continue
+            if not isinstance(row, dict):
+                yield line_no, ValueError("Each line must be a JSON object")
+                continue
+            yield line_no, row
+    else:
+        raise ValueError(f"Unsupported import format: {fmt}")
+
+
+def _parse_row(raw: Dict) -> ImportUserRow:
+    skills = raw.get("skills")
+    if isinstance(skills, str):
+        skills = [part.strip() for part in skills.split(CSV_SKILL_SEPARATOR) if part.strip()]
+        raw = {**raw, "skills": skills}
+    return ImportUserRow.model_validate(raw)
+
+
+# 해싱/이미지 처리 중인 배치의 행: (줄 번호, 행, 비밀번호 해시 작업, 이미지 처리 작업)
+_PendingRow = Tuple[int, ImportUserRow, Future, Optional[Future]]
+
+
+class UserImporter:
+    """사용자 대량 가져오기
+
+    배치마다 이메일 중복을 한 번의 조회로 확인하고, 비밀번호 해싱(GIL 을 해제하는 scrypt)은
+    스레드 풀에서, 이미지 처리는 프로세스 풀에서 병렬로 수행한 뒤 배치 단위 트랜잭션으로 삽입한다.
+    다음 배치의 해싱은 이전 배치를 기록하는 동안 진행되며, 단일 쓰기 연결은 삽입하는 동안만 점유한다.
+    """
+
+    def __init__(self, batch_size: Optional[int] = None, hash_workers: Optional[int] = None,
+                 image_base_dir: Optional[str] = None):
+        self.batch_size = batch_size or settings.IMPORT_BATCH_SIZE
+        self.hash_workers = hash_workers or settings.IMPORT_HASH_WORKERS
+        # 이미지 파일 경로(imagePath) 허용 기준 디렉토리 (None 이면 경로 사용 불가)
+        self.image_base_dir = image_base_dir
+        self._hash_pool: Optional[ThreadPoolExecutor] = None
+        self._image_pool: Optional[ProcessPoolExecutor] = None
+        self._seen_emails = set()
+        self.result = {
+            "total": 0, "created": 0, "skipped": 0, "duplicates": 0, "failed": 0,
+            "errors": [], "seconds": 0.0,
+        }
+
+    def _error(self, line_no: int, message: str, email: Optional[str] = None) -> None:
+        self.result["failed"] += 1
+        if len(self.result["errors"]) < MAX_REPORTED_ERRORS:
+            self.result["errors"].append({"line": line_no, "email": email, "error": message})
+
+    def _get_image_pool(self) -> ProcessPoolExecutor:
+        if self._image_pool is None:
+            self._image_pool = ProcessPoolExecutor(
+                max_workers=settings.IMAGE_POOL_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._image_pool
+
+    def _submit_image(self, row: ImportUserRow) -> Optional[Future]:
+        if row.image:
+            return self._get_image_pool().submit(process_profile_image, row.image)
+        if row.imagePath:
+            if self.image_base_dir is None:
+                raise ValueError("imagePath is not allowed here; send the image as Base64")
+            base = os.path.realpath(self.image_base_dir)
+            path = os.path.realpath(os.path.join(base, row.imagePath))
+            if os.path.commonpath([base, path]) != base:
+                raise ValueError("imagePath must be inside the import directory")
+            with open(path, "rb") as f:
+                return self._get_image_pool().submit(process_image_bytes, f.read())
+        return None
+
+    def _existing_emails(self, emails: List[str]) -> set:
+        """이미 가입된 이메일 조회 (배치당 한 번, 읽기 전용 연결)"""
+        existing = set()
+        with read_engine.connect() as conn:
+            for start in range(0, len(emails), _EMAIL_LOOKUP_CHUNK):
+                chunk = emails[start:start + _EMAIL_LOOKUP_CHUNK]
+                existing.update(conn.execute(select(User.email).where(User.email.in_(chunk))).scalars())
+        return existing
+
+    def _prepare(self, batch: List[Tuple[int, Dict]]) -> List[_PendingRow]:
+        """행 검증 + 중복 제거 후 해싱/이미지 처리 작업 제출"""
+        parsed = []
+        for line_no, raw in batch:
+            self.result["total"] += 1
+            if isinstance(raw, Exception):
+                self._error(line_no, str(raw))
+                continue
+            try:
+                row = _parse_row(raw)
+            except ValidationError as e:
+                self._error(line_no, "; ".join(
+                    f"{'.'.join(str(loc) for loc in err['loc'])}: {err['msg']}" for err in e.errors()
+                ), raw.get("email") if isinstance(raw.get("email"), str) else None)
+                continue
+            if row.email in self._seen_emails:
+                self.result["duplicates"] += 1
+                continue
+            self._seen_emails.add(row.email)
+            parsed.append((line_no, row))
+
+        existing = self._existing_emails([row.email for _, row in parsed]) if parsed else set()
+        pending = []
+        for line_no, row in parsed:
+            if row.email in existing:
+                self.result["skipped"] += 1
+                continue
+            try:
+                image = self._submit_image(row)
+            except (OSError, ValueError) as e:
+                self._error(line_no, str(e), row.email)
+                continue
+            password = self._hash_pool.submit(get_password_hash, row.password)
+            pending.append((line_no, row, password, image))
+        return pending
+
+    def _write(self, pending: List[_PendingRow]) -> None:
+        """해싱 결과를 모아 배치 하나를 단일 트랜잭션으로 삽입"""
+        users, skills_by_email = [], {}
+        for line_no, row, password, image in pending:
+            try:
+                processed = image.result() if image is not None else None
+            except ValueError as e:  # ImageValidationError
+                password.cancel()
+                self._error(line_no, str(e), row.email)
+                continue
+            role = UserRole(row.role.value)
+            user = {
+                "email": row.email,
+                "password_hash": password.result(),
+                "role": role,
+                "name": row.name,
+                "bio": row.bio,
+                "skills": json.dumps(row.skills) if role == UserRole.MENTOR else None,
+                "image_hash": None, "image_mime": None, "image_size": None,
+            }
+            if processed is not None:
+                user.update(image_hash=processed.hash, image_mime=processed.mime, image_size=processed.size)
+            users.append(user)
+            if role == UserRole.MENTOR:
+                skills_by_email[row.email] = normalize_skills(row.skills)
+        if not users:
+            return
+
+        try:
+            created = self._insert(users, skills_by_email)
+        except IntegrityError:
+            # 가져오는 동안 같은 이메일로 가입한 사용자가 있으면 제외하고 한 번 더 시도
+            existing = self._existing_emails([user["email"] for user in users])
+            self.result["skipped"] += len(existing)
+            users = [user for user in users if user["email"] not in existing]
+            created = self._insert(users, skills_by_email) if users else 0
+        self.result["created"] += created
+
+    def _insert(self, users: List[Dict], skills_by_email: Dict[str, List[str]]) -> int:
+        with engine.begin() as conn:
+            inserted = conn.execute(insert(User).returning(User.id, User.email), users).all()
+            skill_rows = [
+                {"mentor_id": user_id, "skill": skill, "position": position}
+                for user_id, email in inserted
+                for position, skill in enumerate(skills_by_email.get(email, ()))
+            ]
+            if skill_rows:
+                conn.execute(insert(MentorSkill), skill_rows)
+        return len(inserted)
+
+    def _batches(self, rows: Iterable[Tuple[int, Dict]]) -> Iterator[List[Tuple[int, Dict]]]:
+        batch, line_no = [], 0
+        iterator = iter(rows)
+        while True:
+            try:
+                item = next(iterator)
+            except StopIteration:
+                break
+            except (UnicodeDecodeError, csv.Error) as e:
+                # 더 읽을 수 없는 파일이면 그때까지 읽은 행만 가져옴
+                self._error(line_no + 1, f"Unreadable import file: {e}")
+                break
+            line_no = item[0]
+            batch.append(item)
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def run(self, rows: Iterable[Tuple[int, Dict]]) -> Dict:
+        """행 스트림 전체 가져오기, 집계 결과 반환"""
+        started = time.perf_counter()
+        self._hash_pool = ThreadPoolExecutor(max_workers=self.hash_workers, thread_name_prefix="import-hash")
+        try:
+            pending = None
+            for batch in self._batches(rows):
+                prepared = self._prepare(batch)
+                if pending is not None:
+                    self._write(pending)
+                    self._log_progress(started)
+                pending = prepared
+            if pending is not None:
+                self._write(pending)
+        finally:
+            self._hash_pool.shutdown(wait=True, cancel_futures=True)
+            if self._image_pool is not None:
+                self._image_pool.shutdown(wait=True, cancel_futures=True)
+        self.result["seconds"] = round(time.perf_counter() - started, 2)
+        logger.info(
+            "📥 [IMPORT] 완료: 전체 %d, 생성 %d, 기존 %d, 파일 내 중복 %d, 실패 %d (%.1fs)",
+            self.result["total"], self.result["created"], self.result["skipped"],
+            self.result["duplicates"], self.result["failed"], self.result["seconds"],
+        )
+        return self.result
+
+    def _log_progress(self, started: float) -> None:
+        elapsed = time.perf_counter() - started
+        logger.info(
+            "📥 [IMPORT] 진행: %d 행 처리, %d 명 생성 (%.0f 행/초)",
+            self.result["total"], self.result["created"], self.result["total"] / elapsed if elapsed else 0.0,
+        )
+
+
+def import_users(stream: TextIO, fmt: str, batch_size: Optional[int] = None,
+                 hash_workers: Optional[int] = None, image_base_dir: Optional[str] = None) -> Dict:
+    """CSV/NDJSON 스트림의 사용자 가져오기"""
+    importer = UserImporter(batch_size, hash_workers, image_base_dir)
+    return importer.run(read_rows(stream, fmt))
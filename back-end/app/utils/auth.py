@@ -1,23 +1,88 @@
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
-# from passlib.context import CryptContext
 from app.core.config import settings
+from app.services.bounded_pool import BoundedPool
+import base64
+import hmac
+import os
+import re
 import uuid
 import hashlib
+import logging
 
-# 비밀번호 해싱을 위한 컨텍스트 (임시로 bcrypt 대신 SHA256 사용)
-# pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+logger = logging.getLogger(__name__)
+
+# 비밀번호 해시 형식: $scrypt$ln=<log2 N>,r=<r>,p=<p>$<salt>$<hash> (메모리 하드 KDF)
+SCRYPT_PREFIX = "$scrypt$"
+SCRYPT_SALT_BYTES = 16
+SCRYPT_KEY_BYTES = 32
+_SCRYPT_PATTERN = re.compile(r"^\$scrypt\$ln=(\d+),r=(\d+),p=(\d+)\$([A-Za-z0-9+/=]+)\$([A-Za-z0-9+/=]+)$")
+# 이전 버전에서 사용하던 솔트 없는 SHA-256 해시 (로그인 시 scrypt 로 재해싱)
+_LEGACY_SHA256_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+# 비밀번호 해싱 전용 스레드 풀 (hashlib.scrypt 는 GIL 을 해제함)
+password_pool = BoundedPool(
+    name="password",
+    kind="thread",
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+    retry_after=settings.PASSWORD_HASH_RETRY_AFTER,
+)
+
+# 없는 이메일로 로그인할 때 검증하는 해시 (현재 비용 설정 사용, 응답 시간으로 가입 여부가 드러나지 않도록)
+DUMMY_PASSWORD_HASH = (
+    f"{SCRYPT_PREFIX}ln={settings.PASSWORD_SCRYPT_LOG_N},r={settings.PASSWORD_SCRYPT_R},p={settings.PASSWORD_SCRYPT_P}"
+    f"${base64.b64encode(bytes(SCRYPT_SALT_BYTES)).decode()}${base64.b64encode(bytes(SCRYPT_KEY_BYTES)).decode()}"
+)
+
+def _scrypt(password: str, salt: bytes, log_n: int, r: int, p: int) -> bytes:
+    n = 1 << log_n
+    return hashlib.scrypt(
+        password.encode(), salt=salt, n=n, r=r, p=p,
+        maxmem=256 * n * r * p, dklen=SCRYPT_KEY_BYTES
+    )
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """비밀번호 검증 (임시로 SHA256 사용)"""
-    # return pwd_context.verify(plain_password, hashed_password)
-    return hashlib.sha256(plain_password.encode()).hexdigest() == hashed_password
+    """비밀번호 검증 (scrypt 및 이전 SHA-256 해시 지원)"""
+    match = _SCRYPT_PATTERN.match(hashed_password or "")
+    if match:
+        log_n, r, p = (int(value) for value in match.group(1, 2, 3))
+        salt = base64.b64decode(match.group(4))
+        expected = base64.b64decode(match.group(5))
+        return hmac.compare_digest(_scrypt(plain_password, salt, log_n, r, p), expected)
+
+    if _LEGACY_SHA256_PATTERN.match(hashed_password or ""):
+        legacy = hashlib.sha256(plain_password.encode()).hexdigest()
+        return hmac.compare_digest(legacy, hashed_password)
+
+    return False
 
 def get_password_hash(password: str) -> str:
-    """비밀번호 해싱 (임시로 SHA256 사용)"""
-    # return pwd_context.hash(password)
-    return hashlib.sha256(password.encode()).hexdigest()
+    """비밀번호 해싱 (scrypt, 비용은 설정값 사용)"""
+    log_n, r, p = settings.PASSWORD_SCRYPT_LOG_N, settings.PASSWORD_SCRYPT_R, settings.PASSWORD_SCRYPT_P
+    salt = os.urandom(SCRYPT_SALT_BYTES)
+    key = _scrypt(password, salt, log_n, r, p)
+    return (
+        f"{SCRYPT_PREFIX}ln={log_n},r={r},p={p}"
+        f"${base64.b64encode(salt).decode()}${base64.b64encode(key).decode()}"
+    )
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """이전 형식이거나 현재 설정과 비용이 다른 해시인지 확인"""
+    match = _SCRYPT_PATTERN.match(hashed_password or "")
+    if not match:
+        return True
+    current = (settings.PASSWORD_SCRYPT_LOG_N, settings.PASSWORD_SCRYPT_R, settings.PASSWORD_SCRYPT_P)
+    return tuple(int(value) for value in match.group(1, 2, 3)) != current
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """전용 해싱 풀에서 비밀번호 검증 (요청 스레드풀을 점유하지 않음)"""
+    return await password_pool.run(verify_password, plain_password, hashed_password)
+
+async def get_password_hash_async(password: str) -> str:
+    """전용 해싱 풀에서 비밀번호 해싱 (요청 스레드풀을 점유하지 않음)"""
+    return await password_pool.run(get_password_hash, password)
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """JWT 토큰 생성 (RFC 7519 준수)"""
@@ -53,10 +118,6 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
 def verify_token(token: str) -> Optional[dict]:
     """JWT 토큰 검증"""
     try:
-        print(f"🔍 [AUTH] 토큰 검증 시도: {token[:50]}...")
-        print(f"🔧 [AUTH] SECRET_KEY: {settings.SECRET_KEY[:20]}...")
-        print(f"🔧 [AUTH] ALGORITHM: {settings.ALGORITHM}")
-        
         # audience 검증 옵션 추가
         payload = jwt.decode(
             token, 
@@ -64,8 +125,7 @@ def verify_token(token: str) -> Optional[dict]:
             algorithms=[settings.ALGORITHM],
             options={"verify_aud": False}  # audience 검증 비활성화
         )
-        print(f"✅ [AUTH] 토큰 검증 성공: {payload}")
         return payload
     except JWTError as e:
-        print(f"❌ [AUTH] JWT 검증 에러: {e}")
+        logger.debug("❌ [AUTH] JWT 검증 에러: %s", e)
         return None
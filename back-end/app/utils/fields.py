@@ -0,0 +1,20 @@
+from typing import FrozenSet, Optional, Sequence
+
+from fastapi import HTTPException, status
+
+
+def parse_fields(value: Optional[str], allowed: Sequence[str]) -> Optional[FrozenSet[str]]:
+    """fields= 파라미터(쉼표 구분)를 필드 이름 집합으로 변환
+
+    값이 없으면 None(전체 필드)을 반환하고, 허용되지 않은 이름이 있으면 400 으로 응답한다.
+    """
+    if value is None:
+        return None
+    fields = frozenset(name.strip() for name in value.split(",") if name.strip())
+    unknown = sorted(fields.difference(allowed))
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown field(s): {', '.join(unknown)}. Allowed: {', '.join(allowed)}"
+        )
+    return fields
@@ -0,0 +1,42 @@
+import base64
+import json
+from typing import Any, List, Optional, Sequence
+
+from fastapi import HTTPException, status
+from sqlalchemy import tuple_
+
+# 다음 페이지 커서를 전달하는 응답 헤더
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """정렬 키 값들을 불투명한 커서 문자열로 인코딩"""
+    raw = json.dumps(list(values), separators=(",", ":"), ensure_ascii=False)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """커서 문자열을 정렬 키 값 목록으로 디코딩"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        values = None
+
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+    return values
+
+
+def keyset_filter(keys: Sequence[Any], cursor: Optional[str]):
+    """커서 이후의 행만 조회하는 조건 (정렬 키 전체에 대한 row value 비교)
+
+    keys 는 ORDER BY 와 같은 순서의 오름차순 정렬 키이며 마지막 키는 유일해야 한다.
+    """
+    if not cursor:
+        return None
+    values = decode_cursor(cursor, len(keys))
+    return tuple_(*keys) > tuple_(*values)
@@ -0,0 +1,196 @@
+"""주요 엔드포인트 처리량/지연시간 측정
+
+사용법 (back-end 디렉토리에서):
+    python -m benchmarks.bench_endpoints --mentors 10000 --requests 100000 --duration 10
+    python -m benchmarks.bench_endpoints --scenario mentors_skill --compare results/old.json
+
+임시 SQLite DB 를 benchmarks.seed 로 채운 뒤 main:app 을 httpx ASGI transport 로
+프로세스 안에서 호출한다 (네트워크/서버 오버헤드 제외). 시나리오마다 --duration 초 동안
+--concurrency 개 작업자로 부하를 주고 처리량과 p50/p95/p99 를 JSON 으로 저장한다.
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+
+from benchmarks import seed as seed_module
+from benchmarks.common import compare, environment_info, run_load, write_results
+
+SCENARIOS = (
+    "login", "me", "mentors_page", "mentors_skill", "mentors_search", "mentors_all",
+    "incoming", "profile_image", "thumbnail",
+)
+
+
+def _build_scenarios(client, data):
+    """시나리오 이름 -> request(i) 함수 (HTTP 상태 코드 반환)"""
+    from app.utils.auth import create_access_token
+
+    mentor_first, mentor_last = data["mentor_ids"]
+    mentee_first, mentee_last = data["mentee_ids"]
+    mentor_count = mentor_last - mentor_first + 1
+    mentee_count = mentee_last - mentee_first + 1
+
+    def token(user_id, role, email):
+        return create_access_token({"user_id": user_id, "email": email, "name": email, "role": role})
+
+    # 로그인 비용을 시나리오마다 치르지 않도록 토큰은 직접 발급
+    mentee_headers = [
+        {"Authorization": "Bearer " + token(mentee_first + i, "mentee", f"mentee{i}@bench.io")}
+        for i in range(min(mentee_count, 200))
+    ]
+    mentor_headers = [
+        {"Authorization": "Bearer " + token(mentor_first + i, "mentor", f"mentor{i}@bench.io")}
+        for i in range(min(mentor_count, 200))
+    ]
+    image_mentors = data["image_mentor_ids"] or [mentor_first]
+    thumbnails = data["thumbnail_urls"] or ["/api/images/v/missing/128.webp"]
+    skill = seed_module.SKILLS[0]
+
+    async def login(i):
+        r = await client.post("/api/login", json={
+            "email": f"mentee{i % mentee_count}@bench.io", "password": seed_module.PASSWORD
+        })
+        return r.status_code
+
+    async def me(i):
+        return (await client.get("/api/me", headers=mentee_headers[i % len(mentee_headers)])).status_code
+
+    async def mentors_page(i):
+        r = await client.get("/api/mentors", params={"limit": 20},
+                             headers=mentee_headers[i % len(mentee_headers)])
+        return r.status_code
+
+    async def mentors_skill(i):
+        r = await client.get("/api/mentors", params={"skill": skill, "limit": 20},
+                             headers=mentee_headers[i % len(mentee_headers)])
+        return r.status_code
+
+    async def mentors_search(i):
+        # 타이핑 중인 검색어처럼 스킬명 접두사로 검색
+        prefix = seed_module.SKILLS[i % len(seed_module.SKILLS)][:3]
+        r = await client.get("/api/mentors", params={"q": prefix, "limit": 20},
+                             headers=mentee_headers[i % len(mentee_headers)])
+        return r.status_code
+
+    async def mentors_all(i):
+        r = await client.get("/api/mentors", headers=mentee_headers[i % len(mentee_headers)])
+        return r.status_code
+
+    async def incoming(i):
+        r = await client.get("/api/match-requests/incoming",
+                             headers=mentor_headers[i % len(mentor_headers)])
+        return r.status_code
+
+    async def profile_image(i):
+        mentor_id = image_mentors[i % len(image_mentors)]
+        return (await client.get(f"/api/images/mentor/{mentor_id}")).status_code
+
+    async def thumbnail(i):
+        return (await client.get(thumbnails[i % len(thumbnails)])).status_code
+
+    return {
+        "login": login, "me": me, "mentors_page": mentors_page, "mentors_skill": mentors_skill,
+        "mentors_search": mentors_search, "mentors_all": mentors_all, "incoming": incoming, "profile_image": profile_image,
+        "thumbnail": thumbnail,
+    }
+
+
+def _image_samples(limit: int = 200):
+    """이미지가 있는 멘토 ID 와 썸네일 URL 샘플"""
+    from sqlalchemy import select
+
+    from app.core.database import engine
+    from app.models.user import User
+    from app.services.image_store import THUMBNAIL_VARIANT, profile_image_url
+
+    with engine.connect() as conn:
+        rows = conn.execute(
+            select(User.id, User.image_hash, User.image_mime)
+            .where(User.image_hash.is_not(None)).limit(limit)
+        ).all()
+    return (
+        [row.id for row in rows],
+        ["/api" + profile_image_url("mentor", row.id, row.image_hash, row.image_mime, THUMBNAIL_VARIANT)
+         for row in rows],
+    )
+
+
+async def _run(args, data):
+    import httpx
+    from main import app
+
+    transport = httpx.ASGITransport(app=app)
+    # ASGITransport 는 lifespan 을 실행하지 않으므로 직접 실행 (종료 시 풀/DB 연결 정리)
+    async with app.router.lifespan_context(app), \
+            httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        scenarios = _build_scenarios(client, data)
+        results = {}
+        for name in args.scenario or SCENARIOS:
+            print(f"▶ {name} ...", file=sys.stderr)
+            results[name] = await run_load(
+                scenarios[name], args.concurrency, args.duration, warmup=args.warmup
+            )
+        return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    seed_module.add_arguments(parser)
+    parser.add_argument("--scenario", action="append", choices=SCENARIOS,
+                        help="실행할 시나리오 (여러 번 지정 가능, 기본값: 전체)")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.0, help="시나리오별 측정 시간 (초)")
+    parser.add_argument("--warmup", type=int, default=20, help="측정 전 워밍업 요청 수")
+    parser.add_argument("--log-n", type=int, help="로그인 시나리오의 scrypt 비용 (기본값: 앱 설정)")
+    parser.add_argument("--output", help="결과 JSON 저장 경로 (기본값: benchmarks/results/)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+
+    # 앱 임포트 전에 임시 DB/이미지 저장소 지정
+    workdir = tempfile.mkdtemp(prefix="bench-endpoints-")
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+    os.environ["IMAGE_DIR"] = os.path.join(workdir, "images")
+    # 느린 요청 경고 등 로그가 측정을 방해하지 않도록 함
+    os.environ.setdefault("LOG_LEVEL", "ERROR")
+    # 부하 생성기 하나(같은 IP, 소수의 사용자)가 보내는 요청이므로 속도 제한은 기본적으로 끔
+    os.environ.setdefault("RATE_LIMIT_IP_PER_SECOND", "0")
+    os.environ.setdefault("RATE_LIMIT_USER_PER_SECOND", "0")
+    if args.log_n:
+        os.environ["PASSWORD_SCRYPT_LOG_N"] = str(args.log_n)
+    os.makedirs(os.environ["IMAGE_DIR"], exist_ok=True)
+
+    data = seed_module.seed(args.mentors, args.mentees, args.requests, args.image_ratio,
+                            args.distinct_images, args.skills_per_mentor, args.seed)
+    data["image_mentor_ids"], data["thumbnail_urls"] = _image_samples()
+    print(f"✔ seeded {json.dumps({k: v for k, v in data.items() if k in ('mentors', 'mentees', 'match_requests', 'seconds')})}",
+          file=sys.stderr)
+
+    scenarios = asyncio.run(_run(args, data))
+
+    from app.core.config import settings
+    result = {
+        "benchmark": "endpoints",
+        "environment": environment_info(),
+        "settings": {
+            "concurrency": args.concurrency,
+            "duration": args.duration,
+            "db_async": os.environ.get("DB_ASYNC", "true"),
+            "password_scrypt_log_n": settings.PASSWORD_SCRYPT_LOG_N,
+            "seed": {k: data[k] for k in ("mentors", "mentees", "match_requests", "distinct_images")},
+        },
+        "scenarios": scenarios,
+    }
+    if args.compare:
+        with open(args.compare) as f:
+            result["change_pct"] = compare(result["scenarios"], json.load(f)["scenarios"])
+
+    path = write_results(result, args.output, "endpoints")
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    print(f"✔ saved {path}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
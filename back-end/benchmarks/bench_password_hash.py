@@ -0,0 +1,139 @@
+"""비밀번호 해싱 비용별 로그인 처리량 측정
+
+사용법 (back-end 디렉토리에서):
+    python -m benchmarks.bench_password_hash --log-n 14 --concurrency 32 --duration 10
+
+임시 SQLite DB 에 사용자를 만든 뒤 /api/login 을 동시에 호출하면서
+같은 시간 동안 /api/me 지연시간도 함께 측정해 해싱이 다른 엔드포인트를
+굶기지 않는지 확인한다.
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.common import summary
+
+
+def _raw_hash_rate(log_n, r, p, seconds=2.0):
+    """요청 처리 없이 순수 해싱 속도 측정 (hashes/sec)"""
+    from app.utils.auth import get_password_hash
+    count = 0
+    started = time.perf_counter()
+    while time.perf_counter() - started < seconds:
+        get_password_hash("benchmark-password")
+        count += 1
+    return count / (time.perf_counter() - started)
+
+
+async def _run(args):
+    import httpx
+    from main import app
+    from app.core.database import SessionLocal, engine
+    from app.core.migrations import run_migrations
+    from app.models.user import User, UserRole
+    from app.utils.auth import get_password_hash, password_pool
+
+    # 사용자 생성 (해시는 한 번만 계산해 재사용)
+    password = "benchmark-password"
+    password_hash = get_password_hash(password)
+    run_migrations(engine)
+    db = SessionLocal()
+    try:
+        db.add_all([
+            User(email=f"user{i}@bench.io", password_hash=password_hash, name=f"User {i}",
+                 role=UserRole.MENTEE, bio="")
+            for i in range(args.users)
+        ])
+        db.commit()
+    finally:
+        db.close()
+
+    # ASGITransport 는 lifespan 을 실행하지 않으므로 직접 실행 (종료 시 풀/DB 연결 정리)
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app), \
+            httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        response = await client.post("/api/login", json={"email": "user0@bench.io", "password": password})
+        token = response.json()["token"]
+        headers = {"Authorization": f"Bearer {token}"}
+
+        login_latencies, me_latencies = [], []
+        errors = {}
+        deadline = time.perf_counter() + args.duration
+
+        async def login_worker(worker_id):
+            i = worker_id
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                r = await client.post("/api/login", json={
+                    "email": f"user{i % args.users}@bench.io", "password": password
+                })
+                if r.status_code == 200:
+                    login_latencies.append(time.perf_counter() - started)
+                else:
+                    errors[r.status_code] = errors.get(r.status_code, 0) + 1
+                i += args.concurrency
+
+        async def me_probe():
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                await client.get("/api/me", headers=headers)
+                me_latencies.append(time.perf_counter() - started)
+                await asyncio.sleep(0.01)
+
+        started = time.perf_counter()
+        await asyncio.gather(me_probe(), *[login_worker(i) for i in range(args.concurrency)])
+        elapsed = time.perf_counter() - started
+
+    return {
+        "login": summary(login_latencies, elapsed),
+        "login_errors": errors,
+        "me_during_logins": summary(me_latencies, elapsed),
+        "password_pool": password_pool.stats(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--log-n", type=int, default=14, help="scrypt N = 2^log_n")
+    parser.add_argument("--r", type=int, default=8)
+    parser.add_argument("--p", type=int, default=1)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="해싱 풀 스레드 수")
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0, help="측정 시간 (초)")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    # 앱 임포트 전에 임시 DB 와 해싱 설정 지정
+    workdir = tempfile.mkdtemp(prefix="bench-password-")
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+    os.environ["IMAGE_DIR"] = os.path.join(workdir, "images")
+    os.environ["PASSWORD_SCRYPT_LOG_N"] = str(args.log_n)
+    os.environ["PASSWORD_SCRYPT_R"] = str(args.r)
+    os.environ["PASSWORD_SCRYPT_P"] = str(args.p)
+    os.environ["PASSWORD_HASH_WORKERS"] = str(args.workers)
+    os.environ["PASSWORD_HASH_MAX_PENDING"] = str(max(args.concurrency * 2, 64))
+    # 해싱 풀 자체를 측정하므로 요청 허용 제어/속도 제한은 끔
+    os.environ["ADMISSION_ENABLED"] = "false"
+
+    result = {
+        "cost": {"log_n": args.log_n, "r": args.r, "p": args.p, "memory_mib": round(128 * (1 << args.log_n) * args.r / 2**20, 1)},
+        "workers": args.workers,
+        "concurrency": args.concurrency,
+        "raw_hashes_per_sec": round(_raw_hash_rate(args.log_n, args.r, args.p), 2),
+    }
+    result.update(asyncio.run(_run(args)))
+
+    output = json.dumps(result, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
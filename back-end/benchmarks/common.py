@@ -0,0 +1,101 @@
+"""벤치마크 공용 도구 (지연시간 통계, 부하 생성, 결과 저장)"""
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+
+# 결과 JSON 기본 저장 위치
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+
+def percentile(samples, q):
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summary(latencies, elapsed):
+    return {
+        "requests": len(latencies),
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+    }
+
+
+async def run_load(request: Callable[[int], Awaitable[int]], concurrency: int,
+                   duration: float, warmup: int = 0) -> Dict:
+    """closed-loop 부하: concurrency 개 작업자가 duration 초 동안 request(i) 를 반복 호출
+
+    request 는 HTTP 상태 코드를 반환한다. 2xx/304 가 아닌 응답은 errors 에 집계된다.
+    """
+    for i in range(warmup):
+        await request(i)
+
+    latencies: List[float] = []
+    errors: Dict[str, int] = {}
+    deadline = time.perf_counter() + duration
+
+    async def worker(worker_id: int):
+        i = worker_id
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            status = await request(i)
+            if 200 <= status < 300 or status == 304:
+                latencies.append(time.perf_counter() - started)
+            else:
+                errors[str(status)] = errors.get(str(status), 0) + 1
+            i += concurrency
+
+    started = time.perf_counter()
+    await asyncio.gather(*[worker(i) for i in range(concurrency)])
+    result = summary(latencies, time.perf_counter() - started)
+    result["errors"] = errors
+    return result
+
+
+def environment_info() -> Dict:
+    """결과 비교용 실행 환경 정보"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "git_commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def write_results(result: Dict, output: Optional[str], prefix: str) -> str:
+    """결과 JSON 저장 (output 미지정 시 results/<prefix>-<시각>.json)"""
+    if not output:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, f"{prefix}-{time.strftime('%Y%m%d-%H%M%S')}.json")
+    with open(output, "w") as f:
+        json.dump(result, f, indent=2, ensure_ascii=False)
+    return output
+
+
+def compare(current: Dict[str, Dict], baseline: Dict[str, Dict]) -> Dict[str, Dict]:
+    """시나리오별 처리량/p95 변화율 (%) 계산"""
+    changes = {}
+    for name, stats in current.items():
+        before = baseline.get(name)
+        if not before:
+            continue
+        changes[name] = {}
+        for key in ("throughput_rps", "p50_ms", "p95_ms", "p99_ms"):
+            if before.get(key):
+                changes[name][key] = round((stats[key] - before[key]) / before[key] * 100, 1)
+    return changes
@@ -0,0 +1,175 @@
+"""벤치마크용 합성 데이터 생성
+
+사용법 (back-end 디렉토리에서):
+    DATABASE_URL=sqlite:////tmp/bench.db IMAGE_DIR=/tmp/bench-images \
+        python -m benchmarks.seed --mentors 10000 --mentees 5000 --requests 100000
+
+앱과 같은 모델/마이그레이션으로 스키마를 만든 뒤 ORM 을 거치지 않고 executemany 로
+대량 삽입한다. 매칭 요청은 DB 유니크 규칙(멘티당 대기 1건, 멘토당 수락 1건,
+같은 멘토에게 활성 요청 1건)을 지키도록 생성한다.
+"""
+import argparse
+import io
+import json
+import random
+import sys
+import time
+from typing import Dict, List
+
+SKILLS = [
+    "React", "Vue", "Angular", "Svelte", "TypeScript", "JavaScript", "Python", "FastAPI",
+    "Django", "Flask", "Java", "Spring", "Kotlin", "Go", "Rust", "C++", "SQL", "PostgreSQL",
+    "MongoDB", "Redis", "Docker", "Kubernetes", "AWS", "GCP", "Terraform", "GraphQL",
+    "Node.js", "Next.js", "Swift", "Flutter", "Machine Learning", "Data Engineering",
+]
+
+# 벤치마크 사용자 공통 비밀번호
+PASSWORD = "benchmark-password"
+BATCH_SIZE = 5000
+
+
+def _batches(rows: List[Dict], size: int = BATCH_SIZE):
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+def _make_images(count: int, rng: random.Random) -> List:
+    """서로 다른 프로필 이미지 생성 후 저장소에 저장 (썸네일 포함)"""
+    from PIL import Image
+    from app.services.image_store import generate_renditions, save_image
+
+    stored = []
+    for _ in range(count):
+        color = tuple(rng.randrange(256) for _ in range(3))
+        image = Image.new("RGB", (600, 600), color)
+        buffer = io.BytesIO()
+        image.save(buffer, "JPEG", quality=85)
+        data = buffer.getvalue()
+        saved = save_image(data, "JPEG")
+        generate_renditions(data, saved.hash)
+        stored.append(saved)
+    return stored
+
+
+def seed(mentors: int, mentees: int, requests: int, image_ratio: float = 0.5,
+         distinct_images: int = 50, skills_per_mentor: int = 3, seed_value: int = 42) -> Dict:
+    """현재 DATABASE_URL 에 데이터 생성, 생성된 ID 범위 등 요약 반환"""
+    from sqlalchemy import insert
+
+    from app.core.database import engine
+    from app.core.migrations import run_migrations
+    from app.models.user import MatchRequest, MatchRequestStatus, MentorSkill, User, UserRole
+    from app.services.skills import normalize_skills
+    from app.utils.auth import get_password_hash
+
+    rng = random.Random(seed_value)
+    started = time.perf_counter()
+    run_migrations(engine)
+
+    password_hash = get_password_hash(PASSWORD)
+    images = _make_images(distinct_images, rng) if image_ratio > 0 and distinct_images > 0 else []
+
+    user_rows, skill_rows = [], []
+    for i in range(mentors):
+        skills = rng.sample(SKILLS, k=min(skills_per_mentor, len(SKILLS)))
+        row = {
+            "email": f"mentor{i}@bench.io", "password_hash": password_hash, "role": UserRole.MENTOR,
+            "name": f"Mentor {i:06d}", "bio": f"Mentor {i} bio", "skills": json.dumps(skills),
+            "image_hash": None, "image_mime": None, "image_size": None,
+        }
+        if images and rng.random() < image_ratio:
+            image = rng.choice(images)
+            row.update(image_hash=image.hash, image_mime=image.mime, image_size=image.size)
+        user_rows.append(row)
+        skill_rows.append(normalize_skills(skills))
+    for i in range(mentees):
+        user_rows.append({
+            "email": f"mentee{i}@bench.io", "password_hash": password_hash, "role": UserRole.MENTEE,
+            "name": f"Mentee {i:06d}", "bio": "", "skills": None,
+            "image_hash": None, "image_mime": None, "image_size": None,
+        })
+
+    with engine.begin() as conn:
+        first_id = (conn.exec_driver_sql("SELECT COALESCE(MAX(id), 0) FROM users").scalar() or 0) + 1
+        for batch in _batches(user_rows):
+            conn.execute(insert(User), batch)
+
+        mentor_ids = list(range(first_id, first_id + mentors))
+        mentee_ids = list(range(first_id + mentors, first_id + mentors + mentees))
+        mentor_skill_rows = [
+            {"mentor_id": mentor_id, "skill": skill, "position": position}
+            for mentor_id, skills in zip(mentor_ids, skill_rows)
+            for position, skill in enumerate(skills)
+        ]
+        for batch in _batches(mentor_skill_rows):
+            conn.execute(insert(MentorSkill), batch)
+
+        request_rows = _match_request_rows(
+            requests, mentor_ids, mentee_ids, rng, MatchRequestStatus
+        )
+        for batch in _batches(request_rows):
+            conn.execute(insert(MatchRequest), batch)
+
+    return {
+        "mentors": mentors,
+        "mentees": mentees,
+        "match_requests": len(request_rows),
+        "mentor_ids": [mentor_ids[0], mentor_ids[-1]] if mentor_ids else [],
+        "mentee_ids": [mentee_ids[0], mentee_ids[-1]] if mentee_ids else [],
+        "distinct_images": len(images),
+        "seconds": round(time.perf_counter() - started, 2),
+    }
+
+
+def _match_request_rows(count: int, mentor_ids: List[int], mentee_ids: List[int],
+                        rng: random.Random, statuses) -> List[Dict]:
+    """유니크 규칙을 지키는 매칭 요청 생성
+
+    멘티마다 서로 다른 멘토에게 요청을 보내며, 마지막 요청만 대기/수락 상태가 될 수 있다.
+    """
+    if not mentor_ids or not mentee_ids:
+        return []
+    per_mentee = max(1, min(len(mentor_ids), -(-count // len(mentee_ids))))
+    accepted_mentors = set()
+    closed = [statuses.REJECTED, statuses.CANCELLED]
+    rows = []
+    for mentee_id in mentee_ids:
+        targets = rng.sample(mentor_ids, k=per_mentee)
+        for index, mentor_id in enumerate(targets):
+            if len(rows) >= count:
+                return rows
+            status = rng.choice(closed)
+            if index == len(targets) - 1:
+                if mentor_id not in accepted_mentors and rng.random() < 0.2:
+                    status = statuses.ACCEPTED
+                    accepted_mentors.add(mentor_id)
+                elif rng.random() < 0.5:
+                    status = statuses.PENDING
+            rows.append({
+                "mentor_id": mentor_id, "mentee_id": mentee_id,
+                "message": f"Request from mentee {mentee_id}", "status": status,
+            })
+    return rows
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--mentors", type=int, default=10000)
+    parser.add_argument("--mentees", type=int, default=5000)
+    parser.add_argument("--requests", type=int, default=100000)
+    parser.add_argument("--image-ratio", type=float, default=0.5, help="이미지가 있는 멘토 비율")
+    parser.add_argument("--distinct-images", type=int, default=50, help="서로 다른 이미지 수")
+    parser.add_argument("--skills-per-mentor", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_arguments(parser)
+    args = parser.parse_args()
+    result = seed(args.mentors, args.mentees, args.requests, args.image_ratio,
+                  args.distinct_images, args.skills_per_mentor, args.seed)
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,449 @@
+"""여러 uvicorn 워커가 같은 SQLite DB 를 공유할 때의 동시성 소크 테스트
+
+사용법 (back-end 디렉토리에서, Linux):
+    python -m benchmarks.soak --workers 4 --duration 300 --concurrency 64
+
+임시 디렉토리에 benchmarks.seed 로 DB 를 만든 뒤 `uvicorn main:app --workers N` 을 띄우고,
+사용자 시나리오(멘토 탐색, 매칭 요청 전송, 수락/거절/취소, 프로필 수정)를 섞은 부하를
+실제 HTTP 로 보낸다. --sample-interval 초마다 구간별 처리량/지연시간/5xx/
+"database is locked" 발생 수와 워커 프로세스 RSS 를 기록하고, 전체 결과를 JSON 으로 저장한다.
+외부 서비스 없이 한 대의 Linux 머신에서 실행된다.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+from benchmarks.common import compare, environment_info, percentile, write_results
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LOCKED_MESSAGE = "database is locked"
+
+# 시나리오 가중치 (user story 비율)
+DEFAULT_MIX = {
+    "browse_mentors": 50,
+    "browse_by_skill": 15,
+    "send_request": 10,
+    "cancel_request": 5,
+    "review_incoming": 10,
+    "accept_or_reject": 5,
+    "update_profile": 5,
+}
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _descendants(pid: int) -> List[int]:
+    """/proc 에서 pid 의 모든 자손 프로세스 (워커, 이미지 처리 프로세스 포함)"""
+    children: Dict[int, List[int]] = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                # comm 에 공백/괄호가 있을 수 있으므로 마지막 ')' 이후를 파싱
+                fields = f.read().rsplit(")", 1)[1].split()
+            children.setdefault(int(fields[1]), []).append(int(entry))
+        except (OSError, IndexError, ValueError):
+            continue
+    result, stack = [], [pid]
+    while stack:
+        for child in children.get(stack.pop(), []):
+            result.append(child)
+            stack.append(child)
+    return result
+
+
+def _rss_kb(pid: int) -> Optional[int]:
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        return None
+    return None
+
+
+class LogWatcher:
+    """서버 로그에서 'database is locked' 발생 횟수를 구간별로 집계"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.offset = 0
+        self.total = 0
+
+    def poll(self) -> int:
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(self.offset)
+                chunk = f.read()
+                self.offset = f.tell()
+        except OSError:
+            return 0
+        count = chunk.decode("utf-8", "replace").count(LOCKED_MESSAGE)
+        self.total += count
+        return count
+
+
+class Recorder:
+    """요청 결과 기록 (구간별/시나리오별 집계)"""
+
+    def __init__(self):
+        self.window: List[tuple] = []
+        self.by_action: Dict[str, List[float]] = {}
+        self.status_by_action: Dict[str, Dict[str, int]] = {}
+        self.total = 0
+        self.server_errors = 0
+        self.client_errors = 0
+
+    def record(self, action: str, latency: float, status: int, locked: bool = False) -> None:
+        self.window.append((latency, status, locked))
+        self.by_action.setdefault(action, []).append(latency)
+        counts = self.status_by_action.setdefault(action, {})
+        key = "locked" if locked else str(status)
+        counts[key] = counts.get(key, 0) + 1
+        self.total += 1
+        if status >= 500 or locked:
+            self.server_errors += 1
+        elif status >= 400:
+            self.client_errors += 1
+
+    def take_window(self) -> List[tuple]:
+        window, self.window = self.window, []
+        return window
+
+
+class Personas:
+    """로그인한 멘토/멘티 토큰과 하네스가 만든 매칭 요청 추적"""
+
+    def __init__(self, mentors: List[dict], mentees: List[dict]):
+        self.mentors = mentors
+        self.mentees = mentees
+        # 멘티 ID -> 대기 중인 요청 ID (하네스가 보낸 것)
+        self.pending: Dict[int, int] = {}
+
+
+async def _timed(client, recorder: Recorder, action: str, method: str, url: str, **kwargs):
+    started = time.perf_counter()
+    try:
+        response = await client.request(method, url, **kwargs)
+    except Exception:
+        # 연결 오류/타임아웃은 5xx 와 같이 서버 오류로 집계
+        recorder.record(action, time.perf_counter() - started, 599)
+        return None
+    locked = response.status_code >= 500 and LOCKED_MESSAGE in response.text
+    recorder.record(action, time.perf_counter() - started, response.status_code, locked)
+    return response
+
+
+async def _scenario(action: str, client, personas: Personas, recorder: Recorder, rng: random.Random,
+                    skills: List[str]) -> None:
+    mentee = rng.choice(personas.mentees)
+    mentor = rng.choice(personas.mentors)
+
+    if action == "browse_mentors":
+        await _timed(client, recorder, action, "GET", "/api/mentors",
+                     params={"limit": 20, "orderBy": rng.choice(["name", "skill"])},
+                     headers=mentee["headers"])
+    elif action == "browse_by_skill":
+        await _timed(client, recorder, action, "GET", "/api/mentors",
+                     params={"skill": rng.choice(skills), "limit": 20}, headers=mentee["headers"])
+    elif action == "send_request":
+        response = await _timed(client, recorder, action, "POST", "/api/match-requests", json={
+            "mentorId": mentor["id"], "menteeId": mentee["id"], "message": "soak test request",
+        }, headers=mentee["headers"])
+        if response is not None and response.status_code == 200:
+            personas.pending[mentee["id"]] = response.json()["id"]
+    elif action == "cancel_request":
+        request_id = personas.pending.pop(mentee["id"], None)
+        if request_id is None:
+            await _timed(client, recorder, action, "GET", "/api/match-requests/outgoing",
+                         headers=mentee["headers"])
+        else:
+            await _timed(client, recorder, action, "DELETE", f"/api/match-requests/{request_id}",
+                         headers=mentee["headers"])
+    elif action == "review_incoming":
+        await _timed(client, recorder, action, "GET", "/api/match-requests/incoming",
+                     headers=mentor["headers"])
+    elif action == "accept_or_reject":
+        response = await _timed(client, recorder, "review_incoming", "GET",
+                                "/api/match-requests/incoming", headers=mentor["headers"])
+        if response is None or response.status_code != 200:
+            return
+        pending = [item for item in response.json() if item["status"] == "pending"]
+        if pending:
+            target = rng.choice(pending)
+            decision = "accept" if rng.random() < 0.3 else "reject"
+            await _timed(client, recorder, action, "PUT",
+                         f"/api/match-requests/{target['id']}/{decision}", headers=mentor["headers"])
+    elif action == "update_profile":
+        persona, role = (mentor, "mentor") if rng.random() < 0.5 else (mentee, "mentee")
+        payload = {"id": persona["id"], "name": f"Soak {rng.randrange(10**6)}", "role": role,
+                   "bio": "updated by soak test", "image": ""}
+        if role == "mentor":
+            payload["skills"] = rng.sample(skills, k=3)
+        await _timed(client, recorder, action, "PUT", "/api/profile", json=payload,
+                     headers=persona["headers"])
+
+
+async def _login_all(client, role: str, count: int, first_id: int) -> List[dict]:
+    from benchmarks.seed import PASSWORD
+
+    personas = []
+    for i in range(count):
+        response = await client.post("/api/login", json={"email": f"{role}{i}@bench.io", "password": PASSWORD})
+        response.raise_for_status()
+        personas.append({
+            "id": first_id + i,
+            "headers": {"Authorization": f"Bearer {response.json()['token']}"},
+        })
+    return personas
+
+
+async def _wait_ready(client, process: subprocess.Popen, timeout: float = 60.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("server exited during startup, see server log")
+        try:
+            if (await client.get("/openapi.json")).status_code == 200:
+                return
+        except Exception:
+            pass
+        await asyncio.sleep(0.5)
+    raise RuntimeError("server did not become ready")
+
+
+async def _soak(args, base_url: str, process: subprocess.Popen, seed_info: dict, log_path: str) -> dict:
+    import httpx
+
+    from benchmarks.seed import SKILLS
+
+    actions, weights = list(args.mix_weights), list(args.mix_weights.values())
+
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=args.timeout) as client:
+        await _wait_ready(client, process)
+        mentor_first = seed_info["mentor_ids"][0]
+        mentee_first = seed_info["mentee_ids"][0]
+        personas = Personas(
+            await _login_all(client, "mentor", min(args.personas, seed_info["mentors"]), mentor_first),
+            await _login_all(client, "mentee", min(args.personas, seed_info["mentees"]), mentee_first),
+        )
+
+        recorder = Recorder()
+        watcher = LogWatcher(log_path)
+        watcher.poll()  # 시작 전 로그는 제외
+        samples = []
+        started = time.monotonic()
+        deadline = started + args.duration
+
+        async def worker(worker_id: int):
+            rng = random.Random(args.seed + worker_id)
+            while time.monotonic() < deadline:
+                action = rng.choices(actions, weights)[0]
+                await _scenario(action, client, personas, recorder, rng, SKILLS)
+
+        async def sampler():
+            last = time.monotonic()
+            while time.monotonic() < deadline:
+                await asyncio.sleep(args.sample_interval)
+                now = time.monotonic()
+                window = recorder.take_window()
+                latencies = [item[0] for item in window]
+                pids = [process.pid] + _descendants(process.pid)
+                rss = {str(pid): _rss_kb(pid) for pid in pids}
+                samples.append({
+                    "t": round(now - started, 1),
+                    "requests": len(window),
+                    "throughput_rps": round(len(window) / (now - last), 2),
+                    "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+                    "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+                    "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+                    "server_errors": sum(1 for item in window if item[1] >= 500 or item[2]),
+                    "locked_responses": sum(1 for item in window if item[2]),
+                    "locked_in_log": watcher.poll(),
+                    "rss_kb": rss,
+                    "rss_total_kb": sum(value for value in rss.values() if value),
+                })
+                last = now
+                if args.verbose:
+                    sample = samples[-1]
+                    print(f"t={sample['t']}s rps={sample['throughput_rps']} p99={sample['p99_ms']}ms "
+                          f"5xx={sample['server_errors']} locked={sample['locked_in_log']} "
+                          f"rss={sample['rss_total_kb'] // 1024}MiB", file=sys.stderr)
+
+        await asyncio.gather(sampler(), *[worker(i) for i in range(args.concurrency)])
+        elapsed = time.monotonic() - started
+        watcher.poll()
+
+    all_latencies = [latency for values in recorder.by_action.values() for latency in values]
+    locked_total = max(watcher.total, sum(s["locked_responses"] for s in samples))
+    return {
+        "summary": {
+            "requests": recorder.total,
+            "throughput_rps": round(recorder.total / elapsed, 2),
+            "p50_ms": round(percentile(all_latencies, 50) * 1000, 2),
+            "p95_ms": round(percentile(all_latencies, 95) * 1000, 2),
+            "p99_ms": round(percentile(all_latencies, 99) * 1000, 2),
+            "server_errors": recorder.server_errors,
+            "client_errors": recorder.client_errors,
+            "locked_errors": locked_total,
+            "locked_error_rate": round(locked_total / recorder.total, 6) if recorder.total else 0.0,
+            "rss_growth_kb": _rss_growth(samples),
+        },
+        "scenarios": {
+            action: {
+                "requests": len(latencies),
+                "throughput_rps": round(len(latencies) / elapsed, 2),
+                "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+                "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+                "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+                "status": recorder.status_by_action[action],
+            }
+            for action, latencies in recorder.by_action.items()
+        },
+        "samples": samples,
+    }
+
+
+def _rss_growth(samples: List[dict]) -> Dict[str, int]:
+    """프로세스별 첫 샘플 대비 마지막 샘플 RSS 증가량 (KB)"""
+    if len(samples) < 2:
+        return {}
+    first, last = samples[0]["rss_kb"], samples[-1]["rss_kb"]
+    growth = {
+        pid: last[pid] - first[pid]
+        for pid in last
+        if first.get(pid) is not None and last[pid] is not None
+    }
+    growth["total"] = samples[-1]["rss_total_kb"] - samples[0]["rss_total_kb"]
+    return growth
+
+
+def _parse_mix(items: Optional[List[str]], parser: argparse.ArgumentParser) -> Dict[str, int]:
+    mix = dict(DEFAULT_MIX)
+    for item in items or []:
+        name, _, weight = item.partition("=")
+        if name not in DEFAULT_MIX or not weight.isdigit():
+            parser.error(f"invalid --mix {item!r} (actions: {', '.join(DEFAULT_MIX)})")
+        mix[name] = int(weight)
+    return mix
+
+
+def _seed(args, env: dict) -> dict:
+    """별도 프로세스에서 DB 생성 (이 프로세스는 앱을 임포트하지 않음)"""
+    command = [
+        sys.executable, "-m", "benchmarks.seed",
+        "--mentors", str(args.mentors), "--mentees", str(args.mentees),
+        "--requests", str(args.requests), "--image-ratio", str(args.image_ratio),
+        "--distinct-images", str(args.distinct_images), "--seed", str(args.seed),
+    ]
+    output = subprocess.run(command, cwd=BACKEND_DIR, env=env, check=True,
+                            capture_output=True, text=True).stdout
+    return json.loads(output[output.index("{"):])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=4, help="uvicorn 워커 프로세스 수")
+    parser.add_argument("--duration", type=float, default=300.0, help="측정 시간 (초)")
+    parser.add_argument("--concurrency", type=int, default=64, help="동시 클라이언트 수")
+    parser.add_argument("--sample-interval", type=float, default=5.0, help="구간 집계 간격 (초)")
+    parser.add_argument("--personas", type=int, default=200, help="로그인해서 사용할 멘토/멘티 수 (각각)")
+    parser.add_argument("--mix", action="append", metavar="ACTION=WEIGHT",
+                        help=f"시나리오 가중치 변경 (기본값: {DEFAULT_MIX})")
+    parser.add_argument("--mentors", type=int, default=2000)
+    parser.add_argument("--mentees", type=int, default=2000)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--image-ratio", type=float, default=0.5)
+    parser.add_argument("--distinct-images", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--log-n", type=int, default=12, help="서버 scrypt 비용 (로그인 준비 시간 단축용)")
+    parser.add_argument("--timeout", type=float, default=30.0, help="요청 타임아웃 (초)")
+    parser.add_argument("--db-async", choices=["true", "false"], help="서버 DB_ASYNC 설정")
+    parser.add_argument("--output", help="결과 JSON 저장 경로 (기본값: benchmarks/results/)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    parser.add_argument("--keep", action="store_true", help="임시 DB/로그 디렉토리 유지")
+    parser.add_argument("--verbose", action="store_true", help="구간별 요약 출력")
+    args = parser.parse_args()
+    args.mix_weights = _parse_mix(args.mix, parser)
+
+    workdir = tempfile.mkdtemp(prefix="soak-")
+    env = dict(os.environ)
+    env.update({
+        "DATABASE_URL": f"sqlite:///{os.path.join(workdir, 'soak.db')}",
+        "IMAGE_DIR": os.path.join(workdir, "images"),
+        "PASSWORD_SCRYPT_LOG_N": str(args.log_n),
+        "LOG_LEVEL": env.get("LOG_LEVEL", "WARNING"),
+        "LOG_SLOW_REQUEST_MS": env.get("LOG_SLOW_REQUEST_MS", "60000"),
+        # 부하 생성기 하나(같은 IP)가 보내는 요청이므로 속도 제한은 기본적으로 끔
+        "RATE_LIMIT_IP_PER_SECOND": env.get("RATE_LIMIT_IP_PER_SECOND", "0"),
+        "RATE_LIMIT_USER_PER_SECOND": env.get("RATE_LIMIT_USER_PER_SECOND", "0"),
+        "PYTHONUNBUFFERED": "1",
+    })
+    if args.db_async:
+        env["DB_ASYNC"] = args.db_async
+    os.makedirs(env["IMAGE_DIR"], exist_ok=True)
+
+    print(f"▶ seeding {workdir} ...", file=sys.stderr)
+    seed_info = _seed(args, env)
+
+    port = _free_port()
+    log_path = os.path.join(workdir, "server.log")
+    print(f"▶ starting {args.workers} workers on :{port} (log: {log_path}) ...", file=sys.stderr)
+    with open(log_path, "w") as log:
+        process = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port),
+             "--workers", str(args.workers), "--log-level", "warning", "--no-access-log"],
+            cwd=BACKEND_DIR, env=env, stdout=log, stderr=subprocess.STDOUT,
+        )
+    try:
+        run = asyncio.run(_soak(args, f"http://127.0.0.1:{port}", process, seed_info, log_path))
+    finally:
+        process.send_signal(signal.SIGTERM)
+        try:
+            process.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+    result = {
+        "benchmark": "soak",
+        "environment": environment_info(),
+        "settings": {
+            "workers": args.workers,
+            "duration": args.duration,
+            "concurrency": args.concurrency,
+            "db_async": env.get("DB_ASYNC", "true"),
+            "mix": args.mix_weights,
+            "seed": {k: seed_info[k] for k in ("mentors", "mentees", "match_requests")},
+        },
+        **run,
+    }
+    if args.compare:
+        with open(args.compare) as f:
+            result["change_pct"] = compare(result["scenarios"], json.load(f)["scenarios"])
+
+    path = write_results(result, args.output, "soak")
+    print(json.dumps({"summary": result["summary"], "scenarios": result["scenarios"]}, indent=2))
+    print(f"✔ saved {path}", file=sys.stderr)
+    if not args.keep:
+        import shutil
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,25 +1,37 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import RedirectResponse
-import uvicorn
-import os
-from decouple import config
+from fastapi.responses import JSONResponse, ORJSONResponse, RedirectResponse
+import logging
 
-# 환경변수 로딩 확인
-print(f"🔧 [CONFIG] SECRET_KEY: {config('SECRET_KEY', default='default-secret')[:20]}...")
-print(f"🔧 [CONFIG] ALGORITHM: {config('ALGORITHM', default='HS256')}")
+from app.core.config import settings
+from app.core.logging_config import setup_logging
 
-from app.core.database import engine
-from app.models import User, MatchRequest  # 모델 임포트
-from app.core.database import Base
-from app.routers import auth, users, mentors, match_requests
+# 로깅 설정 (마이그레이션 로그도 같은 형식으로 출력되도록 가장 먼저 실행)
+setup_logging()
+logger = logging.getLogger("app.main")
 
-# 이미지 디렉토리 생성
-os.makedirs("images", exist_ok=True)
+from app.core.database import dispose_engines
+from app.core.middleware import AdmissionMiddleware, CompressionMiddleware, MetricsMiddleware
+from app.routers import admin, auth, events, users, mentors, match_requests, metrics
+from app.services.bounded_pool import PoolSaturated
+from app.services.events import event_bus
+from app.services.image_pool import image_pool
+from app.utils.auth import password_pool
 
-# 데이터베이스 테이블 생성
-Base.metadata.create_all(bind=engine)
+# 스키마 생성/데이터 보정은 임포트 시점에 하지 않고 `python manage.py migrate` 로 실행
+# (워커마다 반복하지 않도록 manage.py serve 는 워커를 띄우기 전에 한 번만 실행)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 수명주기: 알림 버스 시작, 종료 시 이미지 처리/비밀번호 해싱 풀 및 DB 연결 정리"""
+    await event_bus.start()
+    yield
+    await event_bus.stop()
+    image_pool.shutdown()
+    password_pool.shutdown()
+    await dispose_engines()
 
 app = FastAPI(
     title="Mentor-Mentee Matching API",
@@ -27,9 +39,20 @@ app = FastAPI(
     version="1.0.0",
     openapi_url="/openapi.json",
     docs_url="/swagger-ui",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    # response_model 검증 후 직렬화도 orjson 으로 (목록 등 핫 패스는 행에서 바로 ORJSONResponse 반환)
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
+# 요청 허용 제어 (CORS 안쪽에서 거부해 브라우저가 503/429 응답을 읽을 수 있도록 함)
+if settings.ADMISSION_ENABLED:
+    app.add_middleware(AdmissionMiddleware)
+
+# 응답 압축 (br/gzip 협상, 작은 응답/이미지/SSE 제외)
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -37,21 +60,38 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
+# 라우트별 응답 시간/상태 코드/쿼리 수 측정 (가장 바깥에서 CORS 처리 시간까지 포함)
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
+@app.exception_handler(PoolSaturated)
+async def pool_saturated_handler(request, exc: PoolSaturated):
+    """CPU 작업 풀이 포화 상태이면 503 + Retry-After 로 응답"""
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Server is busy, please retry later"},
+        headers={"Retry-After": str(exc.retry_after)}
+    )
+
 # Include routers
 app.include_router(auth.router, prefix="/api", tags=["Authentication"])
 app.include_router(users.router, prefix="/api", tags=["User Profile"])
 app.include_router(mentors.router, prefix="/api", tags=["Mentors"])
 app.include_router(match_requests.router, prefix="/api", tags=["Match Requests"])
+app.include_router(events.router, prefix="/api", tags=["Events"])
+app.include_router(admin.router, prefix="/api", tags=["Admin"])
+if settings.METRICS_ENABLED:
+    app.include_router(metrics.router)
 
-# Static files for images
-app.mount("/images", StaticFiles(directory="images"), name="images")
+# Static files for images (디렉토리는 migrate 단계에서 생성)
+app.mount("/images", StaticFiles(directory=settings.IMAGE_DIR, check_dir=False), name="images")
 
 @app.get("/")
 async def root():
     """Redirect to Swagger UI"""
-    print("🌐 [API] 루트 엔드포인트 접근됨")
     return RedirectResponse(url="/swagger-ui")
 
 # API 문서 리다이렉트 추가
@@ -60,7 +100,11 @@ async def api_docs():
     return RedirectResponse(url="/swagger-ui")
 
 if __name__ == "__main__":
-    print("🚀 [SERVER] 백엔드 서버 시작 중...")
-    print("🔧 [SERVER] 포트: 8080")
-    print("📡 [SERVER] CORS 허용 도메인: localhost:3000, 3001, 3002")
-    uvicorn.run("main:app", host="0.0.0.0", port=8080, reload=True, log_level="info")
+    # 개발 서버 (자동 재시작, 단일 프로세스) - 운영 환경은 python manage.py serve 사용
+    import uvicorn
+    from app.core.database import engine
+    from app.core.migrations import run_migrations
+
+    run_migrations(engine)
+    logger.info("🚀 [SERVER] 개발 서버 시작 중... (포트 %d)", settings.SERVER_PORT)
+    uvicorn.run("main:app", host="0.0.0.0", port=settings.SERVER_PORT, reload=True, log_level="info")
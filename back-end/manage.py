@@ -0,0 +1,198 @@
+"""관리 명령
+
+사용법 (back-end 디렉토리에서):
+    python manage.py migrate
+    python manage.py serve --workers 4
+    python manage.py import-users users.csv
+    python manage.py import-users users.ndjson --batch-size 5000 --workers 16
+"""
+import argparse
+import asyncio
+import importlib.util
+import json
+import logging
+import os
+import sys
+
+from app.core.logging_config import setup_logging
+
+logger = logging.getLogger("app.manage")
+
+
+def _migrate(args) -> int:
+    from app.core.database import engine
+    from app.core.migrations import run_migrations
+
+    run_migrations(engine)
+    # serve 가 이어서 워커를 fork 하는 경우 열린 SQLite 연결을 물려주지 않도록 정리
+    engine.dispose()
+    logger.info("🔧 [MIGRATE] 완료")
+    return 0
+
+
+def _available(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def _loop() -> str:
+    return "uvloop" if _available("uvloop") else "asyncio"
+
+
+def _http() -> str:
+    return "httptools" if _available("httptools") else "h11"
+
+
+def _serve_with_gunicorn(args) -> None:
+    """gunicorn + UvicornWorker (preload: 마스터에서 앱을 한 번 임포트한 뒤 fork 해 워커 시작이 빠름)"""
+    from gunicorn.app.base import BaseApplication
+    from uvicorn.workers import UvicornWorker
+
+    class _Worker(UvicornWorker):
+        # 기본 UvicornWorker 는 종료 시 SSE 같은 열린 연결을 무기한 기다리므로 대기 시간 제한
+        CONFIG_KWARGS = {
+            "loop": _loop(),
+            "http": _http(),
+            "timeout_graceful_shutdown": args.graceful_timeout,
+        }
+
+    class _Application(BaseApplication):
+        def load_config(self):
+            options = {
+                "bind": f"{args.host}:{args.port}",
+                "workers": args.workers,
+                "worker_class": _Worker,
+                "preload_app": True,
+                # 워커가 lifespan 종료(풀/DB 정리)를 마칠 시간을 더 줌
+                "graceful_timeout": args.graceful_timeout + 5,
+                "timeout": 0,  # SSE 같은 긴 연결 때문에 워커 응답 없음 감지는 사용하지 않음
+                "accesslog": "-" if args.access_log else None,
+            }
+            for key, value in options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            from main import app
+            return app
+
+    _Application().run()
+
+
+def _serve_with_uvicorn(args) -> None:
+    """uvicorn 멀티 프로세스 (워커마다 앱을 새로 임포트)"""
+    import uvicorn
+
+    uvicorn.run(
+        "main:app",
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        loop=_loop(),
+        http=_http(),
+        timeout_graceful_shutdown=args.graceful_timeout,
+        access_log=args.access_log,
+    )
+
+
+def _serve(args) -> int:
+    from decouple import config
+    from app.core.config import settings
+
+    # 여러 워커에서는 알림/캐시 무효화가 프로세스 사이에 전달되어야 하므로 기본 백엔드를 sqlite 로
+    # (preload 시 마스터에서 만든 이벤트 버스를 워커가 물려받으므로 앱 임포트 전에 설정)
+    if args.workers > 1 and config("EVENTS_BACKEND", default=None) is None:
+        os.environ["EVENTS_BACKEND"] = "sqlite"
+        settings.EVENTS_BACKEND = "sqlite"
+        logger.info("🚀 [SERVER] 워커 %d개: EVENTS_BACKEND=sqlite 사용", args.workers)
+
+    if not args.no_migrate:
+        _migrate(args)
+
+    use_gunicorn = not args.no_preload and sys.platform != "win32" and _available("gunicorn")
+    logger.info(
+        "🚀 [SERVER] %s:%d 에서 워커 %d개로 시작 (%s, loop=%s, http=%s)",
+        args.host, args.port, args.workers, "gunicorn preload" if use_gunicorn else "uvicorn",
+        _loop(), _http(),
+    )
+    if use_gunicorn:
+        _serve_with_gunicorn(args)
+    else:
+        _serve_with_uvicorn(args)
+    return 0
+
+
+def _import_users(args) -> int:
+    from app.core.database import engine
+    from app.core.migrations import run_migrations
+    from app.services.user_import import import_users
+
+    fmt = args.format
+    if fmt is None:
+        fmt = "ndjson" if args.file.endswith((".ndjson", ".jsonl")) else "csv"
+
+    run_migrations(engine)
+    with open(args.file, encoding="utf-8-sig", newline="") as f:
+        # imagePath 는 가져오기 파일이 있는 디렉토리 기준으로만 허용
+        result = import_users(
+            f, fmt, args.batch_size, args.workers,
+            image_base_dir=os.path.dirname(os.path.abspath(args.file))
+        )
+    if result["created"]:
+        asyncio.run(_notify_mentor_directory_changed())
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    return 1 if result["failed"] else 0
+
+
+async def _notify_mentor_directory_changed() -> None:
+    """실행 중인 서버의 멘토 목록 캐시 무효화 (EVENTS_BACKEND=sqlite 일 때만 전달, 아니면 TTL 후 반영)"""
+    from app.core.database import dispose_engines
+    from app.services.response_cache import mentor_directory_changed
+
+    try:
+        await mentor_directory_changed()
+    finally:
+        await dispose_engines()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    migrate_parser = commands.add_parser("migrate", help="테이블 생성 및 데이터 보정 (배포 시 서버 시작 전에 실행)")
+    migrate_parser.set_defaults(handler=_migrate)
+
+    from app.core.config import settings
+
+    serve_parser = commands.add_parser(
+        "serve", help="운영 서버 실행 (여러 워커, uvloop/httptools, graceful shutdown)",
+        description="gunicorn 이 설치되어 있으면 preload 로 앱을 한 번만 임포트한 뒤 워커를 fork 하고, "
+                    "없으면 uvicorn 멀티 프로세스로 실행한다.",
+    )
+    serve_parser.add_argument("--host", default=settings.SERVER_HOST)
+    serve_parser.add_argument("--port", type=int, default=settings.SERVER_PORT)
+    serve_parser.add_argument("--workers", type=int, default=settings.SERVER_WORKERS,
+                              help="워커 프로세스 수 (기본값: SERVER_WORKERS)")
+    serve_parser.add_argument("--graceful-timeout", type=int, default=settings.SERVER_GRACEFUL_TIMEOUT,
+                              help="종료 시 처리 중인 요청을 기다리는 최대 시간 (초)")
+    serve_parser.add_argument("--access-log", action="store_true", help="요청마다 접근 로그 출력")
+    serve_parser.add_argument("--no-migrate", action="store_true", help="시작 전에 migrate 를 실행하지 않음")
+    serve_parser.add_argument("--no-preload", action="store_true", help="gunicorn 이 있어도 uvicorn 으로 실행")
+    serve_parser.set_defaults(handler=_serve)
+
+    import_parser = commands.add_parser(
+        "import-users", help="CSV/NDJSON 파일로 사용자 대량 가져오기",
+        description="열/필드: email, password, name, role, bio, skills (CSV 는 ';' 구분), "
+                    "image (Base64) 또는 imagePath (파일 기준 상대 경로)",
+    )
+    import_parser.add_argument("file")
+    import_parser.add_argument("--format", choices=("csv", "ndjson"), help="기본값: 확장자로 판단")
+    import_parser.add_argument("--batch-size", type=int, help="트랜잭션당 행 수 (기본값: IMPORT_BATCH_SIZE)")
+    import_parser.add_argument("--workers", type=int, help="비밀번호 해싱 스레드 수 (기본값: IMPORT_HASH_WORKERS)")
+    import_parser.set_defaults(handler=_import_users)
+
+    args = parser.parse_args()
+    setup_logging()
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+import itertools
+import os
+import shutil
+import tempfile
+
+import pytest
+
+# 앱 임포트 전에 임시 DB/이미지 저장소와 테스트용 설정 지정
+_workdir = tempfile.mkdtemp(prefix="mentor-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_workdir, 'test.db')}"
+os.environ["IMAGE_DIR"] = os.path.join(_workdir, "images")
+os.environ["PASSWORD_SCRYPT_LOG_N"] = "10"
+os.environ["RATE_LIMIT_IP_PER_SECOND"] = "0"
+os.environ["RATE_LIMIT_USER_PER_SECOND"] = "0"
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.core.database import engine  # noqa: E402
+from app.core.migrations import run_migrations  # noqa: E402
+from main import app  # noqa: E402
+
+_emails = itertools.count(1)
+
+
+@pytest.fixture(scope="session")
+def client():
+    run_migrations(engine)
+    with TestClient(app) as test_client:
+        yield test_client
+    shutil.rmtree(_workdir, ignore_errors=True)
+
+
+@pytest.fixture
+def make_user(client):
+    """새 사용자를 가입시키고 (id, Authorization 헤더) 반환"""
+
+    def _make_user(role: str):
+        email = f"user{next(_emails)}@test.io"
+        response = client.post("/api/signup", json={
+            "email": email, "password": "password", "name": email.split("@")[0], "role": role,
+        })
+        assert response.status_code == 201, response.text
+        token = client.post("/api/login", json={"email": email, "password": "password"}).json()["token"]
+        headers = {"Authorization": f"Bearer {token}"}
+        user_id = client.get("/api/me", headers=headers).json()["id"]
+        return user_id, headers
+
+    return _make_user
+
+
+@pytest.fixture
+def update_profile(client):
+    """make_user 로 만든 사용자의 이름/소개(/스킬) 갱신"""
+
+    def _update_profile(user, name: str, bio: str = "", skills=None):
+        user_id, headers = user
+        body = {"id": user_id, "name": name, "bio": bio, "image": ""}
+        if skills is None:
+            body["role"] = "mentee"
+        else:
+            body.update(role="mentor", skills=list(skills))
+        response = client.put("/api/profile", headers=headers, json=body)
+        assert response.status_code == 200, response.text
+        return response.json()
+
+    return _update_profile
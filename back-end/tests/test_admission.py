@@ -0,0 +1,40 @@
+import asyncio
+
+import pytest
+
+from app.services import admission
+from app.services.admission import ConcurrencyLimit, Rejected
+
+
+def test_queued_request_times_out_with_503():
+    async def scenario():
+        limit = ConcurrencyLimit("test", 1, max_queue=4, max_queue_seconds=0.01, retry_after=1)
+        await limit.acquire()
+        with pytest.raises(Rejected) as rejected:
+            await limit.acquire()
+        assert (rejected.value.status_code, rejected.value.reason) == (503, "queue_timeout")
+        limit.release()
+        return limit.stats()
+
+    stats = asyncio.run(scenario())
+    assert (stats["active"], stats["queued"], stats["queue_timeout"]) == (0, 0, 1)
+
+
+def test_slot_handed_over_at_timeout_is_not_leaked(monkeypatch):
+    """슬롯을 넘겨받은 뒤 시간 초과가 나도 (Python 3.12+ wait_for) 요청을 허용하고 슬롯을 잃지 않음"""
+
+    async def scenario():
+        limit = ConcurrencyLimit("test", 1, max_queue=4, max_queue_seconds=1, retry_after=1)
+        await limit.acquire()
+
+        async def wait_for_racing_release(waiter, timeout):
+            limit.release()  # 앞선 요청이 끝나면서 대기자에게 슬롯을 넘김
+            raise asyncio.TimeoutError
+
+        monkeypatch.setattr(admission.asyncio, "wait_for", wait_for_racing_release)
+        await limit.acquire()
+        limit.release()
+        return limit.stats()
+
+    stats = asyncio.run(scenario())
+    assert (stats["active"], stats["queued"], stats["admitted"], stats["queue_timeout"]) == (0, 0, 2, 0)
@@ -0,0 +1,45 @@
+import hashlib
+
+from sqlalchemy import select, update
+
+from app.core.database import SessionLocal
+from app.models.user import User
+from app.routers import auth
+from app.utils.auth import DUMMY_PASSWORD_HASH
+
+
+def _stored_hash(user_id: int) -> str:
+    with SessionLocal() as db:
+        return db.scalar(select(User.password_hash).where(User.id == user_id))
+
+
+def test_legacy_sha256_hash_is_rehashed_on_login(client, make_user):
+    user_id, headers = make_user("mentee")
+    email = client.get("/api/me", headers=headers).json()["email"]
+    with SessionLocal() as db:
+        db.execute(update(User).where(User.id == user_id).values(
+            password_hash=hashlib.sha256(b"password").hexdigest()
+        ))
+        db.commit()
+
+    response = client.post("/api/login", json={"email": email, "password": "password"})
+    assert response.status_code == 200
+    assert _stored_hash(user_id).startswith("$scrypt$")
+
+    assert client.post("/api/login", json={"email": email, "password": "password"}).status_code == 200
+    assert client.post("/api/login", json={"email": email, "password": "wrong"}).status_code == 401
+
+
+def test_unknown_email_still_verifies_a_password(client, monkeypatch):
+    """없는 이메일도 더미 해시로 검증해 가입된 이메일과 응답 시간이 같음"""
+    verified = []
+
+    async def record_verify(password, password_hash):
+        verified.append(password_hash)
+        return False
+
+    monkeypatch.setattr(auth, "verify_password_async", record_verify)
+    response = client.post("/api/login", json={"email": "nobody@test.io", "password": "password"})
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Incorrect email or password"
+    assert verified == [DUMMY_PASSWORD_HASH]
@@ -0,0 +1,31 @@
+import asyncio
+import threading
+
+from app.services.bounded_pool import BoundedPool
+
+
+def test_cancelled_caller_keeps_slot_until_job_finishes():
+    """요청이 취소되어도 실행 중인 작업이 끝날 때까지 대기 슬롯을 반환하지 않음"""
+    pool = BoundedPool("test", "thread", workers=1, max_pending=1, retry_after=1)
+    started = threading.Event()
+    finish = threading.Event()
+
+    def job():
+        started.set()
+        finish.wait(5)
+
+    async def scenario():
+        task = asyncio.create_task(pool.run(job))
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        pending_after_cancel = pool.stats()["pending"]
+        finish.set()
+        return pending_after_cancel
+
+    try:
+        assert asyncio.run(scenario()) == 1
+    finally:
+        finish.set()
+        pool.shutdown()
+    assert pool.stats()["pending"] == 0
@@ -0,0 +1,29 @@
+from datetime import datetime
+
+from sqlalchemy import update
+
+from app.core.database import open_session
+from app.models.user import Event
+from app.services.events import EventBus, Notification
+
+
+def test_sqlite_backend_delivers_events_after_cleanup_removes_all_rows(client):
+    """보관 기간이 지나 이벤트가 모두 지워진 뒤 발행한 이벤트도 전달됨 (id 재사용 시 누락되던 문제)"""
+    bus = EventBus("sqlite", queue_size=10)
+    backend = bus.backend
+    received = []
+    bus.add_listener("test.ping", lambda notification: received.append(notification.data["n"]))
+
+    async def scenario():
+        backend._last_id = 0
+        await backend.publish([Notification("test.ping", [], {"n": 1})])
+        await backend._poll()
+        async with open_session() as db:
+            await db.execute(update(Event).values(created_at=datetime(2000, 1, 1)))
+            await db.commit()
+        await backend._cleanup()
+        await backend.publish([Notification("test.ping", [], {"n": 2})])
+        await backend._poll()
+
+    client.portal.call(scenario)
+    assert received == [1, 2]
@@ -0,0 +1,63 @@
+import uuid
+
+from app.core.middleware import _negotiate_encoding
+
+
+def test_negotiate_encoding_follows_q_values():
+    assert _negotiate_encoding("gzip, deflate, br") == "br"
+    assert _negotiate_encoding("br;q=0.5, gzip") == "gzip"
+    assert _negotiate_encoding("gzip;q=0, br;q=0") is None
+    assert _negotiate_encoding("identity") is None
+    assert _negotiate_encoding("*") == "br"
+    assert _negotiate_encoding("") is None
+
+
+def test_fields_project_mentor_list(client, make_user, update_profile):
+    skill = f"fields-{uuid.uuid4().hex[:8]}"
+    mentor = make_user("mentor")
+    update_profile(mentor, "Projected", bio="bio", skills=[skill])
+    _, headers = make_user("mentee")
+
+    response = client.get("/api/mentors", headers=headers, params={"skill": skill, "fields": "name,skills"})
+    assert response.status_code == 200
+    assert response.json() == [{"id": mentor[0], "profile": {"name": "Projected", "skills": [skill]}}]
+
+    response = client.get("/api/mentors", headers=headers, params={"fields": "name,password"})
+    assert response.status_code == 400
+    assert response.json()["detail"].startswith("Unknown field(s): password. Allowed: id, email, role")
+
+
+def test_fields_project_match_request_lists(client, make_user):
+    mentor_id, mentor_headers = make_user("mentor")
+    mentee_id, mentee_headers = make_user("mentee")
+    created = client.post("/api/match-requests", headers=mentee_headers, json={
+        "mentorId": mentor_id, "menteeId": mentee_id, "message": "hi",
+    }).json()
+
+    incoming = client.get("/api/match-requests/incoming", headers=mentor_headers, params={"fields": "status"})
+    assert incoming.json() == [{"id": created["id"], "status": "pending"}]
+    # 보낸 요청 목록에는 message 필드가 없음
+    outgoing = client.get("/api/match-requests/outgoing", headers=mentee_headers, params={"fields": "message"})
+    assert outgoing.status_code == 400
+    assert outgoing.json()["detail"] == "Unknown field(s): message. Allowed: id, mentorId, menteeId, status"
+
+
+def test_responses_are_compressed_by_negotiated_encoding(client, make_user, update_profile):
+    skill = f"gzip-{uuid.uuid4().hex[:8]}"
+    for index in range(8):
+        update_profile(make_user("mentor"), f"Mentor {index}", bio="long bio " * 40, skills=[skill])
+    _, headers = make_user("mentee")
+    params = {"skill": skill}
+
+    plain = client.get("/api/mentors", headers={**headers, "Accept-Encoding": "identity"}, params=params)
+    assert "content-encoding" not in plain.headers
+    for encoding in ("gzip", "br"):
+        response = client.get("/api/mentors", headers={**headers, "Accept-Encoding": encoding}, params=params)
+        assert response.headers["content-encoding"] == encoding
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert int(response.headers["content-length"]) < len(plain.content)
+        assert response.json() == plain.json()
+
+    # COMPRESSION_MIN_SIZE 보다 작은 응답은 그대로 전송
+    small = client.get("/api/me", headers={**headers, "Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
@@ -0,0 +1,70 @@
+import io
+import struct
+
+import pytest
+from PIL import Image
+
+from app.core.config import settings
+from app.services.image_processing import ImageHeader, ImageValidationError, probe_image_header
+
+
+def _image(fmt: str, width: int, height: int, **options) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), (30, 120, 200)).save(buffer, format=fmt, **options)
+    return buffer.getvalue()
+
+
+def test_probe_reads_png_ihdr_and_jpeg_sof():
+    assert probe_image_header(_image("PNG", 640, 520)) == ImageHeader("PNG", 640, 520)
+    # APP0/DQT/DHT 세그먼트를 건너뛰고 SOF2(progressive) 에서 크기를 읽음
+    progressive = _image("JPEG", 720, 610, progressive=True)
+    assert probe_image_header(progressive) == ImageHeader("JPEG", 720, 610)
+
+
+def test_probe_waits_for_more_data_and_rejects_other_formats():
+    png = _image("PNG", 600, 600)
+    assert probe_image_header(png[:4]) is None
+    assert probe_image_header(png[:20]) is None
+    assert probe_image_header(_image("JPEG", 600, 600)[:2]) is None
+    with pytest.raises(ImageValidationError):
+        probe_image_header(b"GIF89a" + bytes(32))
+    with pytest.raises(ImageValidationError):
+        probe_image_header(png[:12] + b"IDAT" + png[16:24])
+
+
+def test_raw_and_multipart_uploads_are_accepted(client, make_user):
+    _, headers = make_user("mentor")
+    response = client.put("/api/profile/image", content=_image("PNG", 600, 600),
+                          headers={**headers, "Content-Type": "image/png"})
+    assert response.status_code == 200, response.text
+    assert response.json()["profile"]["imageUrl"].endswith("/orig.png")
+
+    response = client.put("/api/profile/image", headers=headers,
+                          files={"image": ("me.jpg", _image("JPEG", 800, 600), "image/jpeg")})
+    assert response.status_code == 200, response.text
+    assert response.json()["profile"]["imageUrl"].endswith("/orig.jpg")
+
+
+def test_pixel_limits_are_checked_from_the_header(client, make_user):
+    _, headers = make_user("mentee")
+    raw = {**headers, "Content-Type": "image/png"}
+    small = client.put("/api/profile/image", content=_image("PNG", 300, 300), headers=raw)
+    assert small.status_code == 400
+    assert small.json()["detail"] == "Image size must be between 500x500 and 1000x1000 pixels"
+
+    # 헤더만 보고 거부하므로 나머지 본문(픽셀 데이터)은 디코딩하지 않음
+    huge_header = b"\x89PNG\r\n\x1a\n" + struct.pack(">I", 13) + b"IHDR" + struct.pack(">II", 20000, 20000)
+    response = client.put("/api/profile/image", content=huge_header + bytes(1000), headers=raw)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Image size must be between 500x500 and 1000x1000 pixels"
+
+
+def test_oversized_upload_is_413(client, make_user, monkeypatch):
+    _, headers = make_user("mentee")
+    monkeypatch.setattr(settings, "IMAGE_MAX_UPLOAD_BYTES", 1024)
+    image = _image("PNG", 600, 600)
+    assert len(image) > 1024
+    response = client.put("/api/profile/image", content=image, headers={**headers, "Content-Type": "image/png"})
+    assert response.status_code == 413
+    response = client.put("/api/profile/image", headers=headers, files={"image": ("me.png", image, "image/png")})
+    assert response.status_code == 413
@@ -0,0 +1,35 @@
+import io
+
+from PIL import Image
+from sqlalchemy import update
+
+from app.core.database import SessionLocal, engine
+from app.core.migrations import run_migrations
+from app.models.user import User
+from app.services.image_store import save_image
+
+
+def _jpeg(size: int = 500) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (size, size), (200, 80, 40)).save(buffer, format="JPEG")
+    return buffer.getvalue()
+
+
+def test_missing_rendition_is_404_until_migrate_renders_it(client, make_user):
+    """썸네일이 없는 기존 이미지는 요청 중에 생성하지 않고 migrate 에서 생성"""
+    user_id, _ = make_user("mentor")
+    stored = save_image(_jpeg(), "JPEG")
+    with SessionLocal() as db:
+        db.execute(update(User).where(User.id == user_id).values(
+            image_hash=stored.hash, image_mime=stored.mime, image_size=stored.size
+        ))
+        db.commit()
+
+    assert client.get(f"/api/images/v/{stored.hash}/orig.jpg").status_code == 200
+    assert client.get(f"/api/images/v/{stored.hash}/128.webp").status_code == 404
+
+    run_migrations(engine)
+    response = client.get(f"/api/images/v/{stored.hash}/128.webp")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/webp"
+    assert client.get(f"/api/images/v/{stored.hash}/64.jpg").status_code == 200
@@ -0,0 +1,136 @@
+def _send(client, mentee, mentor_id, message="hello"):
+    mentee_id, headers = mentee
+    return client.post("/api/match-requests", headers=headers, json={
+        "mentorId": mentor_id, "menteeId": mentee_id, "message": message,
+    })
+
+
+def _statuses(client, mentor_headers):
+    requests = client.get("/api/match-requests/incoming", headers=mentor_headers).json()
+    return {request["id"]: request["status"] for request in requests}
+
+
+def test_duplicate_request_to_same_mentor(client, make_user):
+    mentor_id, _ = make_user("mentor")
+    mentee = make_user("mentee")
+    assert _send(client, mentee, mentor_id).status_code == 200
+
+    response = _send(client, mentee, mentor_id)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Already have an active request to this mentor"
+
+
+def test_second_pending_request_for_mentee(client, make_user):
+    first_mentor_id, _ = make_user("mentor")
+    second_mentor_id, _ = make_user("mentor")
+    mentee = make_user("mentee")
+    assert _send(client, mentee, first_mentor_id).status_code == 200
+
+    response = _send(client, mentee, second_mentor_id)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Cannot send multiple requests simultaneously"
+
+
+def test_second_accept_for_mentor(client, make_user):
+    mentor_id, mentor_headers = make_user("mentor")
+    first = _send(client, make_user("mentee"), mentor_id).json()
+    second = _send(client, make_user("mentee"), mentor_id).json()
+    assert client.put(f"/api/match-requests/{first['id']}/accept", headers=mentor_headers).status_code == 200
+
+    response = client.put(f"/api/match-requests/{second['id']}/accept", headers=mentor_headers)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Already have an accepted mentee"
+    assert _statuses(client, mentor_headers) == {first["id"]: "accepted", second["id"]: "pending"}
+
+
+def test_accept_is_only_allowed_from_pending(client, make_user):
+    mentor_id, mentor_headers = make_user("mentor")
+    mentee = make_user("mentee")
+    accepted = _send(client, mentee, mentor_id).json()
+    assert client.put(f"/api/match-requests/{accepted['id']}/accept", headers=mentor_headers).status_code == 200
+
+    # 이미 수락한 요청을 다시 수락
+    response = client.put(f"/api/match-requests/{accepted['id']}/accept", headers=mentor_headers)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Already have an accepted mentee"
+
+    # 거절한 요청 수락
+    other_mentor_id, other_mentor_headers = make_user("mentor")
+    rejected = _send(client, make_user("mentee"), other_mentor_id).json()
+    response = client.put(f"/api/match-requests/{rejected['id']}/reject", headers=other_mentor_headers)
+    assert response.status_code == 200
+    response = client.put(f"/api/match-requests/{rejected['id']}/accept", headers=other_mentor_headers)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Match request is already rejected"
+
+    assert client.put("/api/match-requests/999999/accept", headers=mentor_headers).status_code == 404
+
+
+def test_cancel_is_not_allowed_after_reject(client, make_user):
+    mentor_id, mentor_headers = make_user("mentor")
+    mentee = make_user("mentee")
+    request = _send(client, mentee, mentor_id).json()
+    assert client.put(f"/api/match-requests/{request['id']}/reject", headers=mentor_headers).status_code == 200
+
+    response = client.delete(f"/api/match-requests/{request['id']}", headers=mentee[1])
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Match request is already rejected"
+
+
+def test_accept_with_reject_others_only_touches_pending(client, make_user):
+    mentor_id, mentor_headers = make_user("mentor")
+    first_mentee, second_mentee, third_mentee = make_user("mentee"), make_user("mentee"), make_user("mentee")
+    cancelled = _send(client, first_mentee, mentor_id).json()
+    assert client.delete(f"/api/match-requests/{cancelled['id']}", headers=first_mentee[1]).status_code == 200
+    accepted = _send(client, second_mentee, mentor_id).json()
+    pending = _send(client, third_mentee, mentor_id).json()
+
+    response = client.put(
+        f"/api/match-requests/{accepted['id']}/accept", headers=mentor_headers, params={"rejectOthers": "true"}
+    )
+    assert response.status_code == 200
+    assert response.json()["status"] == "accepted"
+    assert _statuses(client, mentor_headers) == {
+        cancelled["id"]: "cancelled",
+        accepted["id"]: "accepted",
+        pending["id"]: "rejected",
+    }
+
+
+def test_bulk_reject_only_touches_pending(client, make_user):
+    mentor_id, mentor_headers = make_user("mentor")
+    first_mentee, second_mentee, third_mentee = make_user("mentee"), make_user("mentee"), make_user("mentee")
+    cancelled = _send(client, first_mentee, mentor_id).json()
+    assert client.delete(f"/api/match-requests/{cancelled['id']}", headers=first_mentee[1]).status_code == 200
+    accepted = _send(client, second_mentee, mentor_id).json()
+    assert client.put(f"/api/match-requests/{accepted['id']}/accept", headers=mentor_headers).status_code == 200
+    pending = _send(client, third_mentee, mentor_id).json()
+
+    response = client.put("/api/match-requests/reject", headers=mentor_headers, json={
+        "ids": [accepted["id"], pending["id"], cancelled["id"], 999999],
+    })
+    assert response.status_code == 200
+    body = response.json()
+    assert [request["id"] for request in body["updated"]] == [pending["id"]]
+    assert body["notPending"] == [accepted["id"], cancelled["id"]]
+    assert body["notFound"] == [999999]
+    assert _statuses(client, mentor_headers) == {
+        cancelled["id"]: "cancelled",
+        accepted["id"]: "accepted",
+        pending["id"]: "rejected",
+    }
+
+
+def test_embedded_lists_omit_missing_fields(client, make_user):
+    """목록은 행에서 직접 직렬화되므로 값이 없는 필드(이미지 없는 상대방의 thumbnailUrl 등)는 null 대신 생략"""
+    mentor_id, mentor_headers = make_user("mentor")
+    mentee = make_user("mentee")
+    assert _send(client, mentee, mentor_id).status_code == 200
+
+    incoming = client.get("/api/match-requests/incoming?embed=true", headers=mentor_headers).json()
+    outgoing = client.get("/api/match-requests/outgoing?embed=true", headers=mentee[1]).json()
+    assert "thumbnailUrl" not in incoming[0]["mentee"]
+    assert outgoing[0]["mentor"]["skills"] == []
+    for item in incoming + outgoing:
+        summary = item.get("mentee") or item.get("mentor")
+        assert None not in item.values() and None not in summary.values()
@@ -0,0 +1,42 @@
+import uuid
+
+from sqlalchemy import delete
+
+from app.core.database import SessionLocal
+from app.models.user import MentorSkill, User
+from app.services.mentor_search import build_match_expression
+from app.services.response_cache import mentor_directory_cache
+
+
+def test_match_expression_quotes_terms_as_prefixes():
+    assert build_match_expression('Vue OR "js" -NEAR(x)') == '"vue"* "or"* "js"* "near"* "x"*'
+    assert build_match_expression("  ?! ") == ""
+
+
+def test_search_index_follows_profile_updates_and_deletes(client, make_user, update_profile):
+    tag = f"tag{uuid.uuid4().hex[:8]}"
+    mentor = make_user("mentor")
+    update_profile(mentor, "Search Mentor", bio=f"{tag} kubernetes operator", skills=["Go"])
+    _, headers = make_user("mentee")
+
+    def search(q):
+        response = client.get("/api/mentors", headers=headers, params={"q": f"{tag} {q}"})
+        assert response.status_code == 200, response.text
+        return [item["id"] for item in response.json()]
+
+    # 단어 앞부분만으로 이름/소개/스킬 검색
+    assert search("kuber") == [mentor[0]]
+    assert search("sea men") == [mentor[0]]
+    assert search("go") == [mentor[0]]
+
+    update_profile(mentor, "Search Mentor", bio=f"{tag} terraform modules", skills=["Rust"])
+    assert search("kuber") == []
+    assert search("terra") == [mentor[0]]
+    assert search("rust") == [mentor[0]]
+
+    with SessionLocal() as db:
+        db.execute(delete(MentorSkill).where(MentorSkill.mentor_id == mentor[0]))
+        db.execute(delete(User).where(User.id == mentor[0]))
+        db.commit()
+    mentor_directory_cache.invalidate()
+    assert search("terra") == []
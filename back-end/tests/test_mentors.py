@@ -0,0 +1,53 @@
+import uuid
+
+from app.utils.pagination import NEXT_CURSOR_HEADER, encode_cursor
+
+
+def _pages(client, headers, params, limit=2):
+    """커서를 따라가며 모든 페이지의 멘토 id 수집"""
+    ids, cursor = [], None
+    while True:
+        query = dict(params, limit=limit)
+        if cursor:
+            query["cursor"] = cursor
+        response = client.get("/api/mentors", headers=headers, params=query)
+        assert response.status_code == 200, response.text
+        ids.extend(item["id"] for item in response.json())
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if cursor is None:
+            return ids
+
+
+def _mentors_with_tied_names(make_user, update_profile):
+    """같은 이름이 섞인 멘토들 (다른 테스트의 멘토와 섞이지 않도록 고유 스킬 부여)"""
+    skill = f"keyset-{uuid.uuid4().hex[:8]}"
+    mentors = {}
+    for name in ("bora", "ari", "bora", "ari", "cho"):
+        mentor = make_user("mentor")
+        update_profile(mentor, name, skills=[skill])
+        mentors[mentor[0]] = name
+    return skill, mentors
+
+
+def test_keyset_pages_cover_every_sort_mode_without_gaps(client, make_user, update_profile):
+    skill, mentors = _mentors_with_tied_names(make_user, update_profile)
+    _, headers = make_user("mentee")
+    by_id = sorted(mentors)
+    by_name = sorted(mentors, key=lambda mentor_id: (mentors[mentor_id], mentor_id))
+
+    assert _pages(client, headers, {"skill": skill}) == by_id
+    assert _pages(client, headers, {"skill": skill, "orderBy": "name"}) == by_name
+    # 대표 스킬이 모두 같으면 이름, id 순
+    assert _pages(client, headers, {"skill": skill, "orderBy": "skill"}, limit=1) == by_name
+
+    streamed = client.get("/api/mentors", headers=headers, params={"skill": skill, "stream": "true"})
+    assert streamed.headers["content-type"].startswith("application/x-ndjson")
+    assert len(streamed.text.splitlines()) == len(mentors)
+
+
+def test_invalid_cursor_is_rejected(client, make_user):
+    _, headers = make_user("mentee")
+    for cursor in ("not-a-cursor", encode_cursor(["ari"]), encode_cursor(["ari", 1, 2])):
+        response = client.get("/api/mentors", headers=headers, params={"orderBy": "name", "cursor": cursor})
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid cursor"
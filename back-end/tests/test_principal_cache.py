@@ -0,0 +1,61 @@
+import time
+from datetime import timedelta
+
+from app.models.user import UserRole
+from app.services import principal_cache as principal_cache_module
+from app.services.principal_cache import Principal, PrincipalCache, principal_cache
+from app.utils.auth import create_access_token, verify_token
+
+_PRINCIPAL = Principal(id=1, email="cache@test.io", name="cache", role=UserRole.MENTEE)
+
+
+def _token(expires_in: timedelta):
+    token = create_access_token({"user_id": _PRINCIPAL.id, "email": _PRINCIPAL.email,
+                                 "name": _PRINCIPAL.name, "role": "mentee"}, expires_delta=expires_in)
+    return token, verify_token(token)
+
+
+def _advance_clock(monkeypatch, seconds: float):
+    now = time.time() + seconds
+    monkeypatch.setattr(principal_cache_module.time, "time", lambda: now)
+
+
+def test_entry_expires_at_token_exp_when_it_is_before_ttl(monkeypatch):
+    cache = PrincipalCache(max_size=10, ttl_seconds=300)
+    token, payload = _token(timedelta(seconds=60))
+    cache.store(token, payload, _PRINCIPAL)
+    assert cache.lookup(token) == _PRINCIPAL
+
+    _advance_clock(monkeypatch, 61)
+    assert cache.lookup(token) is None
+    assert cache.stats()["size"] == 0
+
+
+def test_entry_expires_after_ttl_when_token_lives_longer(monkeypatch):
+    cache = PrincipalCache(max_size=10, ttl_seconds=30)
+    token, payload = _token(timedelta(hours=1))
+    cache.store(token, payload, _PRINCIPAL)
+
+    _advance_clock(monkeypatch, 29)
+    assert cache.lookup(token) == _PRINCIPAL
+    _advance_clock(monkeypatch, 31)
+    assert cache.lookup(token) is None
+
+
+def test_other_token_with_same_jti_is_not_a_hit():
+    cache = PrincipalCache(max_size=10, ttl_seconds=300)
+    token, payload = _token(timedelta(minutes=5))
+    cache.store(token, payload, _PRINCIPAL)
+    assert cache.lookup(token[:-2] + ("AA" if not token.endswith("AA") else "BB")) is None
+
+
+def test_profile_update_invalidates_cached_principal(client, make_user, update_profile):
+    user = make_user("mentee")
+    token = user[1]["Authorization"].split(" ", 1)[1]
+    assert principal_cache.lookup(token) is not None  # make_user 의 /api/me 호출로 캐시됨
+
+    update_profile(user, "renamed")
+    assert principal_cache.lookup(token) is None
+
+    assert client.get("/api/me", headers=user[1]).status_code == 200
+    assert principal_cache.lookup(token).name == "renamed"
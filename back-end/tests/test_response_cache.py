@@ -0,0 +1,66 @@
+import asyncio
+import uuid
+
+from app.services.response_cache import CachedResponse, ResponseCache
+
+
+def _cache() -> ResponseCache:
+    return ResponseCache("test", max_entries=10, max_bytes=1024, ttl_seconds=60)
+
+
+def test_concurrent_misses_compute_once():
+    cache = _cache()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return CachedResponse(b"[]", {})
+
+    async def scenario():
+        return await asyncio.gather(*(cache.get_or_compute("key", compute) for _ in range(5)))
+
+    responses = asyncio.run(scenario())
+    assert len(calls) == 1
+    assert all(response.body == b"[]" for response in responses)
+    assert (cache.stats()["misses"], cache.stats()["coalesced"]) == (1, 4)
+
+
+def test_invalidate_bumps_generation_and_discards_inflight_result():
+    cache = _cache()
+    bodies = iter([b"old", b"new", b"newer"])
+
+    async def compute_and_invalidate():
+        body = next(bodies)
+        cache.invalidate()  # 계산 도중 데이터가 바뀐 경우
+        return CachedResponse(body, {})
+
+    async def compute():
+        return CachedResponse(next(bodies), {})
+
+    async def scenario():
+        first = await cache.get_or_compute("key", compute_and_invalidate)
+        second = await cache.get_or_compute("key", compute)
+        third = await cache.get_or_compute("key", compute)
+        cache.invalidate()
+        fourth = await cache.get_or_compute("key", compute)
+        return [response.body for response in (first, second, third, fourth)]
+
+    # 이전 세대에 저장된 "old" 는 다시 쓰이지 않고, 무효화 후에는 다시 계산
+    assert asyncio.run(scenario()) == [b"old", b"new", b"new", b"newer"]
+
+
+def test_profile_update_invalidates_cached_mentor_list(client, make_user, update_profile):
+    skill = f"cache-{uuid.uuid4().hex[:8]}"
+    mentor = make_user("mentor")
+    update_profile(mentor, "before", skills=[skill])
+    _, headers = make_user("mentee")
+
+    def names():
+        response = client.get("/api/mentors", headers=headers, params={"skill": skill})
+        return [item["profile"]["name"] for item in response.json()]
+
+    assert names() == ["before"]
+    assert names() == ["before"]  # 캐시 적중
+    update_profile(mentor, "after", skills=[skill])
+    assert names() == ["after"]
@@ -1,4 +1,4 @@
-import { apiClient } from './api'
+import { apiClient, API_BASE_URL } from './api'
 import type { 
   MentorListItem,
   MentorQueryParams,
@@ -44,4 +44,20 @@ export class MatchRequestService {
   static async cancelRequest(requestId: number): Promise<MatchRequest> {
     return await apiClient.delete<MatchRequest>(`/match-requests/${requestId}`)
   }
+
+  // 매칭 요청 상태 변경 알림 구독 (SSE, EventSource 는 헤더를 보낼 수 없어 토큰을 쿼리로 전달)
+  static subscribe(onChange: (type: string) => void): EventSource | null {
+    const token = localStorage.getItem('token')
+    if (!token) return null
+    const source = new EventSource(`${API_BASE_URL}/events?token=${encodeURIComponent(token)}`)
+    const types = [
+      'match_request.created',
+      'match_request.accepted',
+      'match_request.rejected',
+      'match_request.cancelled',
+      'resync'
+    ]
+    types.forEach((type) => source.addEventListener(type, () => onChange(type)))
+    return source
+  }
 }